@@ -0,0 +1,166 @@
+"""
+Module chứa các thuật toán tìm kiếm hai chiều (gặp nhau ở giữa)
+
+Một phía tìm từ trạng thái đầu, phía kia tìm ngược từ trạng thái đích (nước đi
+của puzzle có thể đảo ngược nên dùng chung bảng nước đi). Chính sách cân bằng
+quyết định phía nào được mở rộng tiếp:
+
+    'alternate'  lần lượt từng phía
+    'smaller'    phía có frontier nhỏ hơn (tiêu chí cardinality của Pohl)
+"""
+from models.puzzle_state import PuzzleState, common_board
+from algorithms.frontier import BucketFrontier
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic, require_consistent
+
+BALANCE_POLICIES = ('alternate', 'smaller')
+
+FORWARD = 0
+BACKWARD = 1
+
+
+def _check_balance(balance):
+    if balance not in BALANCE_POLICIES:
+        raise ValueError('Unknown balance %r, expected one of %s' % (balance, ', '.join(BALANCE_POLICIES)))
+
+
+def _choose_side(balance, turn, sizes):
+    if balance == 'alternate':
+        return turn % 2
+    return FORWARD if sizes[FORWARD] <= sizes[BACKWARD] else BACKWARD
+
+
+def _join(board, meet, forward_parents, backward_parents):
+    """Boards from the start through meet to the goal"""
+    codes = []
+    code = meet
+    while code is not None:
+        codes.append(code)
+        code = forward_parents[code]
+    codes.reverse()
+    code = backward_parents[meet]
+    while code is not None:
+        codes.append(code)
+        code = backward_parents[code]
+    return [board.decode(code) for code in codes]
+
+
+def bidirectional_bfs_solve(initial_state, goal_state, balance='smaller'):
+    """Bidirectional Breadth-First Search
+
+    One whole layer is expanded per step; the cheapest meeting found in that
+    layer is a shortest path.
+    """
+    _check_balance(balance)
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    transitions, slide = board.transitions, board.slide
+    # parents[side][code] -> mã trước đó trên phía side, depths[side][code] -> độ sâu
+    parents = ({initial.code: None}, {goal.code: None})
+    depths = ({initial.code: 0}, {goal.code: 0})
+    layers = ([(initial.code, initial.blank)], [(goal.code, goal.blank)])
+    turn = 0
+
+    while layers[FORWARD] and layers[BACKWARD]:
+        side = _choose_side(balance, turn, (len(layers[FORWARD]), len(layers[BACKWARD])))
+        turn += 1
+        own_parents, own_depths = parents[side], depths[side]
+        other_depths = depths[1 - side]
+        best = None
+        meet = None
+        next_layer = []
+
+        for code, blank in layers[side]:
+            new_depth = own_depths[code] + 1
+            for _, new_blank in transitions[blank]:
+                next_code = slide(code, blank, new_blank)
+                if next_code in own_parents:
+                    continue
+                own_parents[next_code] = code
+                own_depths[next_code] = new_depth
+                next_layer.append((next_code, new_blank))
+                other = other_depths.get(next_code)
+                if other is not None and (best is None or new_depth + other < best):
+                    best = new_depth + other
+                    meet = next_code
+
+        if meet is not None:
+            return _join(board, meet, parents[FORWARD], parents[BACKWARD])
+        layers = (next_layer, layers[BACKWARD]) if side == FORWARD else (layers[FORWARD], next_layer)
+
+    return None
+
+
+def bidirectional_a_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, balance='smaller'):
+    """Front-to-end Bidirectional A* Search
+
+    Each side is an A* search guided by the heuristic towards the opposite
+    end. The search stops once the best meeting cost is no larger than the
+    lowest f on either side, which is optimal for consistent heuristics (every
+    registered one except additive_pdb); others raise ValueError.
+    """
+    _check_balance(balance)
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    transitions, slide = board.transitions, board.slide
+    # Phía thuận ước lượng tới đích, phía ngược ước lượng về trạng thái đầu
+    estimators = tuple(
+        require_consistent(get_heuristic(heuristic, code, board), 'Bidirectional A*')
+        for code in (goal.code, initial.code)
+    )
+    parents = ({initial.code: None}, {goal.code: None})
+    costs = ({initial.code: 0}, {goal.code: 0})
+    frontiers = (BucketFrontier(tie_break='high_g'), BucketFrontier(tie_break='high_g'))
+    for side, start in ((FORWARD, initial), (BACKWARD, goal)):
+        start_h = estimators[side](start.code)
+        frontiers[side].push(start.code, (start.blank, start_h), start_h, 0)
+    # Giá trị f nhỏ nhất vừa lấy ra ở mỗi phía; không giảm với heuristic nhất quán
+    lowest_f = [0, 0]
+    best = None
+    meet = None
+    turn = 0
+
+    while frontiers[FORWARD] and frontiers[BACKWARD]:
+        side = _choose_side(balance, turn, (len(frontiers[FORWARD]), len(frontiers[BACKWARD])))
+        turn += 1
+        code, (blank, parent_h), f = frontiers[side].pop()
+        lowest_f[side] = f
+        if best is not None and best <= max(lowest_f):
+            break
+
+        h = estimators[side]
+        own_parents, own_costs = parents[side], costs[side]
+        other_costs = costs[1 - side]
+        new_cost = own_costs[code] + 1
+
+        for _, new_blank in transitions[blank]:
+            next_code = slide(code, blank, new_blank)
+            known = own_costs.get(next_code)
+            if known is not None and known <= new_cost:
+                continue
+            own_costs[next_code] = new_cost
+            own_parents[next_code] = code
+            child_h = h.after_slide(parent_h, code, blank, new_blank, next_code)
+            frontiers[side].push(next_code, (new_blank, child_h), new_cost + child_h, new_cost)
+
+            other = other_costs.get(next_code)
+            if other is not None and (best is None or new_cost + other < best):
+                best = new_cost + other
+                meet = next_code
+
+    if meet is None:
+        return None
+    return _join(board, meet, parents[FORWARD], parents[BACKWARD])
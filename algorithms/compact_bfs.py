@@ -0,0 +1,74 @@
+"""
+Module chứa BFS trên không gian trạng thái đã xếp hạng với bộ nhớ cố định
+
+Không giữ node hay con trỏ cha: mỗi hạng chỉ tốn 1 bit "đã thăm" và 2 bit
+"nước đi đã dẫn tới trạng thái này". Lời giải được dựng lại ngược từ đích bằng
+cách hoàn tác từng nước đi đã lưu.
+"""
+from array import array
+from models.bitset import Bitset
+from models.move_table import MoveTable
+from models.puzzle_state import BLANK_STEP, TRANSITIONS, find_blank, slide
+from models.ranking import STATE_COUNT, parity, rank
+
+
+def bfs_layers(start_code, visited, predecessors):
+    """Yield (depth, codes, blanks, ranks) for every BFS layer from start_code
+
+    Each newly reached state is marked in visited and the move that reached it
+    is stored in predecessors, both indexed by rank.
+    """
+    start_index = rank(start_code)
+    visited.add(start_index)
+    codes = array('Q', [start_code])
+    blanks = array('B', [find_blank(start_code)])
+    ranks = array('I', [start_index])
+    depth = 0
+
+    while codes:
+        yield depth, codes, blanks, ranks
+        next_codes = array('Q')
+        next_blanks = array('B')
+        next_ranks = array('I')
+
+        for code, blank in zip(codes, blanks):
+            for move, new_blank in TRANSITIONS[blank]:
+                next_code = slide(code, blank, new_blank)
+                index = rank(next_code)
+                if not visited.test_and_set(index):
+                    predecessors[index] = move
+                    next_codes.append(next_code)
+                    next_blanks.append(new_blank)
+                    next_ranks.append(index)
+
+        codes, blanks, ranks = next_codes, next_blanks, next_ranks
+        depth += 1
+
+
+def trace_back(code, start_code, predecessors):
+    """Codes from start_code to code, rebuilt by undoing the stored moves"""
+    path = [code]
+    blank = find_blank(code)
+    while code != start_code:
+        move = predecessors[rank(code)]
+        previous_blank = blank - BLANK_STEP[move]
+        code = slide(code, blank, previous_blank)
+        blank = previous_blank
+        path.append(code)
+    return path[::-1]
+
+
+def compact_bfs(start_code, goal_code):
+    """Shortest path as a list of codes, or None if goal_code is unreachable"""
+    if parity(start_code) != parity(goal_code):
+        return None
+
+    visited = Bitset(STATE_COUNT)
+    predecessors = MoveTable(STATE_COUNT)
+    goal_index = rank(goal_code)
+
+    for _ in bfs_layers(start_code, visited, predecessors):
+        if goal_index in visited:
+            return trace_back(goal_code, start_code, predecessors)
+
+    return None
@@ -3,16 +3,19 @@ Module chứa các thuật toán tìm kiếm trong môi trường phức tạp
 """
 import time
 import logging
-from models.puzzle_state import PuzzleState
+from models.puzzle_state import DEFAULT_BOARD, PuzzleState, board_of, common_board
+from models.ranking import state_set
+from algorithms.frontier import HeapFrontier
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def get_valid_moves(state):
     """Get all valid moves for a state"""
     moves = []
+    rows, cols = len(state), len(state[0])
     empty_pos = None
-    for i in range(3):
-        for j in range(3):
+    for i in range(rows):
+        for j in range(cols):
             if state[i][j] == 0:
                 empty_pos = (i, j)
                 break
@@ -25,16 +28,17 @@ def get_valid_moves(state):
     # Check all possible moves
     for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # up, down, left, right
         new_x, new_y = empty_pos[0] + dx, empty_pos[1] + dy
-        if 0 <= new_x < 3 and 0 <= new_y < 3:
+        if 0 <= new_x < rows and 0 <= new_y < cols:
             moves.append((new_x, new_y))
     return moves
 
 def apply_move(state, move_pos):
     """Apply a move to a state and return new state"""
     new_state = [row[:] for row in state]
+    rows, cols = len(state), len(state[0])
     empty_pos = None
-    for i in range(3):
-        for j in range(3):
+    for i in range(rows):
+        for j in range(cols):
             if new_state[i][j] == 0:
                 empty_pos = (i, j)
                 break
@@ -47,7 +51,7 @@ def apply_move(state, move_pos):
     new_x, new_y = move_pos
     old_x, old_y = empty_pos
     
-    if not (0 <= new_x < 3 and 0 <= new_y < 3):
+    if not (0 <= new_x < rows and 0 <= new_y < cols):
         return None
         
     new_state[old_x][old_y], new_state[new_x][new_y] = new_state[new_x][new_y], new_state[old_x][old_y]
@@ -109,8 +113,8 @@ def and_or_search(initial_state, goal_state):
         
         # Find empty position
         empty_pos = None
-        for i in range(3):
-            for j in range(3):
+        for i in range(len(state)):
+            for j in range(len(state[0])):
                 if state[i][j] == 0:
                     empty_pos = (i, j)
                     break
@@ -168,15 +172,15 @@ def and_or_search(initial_state, goal_state):
 
 def get_observation(state, observable_positions):
     """Get observation from state with observable positions"""
-    observation = [[None for _ in range(3)] for _ in range(3)]
+    observation = [[None for _ in row] for row in state]
     for i, j in observable_positions:
         observation[i][j] = state[i][j]
     return observation
 
 def is_observation_match(state, observation):
     """Check if a state matches an observation"""
-    for i in range(3):
-        for j in range(3):
+    for i in range(len(observation)):
+        for j in range(len(observation[0])):
             if observation[i][j] is not None and observation[i][j] != state[i][j]:
                 return False
     return True
@@ -186,9 +190,13 @@ def update_belief_with_observation(belief_state, observation):
     return [state for state in belief_state if is_observation_match(state, observation)]
 
 def partial_obs_solve(initial_state, goal_state):
-    from utils.validators import is_solvable
+    from utils.validators import solvable_batch
     import itertools
 
+    # Belief state ban đầu liệt kê mọi hoán vị 0-8, chỉ khả thi với bàn 3x3
+    if board_of(goal_state) is not DEFAULT_BOARD:
+        raise ValueError('Partial observation search only supports the 3x3 board')
+
     # Set a fixed initial state for partial observation
     initial_state = [
         [1, 2, 3],
@@ -217,11 +225,11 @@ def partial_obs_solve(initial_state, goal_state):
     if not possible_states:
         return None
 
-    # Lọc lại chỉ giữ các trạng thái solvable nếu goal_state cũng solvable
-    if is_solvable(goal_state):
-        possible_states = [s for s in possible_states if is_solvable(s)]
-        if not possible_states:
-            return None
+    # Chỉ giữ các trạng thái tới được goal_state
+    solvable = solvable_batch(possible_states, goal_state)
+    possible_states = [s for s, ok in zip(possible_states, solvable) if ok]
+    if not possible_states:
+        return None
 
     initial_belief_state = possible_states
     
@@ -307,33 +315,34 @@ def non_observe(initial_state, goal_state):
     """Non-Observable Search"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
     def heuristic(state):
         count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
+        for i in range(board.rows):
+            for j in range(board.cols):
+                if state[i][j] != goal_state[i][j]:
                     count += 1
         return count
         
-    queue = [(heuristic(initial.state), initial)]
-    visited = {initial}
+    frontier = HeapFrontier()
+    frontier.push(initial.code, initial, heuristic(initial.state))
+    visited = state_set(board, [initial.code])
     
-    while queue:
-        _, current = queue.pop(0)
+    while frontier:
+        _, current, _ = frontier.pop()
         
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
             
         for move in current.get_valid_moves():
             next_state = current.make_move(move)
             
-            if next_state not in visited:
-                visited.add(next_state)
-                queue.append((heuristic(next_state.state), next_state))
-                queue.sort(key=lambda x: x[0])
+            if next_state.code not in visited:
+                visited.add(next_state.code)
+                frontier.push(next_state.code, next_state, heuristic(next_state.state))
                 
     return None
@@ -1,14 +1,16 @@
 """
 Module chứa các thuật toán tìm kiếm ràng buộc
 """
-from models.puzzle_state import PuzzleState
+from models.puzzle_state import PuzzleState, common_board
+from models.ranking import state_set
 
 def backtracking_solve_with_constraints(initial_state, goal_state):
     """Backtracking with Constraints"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
     def is_valid(state):
@@ -18,16 +20,16 @@ def backtracking_solve_with_constraints(initial_state, goal_state):
                 if num in numbers:
                     return False
                 numbers.add(num)
-        return len(numbers) == 9
+        return len(numbers) == board.cells
         
     def backtrack(current, visited):
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
             
-        if current in visited:
+        if current.code in visited:
             return None
             
-        visited.add(current)
+        visited.add(current.code)
         
         for move in current.get_valid_moves():
             next_state = current.make_move(move)
@@ -39,14 +41,15 @@ def backtracking_solve_with_constraints(initial_state, goal_state):
                     
         return None
         
-    return backtrack(initial, set())
+    return backtrack(initial, state_set(board))
 
 def forward_checking(initial_state, goal_state):
     """Forward Checking"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
     def get_domain(state):
@@ -55,7 +58,7 @@ def forward_checking(initial_state, goal_state):
             for num in row:
                 if num != 0:
                     used.add(num)
-        return set(range(9)) - used
+        return set(range(board.cells)) - used
         
     def forward_check(current, move):
         next_state = current.make_move(move)
@@ -67,13 +70,13 @@ def forward_checking(initial_state, goal_state):
         return next_state
         
     def search(current, visited):
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
             
-        if current in visited:
+        if current.code in visited:
             return None
             
-        visited.add(current)
+        visited.add(current.code)
         
         for move in current.get_valid_moves():
             next_state = forward_check(current, move)
@@ -85,19 +88,20 @@ def forward_checking(initial_state, goal_state):
                     
         return None
         
-    return search(initial, set())
+    return search(initial, state_set(board))
 
 def ac3_solve(initial_state, goal_state):
     """AC-3 Algorithm (CSP style for 8-puzzle)"""
     from copy import deepcopy
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
 
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
 
     # Build variable list (positions of all tiles)
-    variables = [(i, j) for i in range(3) for j in range(3)]
+    variables = [(i, j) for i in range(board.rows) for j in range(board.cols)]
     # Build initial domains: each cell can be any value not already used in that cell
     def get_domains(state):
         used = set()
@@ -106,10 +110,10 @@ def ac3_solve(initial_state, goal_state):
                 if num != 0:
                     used.add(num)
         domains = {}
-        for i in range(3):
-            for j in range(3):
+        for i in range(board.rows):
+            for j in range(board.cols):
                 if state[i][j] == 0:
-                    domains[(i, j)] = set(range(1, 9)) - used
+                    domains[(i, j)] = set(range(1, board.cells)) - used
                 else:
                     domains[(i, j)] = {state[i][j]}
         return domains
@@ -140,11 +144,11 @@ def ac3_solve(initial_state, goal_state):
         return revised
 
     def search(current, visited):
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
-        if current in visited:
+        if current.code in visited:
             return None
-        visited.add(current)
+        visited.add(current.code)
         domains = get_domains(current.state)
         if not ac3(domains):
             return None
@@ -155,4 +159,4 @@ def ac3_solve(initial_state, goal_state):
                 return result
         return None
 
-    return search(initial, set())
+    return search(initial, state_set(board))
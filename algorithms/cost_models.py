@@ -0,0 +1,123 @@
+"""
+Module chứa registry các mô hình chi phí nước đi cho UCS
+
+Mỗi mô hình chi phí là một lớp con của CostModel, được khởi tạo một lần cho mỗi
+kích thước bàn và tính sẵn bảng costs[move][tile]: chi phí khi ô trống đi theo
+hướng DIRECTIONS[move] và đẩy ô số tile vào chỗ cũ của nó. Chi phí luôn là số
+nguyên dương nhỏ để UCS chạy trên hàng đợi bucket (Dial).
+
+    unit        mọi nước đi tốn 1 (UCS trùng với BFS)
+    tile        đẩy ô số t tốn t
+    direction   chi phí theo hướng đi của ô trống (mặc định dọc 1, ngang 2)
+"""
+from models.puzzle_state import DEFAULT_BOARD, DIRECTIONS, board_of
+
+DEFAULT_COST_MODEL = 'unit'
+
+COST_MODELS = {}
+
+
+def register(cls):
+    """Class decorator adding a CostModel subclass to the registry under cls.name"""
+    COST_MODELS[cls.name] = cls
+    return cls
+
+
+class CostModel:
+    """Positive integer cost of every move on one board, as a [move][tile] table"""
+
+    name = None
+    label = None
+
+    def __init__(self, board=DEFAULT_BOARD):
+        self.board = board
+        self.costs = tuple(
+            tuple(self.cost(tile, move) for tile in range(board.cells))
+            for move in range(len(DIRECTIONS))
+        )
+
+    def cost(self, tile, move):
+        """Cost of the blank moving DIRECTIONS[move] and pushing tile"""
+        raise NotImplementedError
+
+    def __call__(self, tile, move):
+        return self.costs[move][tile]
+
+    @property
+    def unit(self):
+        """Whether every move costs 1"""
+        return all(cost == 1 for costs in self.costs for cost in costs[1:])
+
+    def path_cost(self, states):
+        """Total cost of a solution given as a list of boards"""
+        board = self.board
+        total = 0
+        _, blank = board.encode(states[0])
+        for previous, state in zip(states, states[1:]):
+            _, new_blank = board.encode(state)
+            i, j = divmod(new_blank, board.cols)
+            move = board.blank_step.index(new_blank - blank)
+            total += self.costs[move][previous[i][j]]
+            blank = new_blank
+        return total
+
+
+_INSTANCES = {}
+
+
+def get_cost_model(cost_model, board=DEFAULT_BOARD):
+    """CostModel instance for a registry name (cached per board) or pass one through"""
+    if isinstance(cost_model, CostModel):
+        return cost_model
+    key = (cost_model, board)
+    instance = _INSTANCES.get(key)
+    if instance is None:
+        if cost_model not in COST_MODELS:
+            raise ValueError('Unknown cost model %r, expected one of %s' % (cost_model, ', '.join(COST_MODELS)))
+        instance = COST_MODELS[cost_model](board)
+        _INSTANCES[key] = instance
+    return instance
+
+
+def solution_cost(states, cost_model=DEFAULT_COST_MODEL):
+    """Cost of a solution path under a cost model"""
+    return get_cost_model(cost_model, board_of(states[0])).path_cost(states)
+
+
+@register
+class UnitCost(CostModel):
+    name = 'unit'
+    label = 'Unit'
+
+    def cost(self, tile, move):
+        return 1
+
+
+@register
+class TileCost(CostModel):
+    name = 'tile'
+    label = 'Tile value'
+
+    def __init__(self, board=DEFAULT_BOARD, weights=None):
+        # weights[tile] -> chi phí đẩy tile, mặc định bằng giá trị ô
+        self.weights = tuple(weights) if weights is not None else tuple(range(board.cells))
+        super().__init__(board)
+
+    def cost(self, tile, move):
+        return max(1, self.weights[tile])
+
+
+@register
+class DirectionCost(CostModel):
+    name = 'direction'
+    label = 'Direction'
+
+    DEFAULT_WEIGHTS = {'up': 1, 'down': 1, 'left': 2, 'right': 2}
+
+    def __init__(self, board=DEFAULT_BOARD, weights=None):
+        # weights[direction] -> chi phí khi ô trống đi theo hướng đó
+        self.weights = dict(self.DEFAULT_WEIGHTS if weights is None else weights)
+        super().__init__(board)
+
+    def cost(self, tile, move):
+        return self.weights[DIRECTIONS[move]]
@@ -0,0 +1,154 @@
+"""
+Module chứa cơ sở dữ liệu khoảng cách chính xác cho toàn bộ không gian 8-puzzle
+
+Một lượt BFS ngược từ trạng thái đích qua 181,440 trạng thái lưu lại khoảng cách
+tối ưu (1 byte) và nước đi tốt nhất (2 bit) theo hạng. Sau đó mọi trạng thái đầu
+cùng lớp chẵn lẻ được giải tối ưu bằng tra bảng trong O(độ dài lời giải).
+"""
+from models.bitset import Bitset
+from models.canonical import GoalCanonicalizer
+from models.move_table import MoveTable
+from models.puzzle_state import (
+    BLANK_STEP, DEFAULT_BOARD, OPPOSITE, PuzzleState, common_board, decode_state, find_blank, slide
+)
+from models.ranking import STATE_COUNT, parity, rank
+from algorithms.compact_bfs import bfs_layers
+from algorithms.parallel_bfs import parallel_bfs_layers
+from utils.table_store import TableFormatError, load_table, save_table, table_path
+
+TABLE_KIND = 'distance'
+
+
+class DistanceDatabase:
+    """Optimal distance and best move to one goal for every ranked state"""
+
+    def __init__(self, goal_code, distances, predecessors):
+        self.goal_code = goal_code
+        self.goal_parity = parity(goal_code)
+        self.distances = distances
+        # predecessors[r] là nước đi BFS dùng để tới r từ phía đích;
+        # nước đi tốt nhất từ r về đích là nước hoàn tác của nó
+        self.predecessors = predecessors
+
+    @classmethod
+    def build(cls, goal_code, workers=None):
+        """Retrograde BFS from goal_code over its whole parity class
+
+        workers > 1 expands the layers with a process pool (parallel_bfs_layers).
+        """
+        predecessors = MoveTable(STATE_COUNT)
+        distances = bytearray(STATE_COUNT)
+
+        if workers is not None and workers > 1:
+            layers = parallel_bfs_layers(goal_code, predecessors, workers)
+        else:
+            layers = ((depth, ranks) for depth, _, _, ranks in
+                      bfs_layers(goal_code, Bitset(STATE_COUNT), predecessors))
+        for depth, ranks in layers:
+            for index in ranks:
+                distances[index] = depth
+
+        return cls(goal_code, distances, predecessors)
+
+    @classmethod
+    def load(cls, goal_code, directory=None):
+        """Memory-map a cached table for goal_code, or return None if absent"""
+        table = load_table(TABLE_KIND, decode_state(goal_code), directory)
+        if table is None:
+            return None
+        if table.entry_count('distance') != STATE_COUNT or table.entry_count('moves') != STATE_COUNT:
+            raise TableFormatError('%s: wrong number of entries' % table.path)
+        return cls(
+            goal_code,
+            table.sections['distance'],
+            MoveTable(STATE_COUNT, table.sections['moves'])
+        )
+
+    def save(self, directory=None):
+        """Write the table to the cache directory"""
+        goal_state = decode_state(self.goal_code)
+        save_table(table_path(TABLE_KIND, goal_state, directory), TABLE_KIND, goal_state, {
+            'distance': (8, STATE_COUNT, self.distances),
+            'moves': (2, STATE_COUNT, self.predecessors.data),
+        })
+
+    @property
+    def diameter(self):
+        return max(self.distances)
+
+    def covers(self, code):
+        """Whether code can reach the goal, i.e. is in the table's parity class"""
+        return parity(code) == self.goal_parity
+
+    def distance(self, code):
+        """Optimal number of moves from code to the goal, or None if unsolvable"""
+        if not self.covers(code):
+            return None
+        return self.distances[rank(code)]
+
+    def best_move(self, code):
+        """Index into DIRECTIONS of an optimal move from code (code != goal)"""
+        return OPPOSITE[self.predecessors[rank(code)]]
+
+    def solve_codes(self, code):
+        """Codes on an optimal path from code to the goal, or None if unsolvable"""
+        if not self.covers(code):
+            return None
+        path = [code]
+        blank = find_blank(code)
+        while code != self.goal_code:
+            new_blank = blank + BLANK_STEP[self.best_move(code)]
+            code = slide(code, blank, new_blank)
+            blank = new_blank
+            path.append(code)
+        return path
+
+
+_DATABASES = {}
+
+
+def get_database(goal_state, use_cache=True, workers=None):
+    """Distance database for goal_state
+
+    Loaded from the on-disk cache when present, otherwise built (by workers
+    processes if more than one) and saved there; either way only once per
+    process and goal.
+    """
+    goal_code = PuzzleState(goal_state).code
+    database = _DATABASES.get(goal_code)
+    if database is not None:
+        return database
+
+    if use_cache:
+        try:
+            database = DistanceDatabase.load(goal_code)
+        except (OSError, TableFormatError):
+            database = None
+    if database is None:
+        database = DistanceDatabase.build(goal_code, workers)
+        if use_cache:
+            try:
+                database.save()
+            except OSError:
+                pass
+    _DATABASES[goal_code] = database
+    return database
+
+
+def database_solve(initial_state, goal_state):
+    """Optimal solution by distance-database lookup
+
+    The goal is canonicalized first, so every goal is served by one of at
+    most three shared tables (blank in a corner, on an edge or in the centre).
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    # Bảng bao trùm toàn bộ không gian trạng thái nên chỉ có cho bàn 3x3
+    if common_board(initial, goal) is not DEFAULT_BOARD:
+        raise ValueError('The distance database only covers the 3x3 board, got %dx%d' % initial.board.shape)
+    canonicalizer = GoalCanonicalizer(goal.code)
+    database = get_database(decode_state(canonicalizer.goal_code))
+    codes = database.solve_codes(canonicalizer.to_canonical(initial.code))
+    if codes is None:
+        return None
+    return [decode_state(canonicalizer.from_canonical(code)) for code in codes]
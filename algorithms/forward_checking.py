@@ -19,7 +19,7 @@ class ForwardCheckingController:
         
     def is_valid_move(self, state, x, y):
         """Check if a move is valid within the puzzle boundaries"""
-        return 0 <= x < 3 and 0 <= y < 3
+        return 0 <= x < len(state) and 0 <= y < len(state[0])
 
     def get_possible_moves(self, state):
         """Get all possible moves from current state"""
@@ -27,8 +27,8 @@ class ForwardCheckingController:
         blank_x, blank_y = None, None
         
         # Find blank position
-        for i in range(3):
-            for j in range(3):
+        for i in range(len(state)):
+            for j in range(len(state[0])):
                 if state[i][j] == 0:
                     blank_x, blank_y = i, j
                     break
@@ -81,7 +81,8 @@ class ForwardCheckingController:
             for num in row:
                 numbers.add(num)
         
-        return len(numbers) == 9 and all(i in numbers for i in range(9))
+        cells = len(state) * len(state[0])
+        return len(numbers) == cells and all(i in numbers for i in range(cells))
 
     def solve(self, max_depth=31):
         """Solve the puzzle using forward checking"""
@@ -0,0 +1,161 @@
+"""
+Module chứa các hàng đợi ưu tiên (frontier) dùng chung cho các thuật toán tìm kiếm
+
+Cả hai loại frontier đều được đánh khóa theo trạng thái (thường là mã nén),
+hỗ trợ giảm khóa (decrease-key) bằng xóa lười (lazy deletion) và chính sách
+phá hòa khi hai node có cùng độ ưu tiên:
+
+    'fifo'    node được thêm trước ra trước
+    'lifo'    node được thêm sau ra trước
+    'high_g'  ưu tiên g lớn hơn (node sâu hơn, thường tốt cho A*)
+    'low_g'   ưu tiên g nhỏ hơn
+"""
+import heapq
+from collections import deque
+from itertools import count
+
+TIE_BREAKS = ('fifo', 'lifo', 'high_g', 'low_g')
+
+
+def _check_tie_break(tie_break):
+    if tie_break not in TIE_BREAKS:
+        raise ValueError('Unknown tie_break %r, expected one of %s' % (tie_break, ', '.join(TIE_BREAKS)))
+
+
+class HeapFrontier:
+    """Binary-heap frontier for arbitrary (e.g. fractional) priorities"""
+
+    def __init__(self, tie_break='fifo'):
+        _check_tie_break(tie_break)
+        self.tie_break = tie_break
+        self._heap = []
+        self._entries = {}
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def priority(self, key):
+        return self._entries[key][0]
+
+    def item(self, key):
+        return self._entries[key][4]
+
+    def keys(self):
+        return list(self._entries)
+
+    def _order(self, g):
+        seq = next(self._counter)
+        if self.tie_break == 'fifo':
+            return 0, seq
+        if self.tie_break == 'lifo':
+            return 0, -seq
+        if self.tie_break == 'high_g':
+            return -g, seq
+        return g, seq
+
+    def push(self, key, item, priority, g=0):
+        """Insert key, or lower its priority; False if an equal or better entry exists"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] <= priority:
+                return False
+            entry[-1] = False
+        # [priority, tie, seq, key, item, alive]; seq là duy nhất nên không bao giờ so sánh tới key/item
+        entry = [priority, *self._order(g), key, item, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        return True
+
+    def pop(self):
+        """Remove and return (key, item, priority) with the lowest priority"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[-1]:
+                del self._entries[entry[3]]
+                return entry[3], entry[4], entry[0]
+        raise IndexError('pop from an empty frontier')
+
+    def remove(self, key):
+        self._entries.pop(key)[-1] = False
+
+
+class BucketFrontier:
+    """Two-level bucket queue for small non-negative integer priorities
+
+    The first level is indexed by priority (e.g. f), the second by g, so push
+    and pop are O(1) apart from scanning the handful of g values in one bucket.
+    """
+
+    def __init__(self, tie_break='high_g'):
+        _check_tie_break(tie_break)
+        self.tie_break = tie_break
+        self._by_g = tie_break in ('high_g', 'low_g')
+        self._buckets = []
+        self._entries = {}
+        self._min = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def priority(self, key):
+        return self._entries[key][2]
+
+    def item(self, key):
+        return self._entries[key][1]
+
+    def keys(self):
+        return list(self._entries)
+
+    def push(self, key, item, priority, g=0):
+        """Insert key, or lower its priority; False if an equal or better entry exists"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] <= priority:
+            return False
+
+        while len(self._buckets) <= priority:
+            self._buckets.append({})
+        inner = self._buckets[priority]
+        level = g if self._by_g else 0
+        bucket = inner.get(level)
+        if bucket is None:
+            bucket = inner[level] = deque()
+
+        # Bản ghi cũ của key (nếu có) trở thành rác và bị bỏ qua khi pop
+        record = (key, item, priority)
+        bucket.append(record)
+        self._entries[key] = record
+        if priority < self._min:
+            self._min = priority
+        return True
+
+    def pop(self):
+        """Remove and return (key, item, priority) with the lowest priority"""
+        buckets = self._buckets
+        while self._min < len(buckets):
+            inner = buckets[self._min]
+            while inner:
+                if self.tie_break == 'high_g':
+                    level = max(inner)
+                elif self.tie_break == 'low_g':
+                    level = min(inner)
+                else:
+                    level = 0
+                bucket = inner[level]
+                record = bucket.pop() if self.tie_break == 'lifo' else bucket.popleft()
+                if not bucket:
+                    del inner[level]
+                if self._entries.get(record[0]) is record:
+                    del self._entries[record[0]]
+                    return record
+            self._min += 1
+        raise IndexError('pop from an empty frontier')
+
+    def remove(self, key):
+        del self._entries[key]
@@ -0,0 +1,197 @@
+"""
+Module chứa các thuật toán tìm kiếm frontier (frontier search) không giữ tập closed
+
+Mỗi node trong frontier chỉ mang thêm các bit "toán tử đã dùng": bit của nước
+đi dẫn ngược về một node đã được mở rộng. Nước đi của puzzle có thể đảo ngược,
+nên khi một node được mở rộng, mọi láng giềng của nó nhận bit trỏ ngược lại và
+sẽ không bao giờ sinh lại nó; vì vậy node đã mở rộng có thể bỏ khỏi bộ nhớ và
+bộ nhớ đỉnh chỉ còn O(độ rộng frontier) thay vì O(số trạng thái đã thăm).
+
+Không còn con trỏ cha nên lời giải được dựng lại bằng chia để trị: mỗi lần tìm
+chỉ trả về một trạng thái ở giữa đường đi tối ưu, rồi tìm lại hai nửa.
+
+    frontier_bfs_solve      BFS hai chiều theo lớp; trạng thái gặp nhau là điểm giữa
+    frontier_a_star_search  A* mỗi node mang theo "relay", tổ tiên đầu tiên có g >= h
+
+Đồ thị trạng thái là đồ thị hai phía (ô trống đổi màu ô cờ sau mỗi nước), nên
+một lớp BFS không có cạnh nội bộ và chỉ cần giữ lớp hiện tại của mỗi phía.
+"""
+from models.puzzle_state import OPPOSITE, PuzzleState, common_board
+from algorithms.frontier import BucketFrontier
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic, require_consistent
+
+# Giá trị của một node trong lớp BFS: bit toán tử đã dùng | (ô trống << BLANK_SHIFT)
+BLANK_SHIFT = 4
+
+
+def _expand_layer(board, layer, stats):
+    """Next BFS layer of a frontier layer {code: used | blank << BLANK_SHIFT}"""
+    transitions, slide = board.transitions, board.slide
+    next_layer = {}
+    for code, value in layer.items():
+        blank = value >> BLANK_SHIFT
+        for move, new_blank in transitions[blank]:
+            if value >> move & 1:
+                continue
+            next_code = slide(code, blank, new_blank)
+            next_layer[next_code] = (next_layer.get(next_code, new_blank << BLANK_SHIFT)
+                                     | 1 << OPPOSITE[move])
+            if stats is not None:
+                stats.generated += 1
+    if stats is not None:
+        stats.expanded += len(layer)
+    return next_layer
+
+
+def _bfs_midpoint(board, start_code, start_blank, goal_code, goal_blank, stats):
+    """(code, blank, depth from start, depth to goal) of a state on a shortest path"""
+    # layers[0] mở rộng từ start, layers[1] mở rộng ngược từ goal
+    layers = [{start_code: start_blank << BLANK_SHIFT}, {goal_code: goal_blank << BLANK_SHIFT}]
+    depths = [0, 0]
+    if stats is not None:
+        stats.iterations += 1
+
+    while layers[0] and layers[1]:
+        side = 0 if len(layers[0]) <= len(layers[1]) else 1
+        next_layer = _expand_layer(board, layers[side], stats)
+        depths[side] += 1
+        other = layers[1 - side]
+        if stats is not None:
+            stats.peak_nodes = max(stats.peak_nodes, len(layers[side]) + len(next_layer) + len(other))
+        layers[side] = next_layer
+
+        smaller, larger = (next_layer, other) if len(next_layer) <= len(other) else (other, next_layer)
+        for code in smaller:
+            if code in larger:
+                return code, larger[code] >> BLANK_SHIFT, depths[0], depths[1]
+
+    return None
+
+
+def frontier_bfs_solve(initial_state, goal_state, stats=None):
+    """Breadth-First Search without a closed list (divide-and-conquer frontier search)
+
+    Only the current layer of each side is kept. The layers grow from both
+    ends until they meet, which gives one state halfway along a shortest path;
+    the two halves are then solved the same way.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    def solve(start_code, start_blank, goal_code, goal_blank):
+        """Codes of a shortest path from start_code to goal_code"""
+        midpoint = _bfs_midpoint(board, start_code, start_blank, goal_code, goal_blank, stats)
+        if midpoint is None:
+            return None
+        code, blank, to_start, to_goal = midpoint
+        # Mỗi phía đã mở rộng ít nhất một lớp khi độ dài >= 2, nên hai nửa đều ngắn hơn
+        left = solve(start_code, start_blank, code, blank) if to_start > 1 else [start_code, code][:to_start + 1]
+        right = solve(code, blank, goal_code, goal_blank) if to_goal > 1 else [code, goal_code][:to_goal + 1]
+        return left + right[1:]
+
+    codes = solve(initial.code, initial.blank, goal.code, goal.blank)
+    return [board.decode(code) for code in codes] if codes else None
+
+
+def _retarget(h, goal_code):
+    """Heuristic of the same kind as h aimed at an intermediate goal
+
+    Built directly rather than through get_heuristic, so the per-goal cache
+    is not filled with one-off relay goals.
+    """
+    return type(h)(goal_code, h.board)
+
+
+def _a_star_relay(start_code, start_blank, goal_code, h, stats):
+    """(cost, relay) of an optimal path, relay = (code, blank, g) on it or None"""
+    transitions, slide = h.board.transitions, h.board.slide
+    frontier = BucketFrontier(tie_break='high_g')
+    # item = [blank, g, h, bit toán tử đã dùng, relay]
+    root_h = h(start_code)
+    frontier.push(start_code, [start_blank, 0, root_h, 0, None], root_h, 0)
+    if stats is not None:
+        stats.iterations += 1
+
+    while frontier:
+        code, (blank, g, node_h, used, relay), _ = frontier.pop()
+
+        if code == goal_code:
+            return g, relay
+
+        if stats is not None:
+            stats.expanded += 1
+        new_cost = g + 1
+
+        for move, new_blank in transitions[blank]:
+            if used >> move & 1:
+                continue
+            next_code = slide(code, blank, new_blank)
+            back = 1 << OPPOSITE[move]
+            if next_code in frontier:
+                item = frontier.item(next_code)
+                item[3] |= back
+                if item[1] <= new_cost:
+                    continue
+                child_h, back = item[2], item[3]
+            else:
+                child_h = h.after_slide(node_h, code, blank, new_blank, next_code)
+            # Relay là node đầu tiên trên đường đi đã đi được ít nhất nửa quãng ước lượng
+            child_relay = relay
+            if child_relay is None and new_cost >= child_h:
+                child_relay = (next_code, new_blank, new_cost)
+            frontier.push(next_code, [new_blank, new_cost, child_h, back, child_relay],
+                          new_cost + child_h, new_cost)
+            if stats is not None:
+                stats.generated += 1
+
+        if stats is not None:
+            stats.peak_nodes = max(stats.peak_nodes, len(frontier))
+
+    return None, None
+
+
+def frontier_a_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, stats=None):
+    """A* Search without a closed list (divide-and-conquer frontier search)
+
+    Expanded nodes are dropped; each open node carries used-operator bits and
+    its relay, the first ancestor with g >= h. The goal's relay splits the
+    optimal path in two and each half is solved again with the heuristic
+    aimed at its own end. Needs a consistent heuristic (every registered
+    one except additive_pdb); others raise ValueError.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    def solve(start_code, start_blank, goal_code, goal_blank, cost=None):
+        """Codes of an optimal path from start_code to goal_code"""
+        if start_code == goal_code:
+            return [start_code]
+        if cost == 1:
+            return [start_code, goal_code]
+        h = goal_h if goal_code == goal.code else _retarget(goal_h, goal_code)
+        cost, relay = _a_star_relay(start_code, start_blank, goal_code, h, stats)
+        if cost is None:
+            return None
+        if relay is None or relay[0] == goal_code:
+            # Chỉ xảy ra khi cost == 1: node trước đích luôn có g >= 1 >= h
+            return [start_code, goal_code]
+        code, blank, g = relay
+        left = solve(start_code, start_blank, code, blank, g)
+        right = solve(code, blank, goal_code, goal_blank, cost - g)
+        return left + right[1:]
+
+    goal_h = require_consistent(get_heuristic(heuristic, goal.code, board), 'Frontier A*')
+    codes = solve(initial.code, initial.blank, goal.code, goal.blank)
+    return [board.decode(code) for code in codes] if codes else None
@@ -16,33 +16,36 @@ def genetic_algorithm(initial_state, goal_state):
     Returns:
         List of states showing solution path if found, None otherwise
     """
+    rows, cols = len(initial_state), len(initial_state[0])
+    cells = rows * cols
+    
     def create_individual():
-        numbers = list(range(9))
+        numbers = list(range(cells))
         random.shuffle(numbers)
-        return [numbers[i:i+3] for i in range(0, 9, 3)]
+        return [numbers[i:i+cols] for i in range(0, cells, cols)]
         
     def fitness(state):
         count = 0
-        for i in range(3):
-            for j in range(3):
+        for i in range(rows):
+            for j in range(cols):
                 if state[i][j] != goal_state[i][j]:
                     count += 1
         return count
         
     def crossover(parent1, parent2):
-        child = [[0 for _ in range(3)] for _ in range(3)]
+        child = [[0 for _ in range(cols)] for _ in range(rows)]
         used = set()
         
         # Copy some elements from parent1
-        for i in range(3):
-            for j in range(3):
+        for i in range(rows):
+            for j in range(cols):
                 if random.random() < 0.5:
                     child[i][j] = parent1[i][j]
                     used.add(parent1[i][j])
                     
         # Fill remaining positions from parent2
-        for i in range(3):
-            for j in range(3):
+        for i in range(rows):
+            for j in range(cols):
                 if child[i][j] == 0:
                     for num in parent2[i]:
                         if num not in used:
@@ -53,8 +56,8 @@ def genetic_algorithm(initial_state, goal_state):
         return child
         
     def mutate(state):
-        i1, j1 = random.randint(0, 2), random.randint(0, 2)
-        i2, j2 = random.randint(0, 2), random.randint(0, 2)
+        i1, j1 = random.randint(0, rows - 1), random.randint(0, cols - 1)
+        i2, j2 = random.randint(0, rows - 1), random.randint(0, cols - 1)
         state[i1][j1], state[i2][j2] = state[i2][j2], state[i1][j1]
         return state
         
@@ -0,0 +1,414 @@
+"""
+Module chứa registry các hàm heuristic cho puzzle
+
+Mỗi heuristic là một lớp con của Heuristic, được khởi tạo một lần cho mỗi trạng
+thái đích (các bảng tra cứu được tính sẵn theo đích) và gọi trực tiếp trên mã
+nén: h(code) -> số nước đi ước lượng tới đích.
+
+Mỗi instance gắn với một kích thước bàn (Board); mọi heuristic trừ pdb dùng
+được cho bàn rows x cols bất kỳ.
+
+Một nước đi chỉ dời một ô số, nên h của node con được cập nhật tăng dần từ h
+của node cha qua delta() thay vì tính lại trên cả bàn cờ; misplaced, manhattan
+và linear_conflict có bảng delta riêng, các heuristic khác tính lại toàn bộ.
+
+    misplaced          số ô sai vị trí (không tính ô trống)
+    manhattan          tổng khoảng cách Manhattan
+    linear_conflict    Manhattan + 2 cho mỗi ô phải rời hàng/cột để các ô khác đi qua
+    walking_distance   Walking Distance (Takahashi), tính theo hàng và theo cột
+    pdb                tra bảng khoảng cách chính xác (distance database)
+    additive_pdb       tổng các pattern database rời nhau, lấy max với phép phản
+                       chiếu của trạng thái
+
+Mọi heuristic đã đăng ký trừ additive_pdb đều nhất quán (consistent): h giảm
+nhiều nhất 1 qua mỗi nước đi. additive_pdb chỉ chấp nhận được, nên A* phải mở lại
+node đã đóng, còn Frontier A* và Bi-A* từ chối nó.
+"""
+from collections import deque
+from models.canonical import GoalCanonicalizer
+from models.puzzle_state import DEFAULT_BOARD
+from algorithms.distance_database import get_database
+from algorithms.pattern_database import get_pattern_database
+
+DEFAULT_HEURISTIC = 'manhattan'
+
+HEURISTICS = {}
+
+
+def register(cls):
+    """Class decorator adding a Heuristic subclass to the registry under cls.name"""
+    HEURISTICS[cls.name] = cls
+    return cls
+
+
+class Heuristic:
+    """Admissible estimate of the moves from a packed code to one goal on one board"""
+
+    name = None
+    label = None
+    # h giảm nhiều nhất 1 qua mỗi nước đi; các tìm kiếm có closed list cần điều này
+    consistent = True
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        self.goal_code = goal_code
+        self.board = board
+        positions = [0] * board.cells
+        for pos, shift in enumerate(board.shifts):
+            positions[(goal_code >> shift) & board.tile_mask] = pos
+        # goal_positions[tile] -> ô đích của tile
+        self.goal_positions = tuple(positions)
+
+    def __call__(self, code):
+        raise NotImplementedError
+
+    def delta(self, parent_h, moved_tile, from_pos, to_pos, code=None):
+        """h after moved_tile slides from from_pos to to_pos, given the parent's h
+
+        code is the resulting state; heuristics without an incremental form
+        simply re-evaluate it.
+        """
+        return self(code)
+
+    def after_slide(self, parent_h, code, blank, new_blank, next_code):
+        """h of next_code = slide(code, blank, new_blank) from h(code) = parent_h"""
+        tile = (code >> (new_blank * self.board.tile_bits)) & self.board.tile_mask
+        return self.delta(parent_h, tile, new_blank, blank, next_code)
+
+
+def require_consistent(h, search):
+    """Raise ValueError unless h is consistent, which search relies on to stay optimal"""
+    if not h.consistent:
+        raise ValueError('%s needs a consistent heuristic, got %s' % (search, h.name))
+    return h
+
+
+_INSTANCES = {}
+
+
+def get_heuristic(heuristic, goal_code, board=DEFAULT_BOARD):
+    """Heuristic instance for a registry name (cached per goal and board) or pass one through"""
+    if isinstance(heuristic, Heuristic):
+        return heuristic
+    key = (heuristic, goal_code, board)
+    instance = _INSTANCES.get(key)
+    if instance is None:
+        if heuristic not in HEURISTICS:
+            raise ValueError('Unknown heuristic %r, expected one of %s' % (heuristic, ', '.join(HEURISTICS)))
+        instance = HEURISTICS[heuristic](goal_code, board)
+        _INSTANCES[key] = instance
+    return instance
+
+
+@register
+class MisplacedTiles(Heuristic):
+    name = 'misplaced'
+    label = 'Misplaced tiles'
+
+    def __call__(self, code):
+        diff = code ^ self.goal_code
+        mask = self.board.tile_mask
+        count = 0
+        for shift in self.board.shifts:
+            if (diff >> shift) & mask and (code >> shift) & mask:
+                count += 1
+        return count
+
+    def delta(self, parent_h, moved_tile, from_pos, to_pos, code=None):
+        goal_pos = self.goal_positions[moved_tile]
+        return parent_h + (goal_pos != to_pos) - (goal_pos != from_pos)
+
+
+@register
+class ManhattanDistance(Heuristic):
+    name = 'manhattan'
+    label = 'Manhattan'
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        super().__init__(goal_code, board)
+        cells, cols, bits = board.cells, board.cols, board.tile_bits
+        # distance[pos << tile_bits | tile] -> khoảng cách Manhattan của tile đặt tại pos
+        distance = [0] * (cells << bits)
+        for tile in range(1, cells):
+            goal_i, goal_j = divmod(self.goal_positions[tile], cols)
+            for pos in range(cells):
+                i, j = divmod(pos, cols)
+                distance[(pos << bits) | tile] = abs(i - goal_i) + abs(j - goal_j)
+        self.distance = tuple(distance)
+
+        # step[(from_pos * cells + to_pos) << tile_bits | tile] -> thay đổi khoảng cách khi tile trượt
+        step = [0] * (cells * cells << bits)
+        for from_pos in range(cells):
+            for _, to_pos in board.transitions[from_pos]:
+                base = (from_pos * cells + to_pos) << bits
+                for tile in range(1, cells):
+                    step[base | tile] = (distance[(to_pos << bits) | tile]
+                                         - distance[(from_pos << bits) | tile])
+        self.step = tuple(step)
+        self.cells = cells
+        self.tile_bits = bits
+
+    def __call__(self, code):
+        distance = self.distance
+        bits, mask = self.board.tile_bits, self.board.tile_mask
+        total = 0
+        for pos, shift in enumerate(self.board.shifts):
+            total += distance[(pos << bits) | ((code >> shift) & mask)]
+        return total
+
+    def delta(self, parent_h, moved_tile, from_pos, to_pos, code=None):
+        return parent_h + self.step[((from_pos * self.cells + to_pos) << self.tile_bits) | moved_tile]
+
+
+def _tiles_to_remove(sequence):
+    """len(sequence) minus its longest increasing subsequence"""
+    tails = []
+    for value in sequence:
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if tails[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(tails):
+            tails.append(value)
+        else:
+            tails[low] = value
+    return len(sequence) - len(tails)
+
+
+@register
+class LinearConflict(ManhattanDistance):
+    name = 'linear_conflict'
+    label = 'Linear conflict'
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        super().__init__(goal_code, board)
+        rows, cols = board.rows, board.cols
+        self.lines = [
+            tuple(i * cols + j for j in range(cols)) for i in range(rows)
+        ] + [
+            tuple(i * cols + j for i in range(rows)) for j in range(cols)
+        ]
+        # masks[line] giữ lại các ô của một hàng/cột trong mã nén
+        self.masks = tuple(
+            sum(board.tile_mask << (pos * board.tile_bits) for pos in cells) for cells in self.lines
+        )
+        # Bảng xung đột của từng hàng/cột, tính dần theo nội dung dòng đã lọc mask
+        self._conflicts = [{} for _ in self.lines]
+
+        # affected[from_pos * cells + to_pos] -> các dòng có xung đột có thể đổi:
+        # trượt ngang chỉ đổi thứ tự trong hai cột, trượt dọc trong hai hàng
+        affected = [()] * (board.cells * board.cells)
+        for from_pos in range(board.cells):
+            from_i, from_j = divmod(from_pos, cols)
+            for _, to_pos in board.transitions[from_pos]:
+                to_i, to_j = divmod(to_pos, cols)
+                if from_i == to_i:
+                    affected[from_pos * board.cells + to_pos] = (rows + from_j, rows + to_j)
+                else:
+                    affected[from_pos * board.cells + to_pos] = (from_i, to_i)
+        self.affected = tuple(affected)
+
+    def line_conflict(self, line, key):
+        """Extra moves (2 per tile that must leave the line) for code & masks[line]"""
+        table = self._conflicts[line]
+        value = table.get(key)
+        if value is None:
+            board = self.board
+            is_row = line < board.rows
+            sequence = []
+            for pos in self.lines[line]:
+                tile = (key >> (pos * board.tile_bits)) & board.tile_mask
+                if not tile:
+                    continue
+                goal_i, goal_j = divmod(self.goal_positions[tile], board.cols)
+                i, j = divmod(pos, board.cols)
+                if is_row and goal_i == i:
+                    sequence.append(goal_j)
+                elif not is_row and goal_j == j:
+                    sequence.append(goal_i)
+            value = 2 * _tiles_to_remove(sequence)
+            table[key] = value
+        return value
+
+    def __call__(self, code):
+        total = super().__call__(code)
+        for line, mask in enumerate(self.masks):
+            total += self.line_conflict(line, code & mask)
+        return total
+
+    def delta(self, parent_h, moved_tile, from_pos, to_pos, code=None):
+        h = super().delta(parent_h, moved_tile, from_pos, to_pos)
+        bits = self.tile_bits
+        parent_code = code ^ (moved_tile << (from_pos * bits)) ^ (moved_tile << (to_pos * bits))
+        for line in self.affected[from_pos * self.cells + to_pos]:
+            mask = self.masks[line]
+            h += self.line_conflict(line, code & mask) - self.line_conflict(line, parent_code & mask)
+        return h
+
+
+_WALKING_TABLES = {}
+
+
+def _walking_table(lines, length, blank_line):
+    """BFS table of walking distances for one axis
+
+    A state counts, for every line, how many tiles of each goal line it holds,
+    plus the line of the blank; a move shifts one tile from a neighbouring line
+    into the blank's line.
+    """
+    key = (lines, length, blank_line)
+    table = _WALKING_TABLES.get(key)
+    if table is not None:
+        return table
+
+    counts = [0] * (lines * lines)
+    for line in range(lines):
+        counts[line * lines + line] = length - 1 if line == blank_line else length
+    start = (tuple(counts), blank_line)
+    table = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        counts, blank = state
+        distance = table[state] + 1
+        for neighbour in (blank - 1, blank + 1):
+            if not 0 <= neighbour < lines:
+                continue
+            for goal_line in range(lines):
+                source = neighbour * lines + goal_line
+                if counts[source]:
+                    moved = list(counts)
+                    moved[source] -= 1
+                    moved[blank * lines + goal_line] += 1
+                    next_state = (tuple(moved), neighbour)
+                    if next_state not in table:
+                        table[next_state] = distance
+                        queue.append(next_state)
+
+    _WALKING_TABLES[key] = table
+    return table
+
+
+@register
+class WalkingDistance(Heuristic):
+    name = 'walking_distance'
+    label = 'Walking distance'
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        super().__init__(goal_code, board)
+        rows, cols = board.rows, board.cols
+        goal_blank_i, goal_blank_j = divmod(self.goal_positions[0], cols)
+        self.goal_rows = tuple(pos // cols for pos in self.goal_positions)
+        self.goal_cols = tuple(pos % cols for pos in self.goal_positions)
+        self.row_table = _walking_table(rows, cols, goal_blank_i)
+        self.col_table = _walking_table(cols, rows, goal_blank_j)
+
+    def __call__(self, code):
+        rows, cols = self.board.rows, self.board.cols
+        mask = self.board.tile_mask
+        row_counts = [0] * (rows * rows)
+        col_counts = [0] * (cols * cols)
+        blank_i = blank_j = 0
+        for pos, shift in enumerate(self.board.shifts):
+            tile = (code >> shift) & mask
+            i, j = divmod(pos, cols)
+            if tile:
+                row_counts[i * rows + self.goal_rows[tile]] += 1
+                col_counts[j * cols + self.goal_cols[tile]] += 1
+            else:
+                blank_i, blank_j = i, j
+        return (self.row_table[(tuple(row_counts), blank_i)]
+                + self.col_table[(tuple(col_counts), blank_j)])
+
+
+@register
+class DatabaseHeuristic(Heuristic):
+    name = 'pdb'
+    label = 'Pattern database'
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        if board is not DEFAULT_BOARD:
+            raise ValueError('The pdb heuristic only covers the 3x3 board, got %dx%d' % board.shape)
+        super().__init__(goal_code, board)
+        self.canonicalizer = GoalCanonicalizer(goal_code)
+        self.database = get_database(board.decode(self.canonicalizer.goal_code))
+
+    def __call__(self, code):
+        distance = self.database.distance(self.canonicalizer.to_canonical(code))
+        return distance or 0
+
+
+@register
+class AdditivePatternHeuristic(Heuristic):
+    name = 'additive_pdb'
+    label = 'Additive PDB'
+    # Mỗi bảng lưu min theo vị trí ô trống, và tra cứu đối ngẫu chỉ bật khi ô
+    # trống ở ô đích: cả hai làm h có thể giảm hơn 1 qua một nước đi
+    consistent = False
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD, partition=None, reflect=True, dual=True):
+        super().__init__(goal_code, board)
+        # Bảng được dựng cho đích chuẩn, nên mọi đích cùng quỹ đạo ô trống dùng
+        # chung bảng; partition chia các ô của đích chuẩn
+        self.canonicalizer = GoalCanonicalizer(goal_code, board)
+        canonical = self.canonicalizer.goal_code
+        self.database = get_pattern_database(board.decode(canonical), partition)
+        cells, cols = board.cells, board.cols
+        # canonical_positions[tile] -> ô đích chuẩn của tile, goal_tiles[pos] -> ô số của đích chuẩn tại pos
+        canonical_positions = [0] * cells
+        goal_tiles = [0] * cells
+        for pos, shift in enumerate(board.shifts):
+            tile = (canonical >> shift) & board.tile_mask
+            canonical_positions[tile] = pos
+            goal_tiles[pos] = tile
+        self.canonical_positions = tuple(canonical_positions)
+        self.goal_tiles = tuple(goal_tiles)
+        # Ô của mỗi vị trí và nhãn của mỗi ô số sau khi đưa về đích chuẩn
+        self.cell_map = self.canonicalizer.symmetry.cell_map
+        self.labels = self.canonicalizer.labels
+
+        # Phản chiếu qua đường chéo chính giữ nguyên đích (sau khi đổi nhãn ô số)
+        # khi bàn vuông và ô trống của đích nằm trên đường chéo
+        blank_i, blank_j = divmod(self.canonical_positions[0], cols)
+        self.reflect = reflect and board.rows == cols and blank_i == blank_j
+        if self.reflect:
+            self.transpose = tuple((pos % cols) * cols + pos // cols for pos in range(cells))
+            # relabel[tile] -> ô số đóng vai trò tile trong trạng thái phản chiếu
+            self.relabel = tuple(goal_tiles[self.transpose[pos]] for pos in self.canonical_positions)
+        # Trạng thái đối ngẫu chỉ có cùng khoảng cách khi ô trống đã về ô đích
+        self.dual = dual
+
+    def __call__(self, code):
+        board = self.board
+        mask = board.tile_mask
+        cell_map, labels = self.cell_map, self.labels
+        # positions[tile] -> ô của tile trong trạng thái đã đưa về đích chuẩn
+        positions = [0] * board.cells
+        for pos, shift in enumerate(board.shifts):
+            positions[labels[(code >> shift) & mask]] = cell_map[pos]
+        distance = self.database.distance
+        h = distance(positions)
+        if self.reflect:
+            h = max(h, distance(self.reflected(positions)))
+
+        goal_positions = self.canonical_positions
+        if self.dual and positions[0] == goal_positions[0]:
+            # Ô số tile của trạng thái đối ngẫu nằm ở ô đích của ô số đang đứng tại goal_positions[tile]
+            goal_tiles = self.goal_tiles
+            dual_positions = [0] * board.cells
+            for tile, pos in enumerate(positions):
+                dual_positions[goal_tiles[pos]] = goal_positions[tile]
+            h = max(h, distance(dual_positions))
+            if self.reflect:
+                h = max(h, distance(self.reflected(dual_positions)))
+        return h
+
+    def reflected(self, positions):
+        """positions of the state mirrored along the main diagonal"""
+        transpose, relabel = self.transpose, self.relabel
+        mirrored = [0] * len(positions)
+        for tile, pos in enumerate(positions):
+            mirrored[relabel[tile]] = transpose[pos]
+        return mirrored
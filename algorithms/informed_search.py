@@ -1,115 +1,341 @@
 """
 Module chứa các thuật toán tìm kiếm có thông tin (Informed Search)
 """
-from models.puzzle_state import PuzzleState
+import time
+from models.puzzle_state import OPPOSITE, PuzzleState, common_board
+from models.node_pool import NodePool
+from models.pruning_fsm import REJECT, get_fsm
+from models.ranking import state_set
+from algorithms.frontier import BucketFrontier, HeapFrontier
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic
+from algorithms.frontier_search import frontier_a_star_search
+from algorithms.parallel_a_star import hda_star_search
 
-def greedy_best_first_search(initial_state, goal_state):
+def greedy_best_first_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC):
     """Greedy Best-First Search"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    h = get_heuristic(heuristic, goal.code, board)
+    initial.h = h(initial.code)
         
-    queue = [(heuristic(initial.state), initial)]
-    visited = {initial}
+    frontier = BucketFrontier(tie_break='fifo')
+    frontier.push(initial.code, initial, initial.h)
+    visited = state_set(board, [initial.code])
     
-    while queue:
-        _, current = queue.pop(0)
+    while frontier:
+        _, current, _ = frontier.pop()
         
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
             
         for move in current.get_valid_moves():
-            next_state = current.make_move(move)
+            next_state = current.make_move(move, h)
             
-            if next_state not in visited:
-                visited.add(next_state)
-                queue.append((heuristic(next_state.state), next_state))
-                queue.sort(key=lambda x: x[0])
+            if next_state.code not in visited:
+                visited.add(next_state.code)
+                frontier.push(next_state.code, next_state, next_state.h)
                 
     return None
 
-def a_star_search(initial_state, goal_state):
-    """A* Search"""
+def a_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, weight=1, stats=None,
+                  frontier=False, workers=None):
+    """A* Search
+
+    weight > 1 runs weighted A* (f = g + weight * h), whose solution costs at
+    most weight times the optimum. frontier=True drops the closed list and
+    the parent pointers (see frontier_a_star_search). workers > 1 spreads the
+    search over that many processes (see hda_star_search).
+    """
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    if workers is not None and workers > 1:
+        if weight != 1 or frontier:
+            raise ValueError('parallel A* needs weight=1 and frontier=False')
+        return hda_star_search(initial_state, goal_state, heuristic, workers, stats)
+    if frontier:
+        if weight != 1:
+            raise ValueError('frontier search needs weight=1, got %r' % (weight,))
+        return frontier_a_star_search(initial_state, goal_state, heuristic, stats)
+        
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
         
-    queue = [(heuristic(initial.state), 0, initial)]
-    visited = {initial}
+    h = get_heuristic(heuristic, goal.code, board)
+    transitions, slide = board.transitions, board.slide
+        
+    pool = NodePool(board)
+    root_h = h(initial.code)
+    root = pool.add(initial.code, initial.blank, h=root_h)
+    if weight == 1:
+        # weight=1.0 cũng là A* thường: giữ f nguyên để dùng hàng đợi bucket
+        weight = 1
+        frontier = BucketFrontier(tie_break='high_g')
+    else:
+        frontier = HeapFrontier(tie_break='high_g')
+    frontier.push(initial.code, root, weight * root_h, 0)
+    closed = state_set(board)
+    # g lúc đóng của từng node, chỉ cần khi heuristic không nhất quán: node đã
+    # đóng được mở lại khi tìm thấy đường tới nó ngắn hơn
+    closed_g = None if h.consistent else {}
+    blanks, depths, estimates = pool.blanks, pool.g, pool.h
     
-    while queue:
-        _, cost, current = queue.pop(0)
+    while frontier:
+        code, index, _ = frontier.pop()
         
-        if current.state == goal.state:
-            return current.get_states()
+        if code == goal.code:
+            if stats is not None:
+                stats.peak_nodes = len(pool)
+            return pool.get_states(index)
             
-        for move in current.get_valid_moves():
-            next_state = current.make_move(move)
+        if closed_g is not None:
+            if stats is not None and code in closed_g:
+                stats.reexpanded += 1
+            closed_g[code] = depths[index]
+        closed.add(code)
+        if stats is not None:
+            stats.expanded += 1
+        blank = blanks[index]
+        new_cost = depths[index] + 1
+        parent_h = estimates[index]
+        
+        for move, new_blank in transitions[blank]:
+            next_code = slide(code, blank, new_blank)
             
-            if next_state not in visited:
-                visited.add(next_state)
-                new_cost = cost + 1
-                queue.append((new_cost + heuristic(next_state.state), new_cost, next_state))
-                queue.sort(key=lambda x: x[0])
+            if next_code in closed and (closed_g is None or closed_g[next_code] <= new_cost):
+                continue
+            child_h = h.after_slide(parent_h, code, blank, new_blank, next_code)
+            f = new_cost + weight * child_h
+            if next_code in frontier and frontier.priority(next_code) <= f:
+                continue
+            child = pool.add(next_code, new_blank, index, move, new_cost, child_h)
+            frontier.push(next_code, child, f, new_cost)
+            if stats is not None:
+                stats.generated += 1
                 
     return None
 
-def ida_star_search(initial_state, goal_state):
-    """Iterative Deepening A* Search"""
+def ara_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, deadline=None,
+                    weight=3.0, weight_step=0.5):
+    """Anytime Repairing A* (ARA*)
+
+    Generator yielding (states, bound) for every improved solution, where the
+    solution costs at most bound times the optimum. It starts as weighted A*
+    and keeps lowering the weight, reusing the open list, the node pool and the
+    g-values of earlier passes; only nodes whose g improved after they were
+    closed are reopened. It stops once bound reaches 1 or time.monotonic()
+    passes deadline.
+    """
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
-        return [initial.state]
+    if initial == goal:
+        yield [initial.state], 1.0
+        return
+    if board.parity(initial.code) != board.parity(goal.code):
+        return
+        
+    h = get_heuristic(heuristic, goal.code, board)
+    transitions, slide = board.transitions, board.slide
+    
+    pool = NodePool(board)
+    root_h = h(initial.code)
+    root = pool.add(initial.code, initial.blank, h=root_h)
+    blanks, depths, estimates = pool.blanks, pool.g, pool.h
+    # best[code] -> node tốt nhất (g nhỏ nhất) đã biết của trạng thái
+    best = {initial.code: root}
+    frontier = HeapFrontier(tie_break='high_g')
+    frontier.push(initial.code, root, weight * root_h, 0)
+    inconsistent = {}
+    expansions = 0
+    solution_cost = None
+    published = (None, None)
+    
+    while True:
+        closed = state_set(board)
+        # ImprovePath: dừng khi không node nào trong OPEN có f nhỏ hơn g(goal)
+        while frontier:
+            code, index, f = frontier.pop()
+            goal_index = best.get(goal.code)
+            if goal_index is not None and depths[goal_index] <= f:
+                frontier.push(code, index, f, depths[index])
+                break
+                
+            expansions += 1
+            if deadline is not None and not expansions & 255 and time.monotonic() >= deadline:
+                return
+                
+            closed.add(code)
+            blank = blanks[index]
+            new_cost = depths[index] + 1
+            parent_h = estimates[index]
+            
+            for move, new_blank in transitions[blank]:
+                next_code = slide(code, blank, new_blank)
+                known = best.get(next_code)
+                if known is not None and depths[known] <= new_cost:
+                    continue
+                child_h = h.after_slide(parent_h, code, blank, new_blank, next_code)
+                child = pool.add(next_code, new_blank, index, move, new_cost, child_h)
+                best[next_code] = child
+                if next_code in closed:
+                    inconsistent[next_code] = child
+                else:
+                    frontier.push(next_code, child, new_cost + weight * child_h, new_cost)
+                    
+        goal_index = best.get(goal.code)
+        if goal_index is None:
+            return
+        solution_cost = depths[goal_index]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+        # Cận dưới của chi phí tối ưu: min(g + h) trên OPEN và INCONS
+        lower = min(
+            [depths[frontier.item(code)] + estimates[frontier.item(code)] for code in frontier.keys()]
+            + [depths[index] + estimates[index] for index in inconsistent.values()],
+            default=solution_cost
+        )
+        bound = min(weight, solution_cost / lower)
+        if published != (solution_cost, bound):
+            published = (solution_cost, bound)
+            yield pool.get_states(goal_index), bound
+        if bound <= 1:
+            return
+            
+        # Giảm trọng số, đưa INCONS vào OPEN và tính lại độ ưu tiên
+        weight = max(1.0, weight - weight_step)
+        entries = {code: frontier.item(code) for code in frontier.keys()}
+        entries.update(inconsistent)
+        inconsistent = {}
+        frontier = HeapFrontier(tie_break='high_g')
+        for code, index in entries.items():
+            frontier.push(code, index, depths[index] + weight * estimates[index], depths[index])
+
+def anytime_a_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, time_budget=1.0):
+    """Best ARA* solution found within time_budget seconds"""
+    result = None
+    deadline = time.monotonic() + time_budget
+    for states, _ in ara_star_search(initial_state, goal_state, heuristic, deadline):
+        result = states
+    return result
+
+def ida_star_moves(code, blank, goal_code, h, fsm=None, stats=None):
+    """Optimal move sequence (indices into DIRECTIONS) by in-place iterative IDA*
+
+    One packed code is mutated by make/undo slides and the path lives on an
+    explicit move stack, so depth is not limited by Python's recursion limit.
+    With a PruningFSM, move sequences known to reach a duplicate are skipped;
+    without one, only the move undoing the previous one is.
+    """
+    if code == goal_code:
+        return []
+    transitions, slide = h.board.transitions, h.board.slide
+    root_h = h(code)
+    bound = root_h
+    previous_bound = None
+    while True:
+        next_bound = None
+        if stats is not None:
+            stats.iterations += 1
+            stats.expanded += 1
+            if previous_bound is not None:
+                stats.reexpanded += 1
+        # Ngăn xếp theo độ sâu: vị trí ô trống, h và nước đi kế tiếp cần thử
+        blanks = [blank]
+        estimates = [root_h]
+        cursors = [0]
+        fsm_states = [fsm.start(blank) if fsm else 0]
+        path = []
         
-    def search(node, g, bound):
-        f = g + heuristic(node.state)
-        if f > bound:
-            return f
-        if node.state == goal.state:
-            return node.get_states()
+        while True:
+            depth = len(path)
+            current_blank = blanks[depth]
+            options = transitions[current_blank]
+            k = cursors[depth]
             
-        min_f = float('inf')
-        for move in node.get_valid_moves():
-            next_state = node.make_move(move)
-            result = search(next_state, g + 1, bound)
-            if isinstance(result, list):
-                return [node.state] + result
-            min_f = min(min_f, result)
+            if k == len(options):
+                if not depth:
+                    break
+                # Hoàn tác nước đi cuối và quay lui
+                blanks.pop()
+                estimates.pop()
+                cursors.pop()
+                fsm_states.pop()
+                path.pop()
+                code = slide(code, current_blank, blanks[-1])
+                continue
+                
+            cursors[depth] = k + 1
+            move, new_blank = options[k]
+            if fsm:
+                fsm_state = fsm.next(fsm_states[depth], move)
+                if fsm_state == REJECT:
+                    continue
+            elif depth and move == OPPOSITE[path[-1]]:
+                continue
+                
+            next_code = slide(code, current_blank, new_blank)
+            child_h = h.after_slide(estimates[depth], code, current_blank, new_blank, next_code)
+            f = depth + 1 + child_h
+            if stats is not None:
+                stats.generated += 1
+            if f > bound:
+                if next_bound is None or f < next_bound:
+                    next_bound = f
+                continue
+                
+            path.append(move)
+            if next_code == goal_code:
+                return path
+            if stats is not None:
+                stats.expanded += 1
+                # Node có f không vượt ngưỡng lần lặp trước đã được mở rộng ở lần đó
+                if previous_bound is not None and f <= previous_bound:
+                    stats.reexpanded += 1
+            code = next_code
+            blanks.append(new_blank)
+            estimates.append(child_h)
+            cursors.append(0)
+            fsm_states.append(fsm_state if fsm else 0)
             
-        return min_f
+        if next_bound is None:
+            return None
+        previous_bound = bound
+        bound = next_bound
+
+def ida_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, stats=None):
+    """Iterative Deepening A* Search"""
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+    
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
         
-    bound = heuristic(initial.state)
-    while True:
-        result = search(initial, 0, bound)
-        if isinstance(result, list):
-            return result
-        bound = result
+    h = get_heuristic(heuristic, goal.code, board)
+    moves = ida_star_moves(initial.code, initial.blank, goal.code, h, get_fsm(board=board), stats)
+    if moves is None:
+        return None
+        
+    # Dựng lại các bàn cờ trên đường đi từ ngăn xếp nước đi
+    code, blank = initial.code, initial.blank
+    states = [initial.state]
+    for move in moves:
+        new_blank = blank + board.blank_step[move]
+        code = board.slide(code, blank, new_blank)
+        blank = new_blank
+        states.append(board.decode(code))
+    return states
@@ -3,31 +3,29 @@ Module chứa các thuật toán tìm kiếm cục bộ (Local Search)
 """
 import random
 import math
-from models.puzzle_state import PuzzleState
+from models.puzzle_state import PuzzleState, common_board
+from models.ranking import state_set
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic
 
-def hill_climbing_simple(initial_state, goal_state):
+def hill_climbing_simple(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC):
     """Simple Hill Climbing"""
     current = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(current, goal)
     
-    if current.state == goal.state:
+    if current == goal:
         return [current.state]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    h = get_heuristic(heuristic, goal.code, board)
+    current.h = h(current.code)
         
     while True:
         best_neighbor = None
-        best_score = heuristic(current.state)
+        best_score = current.h
         
         for move in current.get_valid_moves():
-            neighbor = current.make_move(move)
-            score = heuristic(neighbor.state)
+            neighbor = current.make_move(move, h)
+            score = neighbor.h
             
             if score < best_score:
                 best_score = score
@@ -37,102 +35,94 @@ def hill_climbing_simple(initial_state, goal_state):
             return None
             
         current = best_neighbor
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
 
-def hill_climbing_steepest(initial_state, goal_state):
+def hill_climbing_steepest(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC):
     """Steepest Ascent Hill Climbing"""
     current = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(current, goal)
     
-    if current.state == goal.state:
+    if current == goal:
         return [current.state]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    h = get_heuristic(heuristic, goal.code, board)
+    current.h = h(current.code)
         
     while True:
         neighbors = []
         for move in current.get_valid_moves():
-            neighbor = current.make_move(move)
-            neighbors.append((heuristic(neighbor.state), neighbor))
+            neighbor = current.make_move(move, h)
+            neighbors.append((neighbor.h, neighbor))
             
         if not neighbors:
             return None
             
         best_score, best_neighbor = min(neighbors, key=lambda x: x[0])
         
-        if best_score >= heuristic(current.state):
+        if best_score >= current.h:
             return None
             
         current = best_neighbor
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
 
-def stochastic_hill_climbing(initial_state, goal_state):
+def stochastic_hill_climbing(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC):
     """Stochastic Hill Climbing"""
     current = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(current, goal)
     
-    if current.state == goal.state:
+    if current == goal:
         return [current.state]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    h = get_heuristic(heuristic, goal.code, board)
+    current.h = h(current.code)
         
     while True:
         neighbors = []
         for move in current.get_valid_moves():
-            neighbor = current.make_move(move)
-            score = heuristic(neighbor.state)
-            if score < heuristic(current.state):
+            neighbor = current.make_move(move, h)
+            score = neighbor.h
+            if score < current.h:
                 neighbors.append(neighbor)
                 
         if not neighbors:
             return None
             
         current = random.choice(neighbors)
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
 
-def simulated_annealing(initial_state, goal_state, max_steps=10000):
+def simulated_annealing(initial_state, goal_state, max_steps=10000, heuristic=DEFAULT_HEURISTIC):
     """Simulated Annealing"""
     current = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(current, goal)
 
-    if current.state == goal.state:
+    if current == goal:
         return [current.state]
 
-    def heuristic(state):
-        return sum(1 for i in range(3) for j in range(3) 
-                  if state[i][j] != goal.state[i][j] and state[i][j] != 0)
+    h = get_heuristic(heuristic, goal.code, board)
+    current.h = h(current.code)
 
     temperature = 100.0
     cooling_rate = 0.995
     steps = 0
 
     while temperature > 0.1 and steps < max_steps:
-        if current.state == goal.state:
+        if current == goal:
             return current.get_states()
 
-        neighbors = [current.make_move(move) for move in current.get_valid_moves()]
+        neighbors = [current.make_move(move, h) for move in current.get_valid_moves()]
         neighbors = [n for n in neighbors if n is not None]
 
         if not neighbors:
             return None
 
         next_state = random.choice(neighbors)
-        delta_e = heuristic(next_state.state) - heuristic(current.state)
+        delta_e = next_state.h - current.h
 
         if delta_e < 0 or random.random() < math.exp(-delta_e / temperature):
             current = next_state
@@ -142,39 +132,35 @@ def simulated_annealing(initial_state, goal_state, max_steps=10000):
 
     return None
 
-def beam_search(initial_state, goal_state):
+def beam_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC):
     """Beam Search"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
-    def heuristic(state):
-        count = 0
-        for i in range(3):
-            for j in range(3):
-                if state[i][j] != goal.state[i][j]:
-                    count += 1
-        return count
+    h = get_heuristic(heuristic, goal.code, board)
+    initial.h = h(initial.code)
         
     beam_width = 3
     current_level = [initial]
-    visited = {initial}
+    visited = state_set(board, [initial.code])
     
     while current_level:
         next_level = []
         
         for node in current_level:
-            if node.state == goal.state:
+            if node == goal:
                 return node.get_states()
                 
             for move in node.get_valid_moves():
-                next_state = node.make_move(move)
+                next_state = node.make_move(move, h)
                 
-                if next_state not in visited:
-                    visited.add(next_state)
-                    next_level.append((heuristic(next_state.state), next_state))
+                if next_state.code not in visited:
+                    visited.add(next_state.code)
+                    next_level.append((next_state.h, next_state))
                     
         if not next_level:
             return None
@@ -0,0 +1,293 @@
+"""
+Module chứa các thuật toán tìm kiếm có thông tin với bộ nhớ giới hạn
+
+SMA* giữ tối đa max_nodes node trong cây tìm kiếm: khi đầy, lá tệ nhất (f lớn
+nhất, nông nhất) bị quên và giá trị f của nó được lưu lại ở node cha, để cha có
+thể sinh lại đúng nhánh đó khi nó lại trở thành lựa chọn tốt nhất.
+
+RBFS chỉ giữ đường đi hiện tại và các node anh em của nó (bộ nhớ tuyến tính theo
+độ sâu), mỗi node mang giá trị F đã cập nhật ngược từ cây con bị bỏ đi.
+"""
+import heapq
+import sys
+from itertools import count
+from models.puzzle_state import OPPOSITE, PuzzleState, common_board
+from models.pruning_fsm import REJECT, get_fsm
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic
+
+INFINITY = float('inf')
+
+
+class _Node:
+    __slots__ = ('code', 'blank', 'g', 'h', 'f', 'depth', 'parent', 'move',
+                 'children', 'forgotten', 'queued', 'alive')
+
+    def __init__(self, code, blank, g, h, f, parent=None, move=None):
+        self.code = code
+        self.blank = blank
+        self.g = g
+        self.h = h
+        self.f = f
+        self.depth = parent.depth + 1 if parent else 0
+        self.parent = parent
+        self.move = move
+        # children[move] -> node con đang trong bộ nhớ, forgotten[move] -> f của con đã quên
+        self.children = {}
+        self.forgotten = {}
+        # Độ ưu tiên hiện tại trong OPEN (None nếu không có con nào cần sinh)
+        self.queued = None
+        self.alive = True
+
+
+# Ước lượng bộ nhớ của một node (đối tượng + hai dict con) để đổi max_bytes ra số node
+NODE_BYTES = sys.getsizeof(_Node(0, 0, 0, 0, 0)) + 2 * sys.getsizeof({})
+
+# Hai heap được dựng lại khi số phần tử vượt quá COMPACT_FACTOR lần số node sống
+COMPACT_FACTOR = 4
+
+
+def sma_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC,
+                    max_nodes=50000, max_bytes=None, stats=None):
+    """Simplified Memory-Bounded A* (SMA*)
+
+    At most max_nodes nodes (or max_bytes worth of nodes) are kept, and the
+    heaps are compacted so stale entries stay within a constant factor of
+    them. The result is optimal whenever the optimal path fits in memory;
+    once the best f shows that no solution path fits, None is returned.
+    stats.evictions counts how many leaves had to be forgotten.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    if max_bytes is not None:
+        max_nodes = min(max_nodes, max_bytes // NODE_BYTES)
+    transitions, slide = board.transitions, board.slide
+    # Cần đủ chỗ cho một đường đi và các node con của node cuối
+    max_nodes = max(max_nodes, 2 + len(transitions[0]))
+    h = get_heuristic(heuristic, goal.code, board)
+
+    seq = count()
+    open_heap = []    # (priority, -depth, seq, node): f nhỏ nhất, sâu nhất trước
+    leaf_heap = []    # (-f, depth, seq, node): f lớn nhất, nông nhất trước
+
+    def queue(node, priority):
+        node.queued = priority
+        heapq.heappush(open_heap, (priority, -node.depth, next(seq), node))
+
+    def add_leaf(node):
+        heapq.heappush(leaf_heap, (-node.f, node.depth, next(seq), node))
+
+    def compact():
+        """Drop stale heap entries so both heaps stay proportional to the live nodes"""
+        nonlocal open_heap, leaf_heap
+        seen = set()
+        entries = []
+        for entry in open_heap:
+            node = entry[3]
+            if node.alive and node.queued == entry[0] and id(node) not in seen:
+                seen.add(id(node))
+                entries.append(entry)
+        heapq.heapify(entries)
+        open_heap = entries
+        seen = set()
+        entries = []
+        for entry in leaf_heap:
+            node = entry[3]
+            if node.alive and not node.children and -entry[0] == node.f and id(node) not in seen:
+                seen.add(id(node))
+                entries.append(entry)
+        heapq.heapify(entries)
+        leaf_heap = entries
+
+    root_h = h(initial.code)
+    root = _Node(initial.code, initial.blank, 0, root_h, root_h)
+    queue(root, root.f)
+    used = 1
+    if stats is not None:
+        stats.peak_nodes = max(stats.peak_nodes, used)
+
+    def evict(keep):
+        """Forget the worst leaf other than keep; False if none can go"""
+        nonlocal used
+        while leaf_heap:
+            neg_f, _, _, leaf = heapq.heappop(leaf_heap)
+            if not leaf.alive or leaf.children or -neg_f != leaf.f or leaf is root or leaf is keep:
+                continue
+            parent = leaf.parent
+            del parent.children[leaf.move]
+            parent.forgotten[leaf.move] = leaf.f
+            leaf.alive = False
+            leaf.queued = None
+            used -= 1
+            if stats is not None:
+                stats.evictions += 1
+            if not parent.children:
+                add_leaf(parent)
+            priority = min(parent.forgotten.values())
+            if parent.queued is None or priority < parent.queued:
+                queue(parent, priority)
+            return True
+        return False
+
+    while open_heap:
+        priority, _, _, node = heapq.heappop(open_heap)
+        if not node.alive or node.queued != priority:
+            continue
+        # f là cận dưới của lời giải (nước đi chi phí 1): đường đi dài hơn
+        # max_nodes - 1 nước không thể nằm trọn trong bộ nhớ
+        if priority > max_nodes - 1:
+            return None
+
+        if node.code == goal.code:
+            path = []
+            while node:
+                path.append(board.decode(node.code))
+                node = node.parent
+            return path[::-1]
+
+        node.queued = None
+        if stats is not None:
+            stats.expanded += 1
+            if node.forgotten:
+                stats.reexpanded += 1
+
+        for move, new_blank in transitions[node.blank]:
+            if move in node.children or (node.move is not None and move == OPPOSITE[node.move]):
+                continue
+            next_code = slide(node.code, node.blank, new_blank)
+            child_h = h.after_slide(node.h, node.code, node.blank, new_blank, next_code)
+            if move in node.forgotten:
+                f = node.forgotten.pop(move)
+            elif next_code != goal.code and node.depth + 2 >= max_nodes:
+                # Đường đi tới con không còn chỗ trong bộ nhớ
+                f = INFINITY
+            else:
+                f = max(node.f, node.g + 1 + child_h)
+            child = _Node(next_code, new_blank, node.g + 1, child_h, f, node, move)
+            node.children[move] = child
+            used += 1
+            if stats is not None:
+                stats.generated += 1
+            queue(child, f)
+            add_leaf(child)
+
+        while used > max_nodes and evict(node):
+            pass
+        if len(open_heap) + len(leaf_heap) > COMPACT_FACTOR * max_nodes:
+            compact()
+        if stats is not None:
+            stats.peak_nodes = max(stats.peak_nodes, used)
+
+        # Cập nhật ngược f (backup) lên các tổ tiên
+        current = node
+        while current is not None and current.alive:
+            values = [child.f for child in current.children.values()]
+            values.extend(current.forgotten.values())
+            if not values:
+                break
+            backed_up = max(current.f, min(values))
+            if backed_up == current.f and current is not node:
+                break
+            current.f = backed_up
+            if not current.children:
+                add_leaf(current)
+            if current.forgotten:
+                priority = min(current.forgotten.values())
+                if current.queued != priority:
+                    queue(current, priority)
+            current = current.parent
+
+    return None
+
+
+def rbfs_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, stats=None):
+    """Recursive Best-First Search (RBFS)
+
+    Memory is linear in the solution depth. A subtree is abandoned once its
+    best f exceeds the best alternative elsewhere, and its backed-up F is
+    kept so it is re-entered only when it becomes the best again.
+    stats.reexpanded counts every node expanded again after its subtree was
+    abandoned; tracking this keeps a tree of the expanded nodes, so memory is
+    linear only when stats is None.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    h = get_heuristic(heuristic, goal.code, board)
+    fsm = get_fsm(board=board)
+    transitions, slide = board.transitions, board.slide
+    moves = []
+
+    def search(code, blank, g, node_h, stored_f, bound, fsm_state, explored, reentered):
+        """(found, backed-up F) of the subtree below code, abandoned above bound"""
+        if code == goal.code:
+            return True, stored_f
+        if stats is not None:
+            stats.expanded += 1
+            if reentered:
+                stats.reexpanded += 1
+
+        children = []
+        for move, new_blank in transitions[blank]:
+            next_fsm_state = fsm.next(fsm_state, move)
+            if next_fsm_state == REJECT:
+                continue
+            next_code = slide(code, blank, new_blank)
+            child_h = h.after_slide(node_h, code, blank, new_blank, next_code)
+            f = g + 1 + child_h
+            # Node đã từng mở rộng truyền F của nó xuống các con
+            if g + node_h < stored_f:
+                f = max(f, stored_f)
+            children.append([f, move, next_code, new_blank, child_h, next_fsm_state])
+            if stats is not None:
+                stats.generated += 1
+        if not children:
+            return False, INFINITY
+
+        while True:
+            children.sort(key=lambda child: child[0])
+            best = children[0]
+            if best[0] > bound:
+                return False, best[0]
+            alternative = children[1][0] if len(children) > 1 else INFINITY
+            # explored[move] -> cây các node con đã mở rộng (chỉ giữ khi cần đếm), để
+            # biết node nào trong cây con bị bỏ dở thực sự được mở rộng lại
+            below, child_reentered = None, False
+            if explored is not None:
+                below = explored.get(best[1])
+                child_reentered = below is not None
+                if not child_reentered:
+                    below = explored[best[1]] = {}
+            moves.append(best[1])
+            found, best[0] = search(best[2], best[3], g + 1, best[4], best[0],
+                                    min(bound, alternative), best[5], below, child_reentered)
+            if found:
+                return True, best[0]
+            moves.pop()
+
+    root_h = h(initial.code)
+    found, _ = search(initial.code, initial.blank, 0, root_h, root_h, INFINITY,
+                      fsm.start(initial.blank), {} if stats is not None else None, False)
+    if not found:
+        return None
+
+    code, blank = initial.code, initial.blank
+    states = [initial.state]
+    for move in moves:
+        new_blank = blank + board.blank_step[move]
+        code = slide(code, blank, new_blank)
+        blank = new_blank
+        states.append(board.decode(code))
+    return states
@@ -7,9 +7,10 @@ import itertools
 def get_valid_moves(state):
     """Get all valid moves for a state"""
     moves = []
+    rows, cols = len(state), len(state[0])
     empty_pos = None
-    for i in range(3):
-        for j in range(3):
+    for i in range(rows):
+        for j in range(cols):
             if state[i][j] == 0:
                 empty_pos = (i, j)
                 break
@@ -22,7 +23,7 @@ def get_valid_moves(state):
     # Check all possible moves
     for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # up, down, left, right
         new_x, new_y = empty_pos[0] + dx, empty_pos[1] + dy
-        if 0 <= new_x < 3 and 0 <= new_y < 3:
+        if 0 <= new_x < rows and 0 <= new_y < cols:
             moves.append((new_x, new_y, get_move_direction(dx, dy)))
     return moves
 
@@ -37,9 +38,10 @@ def get_move_direction(dx, dy):
 def apply_move(state, move_pos):
     """Apply a move to a state and return new state"""
     new_state = [row[:] for row in state]
+    rows, cols = len(state), len(state[0])
     empty_pos = None
-    for i in range(3):
-        for j in range(3):
+    for i in range(rows):
+        for j in range(cols):
             if new_state[i][j] == 0:
                 empty_pos = (i, j)
                 break
@@ -52,7 +54,7 @@ def apply_move(state, move_pos):
     new_x, new_y = move_pos[:2] # Ignore direction part
     old_x, old_y = empty_pos
     
-    if not (0 <= new_x < 3 and 0 <= new_y < 3):
+    if not (0 <= new_x < rows and 0 <= new_y < cols):
         return None
         
     new_state[old_x][old_y], new_state[new_x][new_y] = new_state[new_x][new_y], new_state[old_x][old_y]
@@ -72,12 +74,12 @@ def no_observation_search(initial_belief_state, goal_state, max_steps=5):
     def manhattan_distance(state1, state2):
         """Calculate Manhattan distance between two states"""
         distance = 0
-        for i1 in range(3):
-            for j1 in range(3):
+        for i1 in range(len(state1)):
+            for j1 in range(len(state1[0])):
                 if state1[i1][j1] != 0:  # Don't count empty space
                     # Find same number in state2
-                    for i2 in range(3):
-                        for j2 in range(3):
+                    for i2 in range(len(state2)):
+                        for j2 in range(len(state2[0])):
                             if state2[i2][j2] == state1[i1][j1]:
                                 distance += abs(i1 - i2) + abs(j1 - j2)
         return distance
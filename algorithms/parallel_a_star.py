@@ -0,0 +1,246 @@
+"""
+Module chứa A* song song phân phối theo hash (HDA*) trên nhiều tiến trình
+
+Mỗi worker sở hữu các trạng thái có owner(code) bằng chỉ số của nó và giữ open
+list, bảng g tốt nhất và con trỏ cha của riêng các trạng thái đó. Node con được
+gửi tới worker sở hữu qua hàng đợi theo từng lô (batch); chính worker sở hữu
+tính h, loại trùng và đưa node vào open list.
+
+Lời giải tốt nhất đã biết (incumbent) nằm trong shared memory: node có
+f >= incumbent bị bỏ. Việc tìm kiếm kết thúc khi mọi worker rảnh (không còn
+node nào có f < incumbent) và mọi lô đã gửi đều đã được nhận; hai bộ đếm lô và
+các cờ rảnh được đọc/ghi cùng một khóa nên không có lô nào bị bỏ sót. Với
+heuristic chấp nhận được, incumbent lúc đó là tối ưu.
+
+Đường đi được dựng lại bằng cách hỏi từng worker sở hữu con trỏ cha của trạng
+thái, đi ngược từ đích về trạng thái đầu.
+"""
+import os
+import queue
+from multiprocessing import Lock, Process, Queue, RawArray, RawValue
+from models.puzzle_state import PuzzleState, common_board, get_board
+from algorithms.frontier import BucketFrontier
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic
+
+# Số node tối đa trong một lô gửi cho worker khác
+BATCH_SIZE = 256
+
+# Số lần mở rộng giữa hai lần đọc hộp thư và gửi các lô còn dở
+POLL_INTERVAL = 64
+
+# Thời gian chờ (giây) của worker rảnh trước khi kiểm tra lại điều kiện dừng
+IDLE_WAIT = 0.01
+
+NO_SOLUTION = (1 << 62)
+
+_MIX = 0x9E3779B97F4A7C15
+
+
+def owner(code, workers):
+    """Index of the worker owning code (multiplicative hash, spreads all tiles)"""
+    return ((code * _MIX) >> 32 & 0xFFFFFFFF) % workers
+
+
+class _Shared:
+    """Counters shared by all workers, guarded by one lock"""
+
+    def __init__(self, workers):
+        self.lock = Lock()
+        # counts[0] = số lô đã gửi, counts[1] = số lô đã nhận
+        self.counts = RawArray('q', 2)
+        self.idle = RawArray('b', [1] * workers)
+        self.done = RawValue('b', 0)
+        # Số worker đã rời vòng tìm kiếm
+        self.stopped = RawValue('q', 0)
+        self.incumbent = RawValue('q', NO_SOLUTION)
+
+    def sent(self):
+        with self.lock:
+            self.counts[0] += 1
+
+    def received(self, index):
+        with self.lock:
+            self.idle[index] = 0
+            self.counts[1] += 1
+
+    def go_idle(self, index):
+        """Mark worker index idle; True once every worker is idle and nothing is in flight"""
+        with self.lock:
+            self.idle[index] = 1
+            if self.done.value or (all(self.idle) and self.counts[0] == self.counts[1]):
+                self.done.value = 1
+                self.stopped.value += 1
+                return True
+            return False
+
+    def offer(self, cost):
+        """Lower the incumbent to cost; True if it improved"""
+        with self.lock:
+            if cost < self.incumbent.value:
+                self.incumbent.value = cost
+                return True
+            return False
+
+
+def _worker(index, workers, shape, goal_code, heuristic, inboxes, replies, shared):
+    """Search loop of one HDA* worker, then answer parent lookups until told to stop"""
+    board = get_board(*shape)
+    transitions, slide = board.transitions, board.slide
+    h = get_heuristic(heuristic, goal_code, board)
+    inbox = inboxes[index]
+    frontier = BucketFrontier(tie_break='high_g')
+    # best_g[code] -> g tốt nhất đã biết, parents[code] -> mã của node cha
+    best_g = {}
+    parents = {}
+    outgoing = [[] for _ in range(workers)]
+    expanded = generated = 0
+
+    def flush(target):
+        batch = outgoing[target]
+        if batch:
+            outgoing[target] = []
+            shared.sent()
+            inboxes[target].put(('nodes', batch))
+
+    def accept(code, blank, g, parent):
+        if best_g.get(code, NO_SOLUTION) <= g:
+            return
+        best_g[code] = g
+        parents[code] = parent
+        if code == goal_code:
+            shared.offer(g)
+            return
+        f = g + h(code)
+        if f < shared.incumbent.value:
+            frontier.push(code, (blank, g), f, g)
+
+    def drain(block):
+        """Accept every waiting batch; with block, wait briefly for the first one"""
+        while True:
+            try:
+                message = inbox.get(timeout=IDLE_WAIT) if block else inbox.get_nowait()
+            except queue.Empty:
+                return
+            block = False
+            _, batch = message
+            shared.received(index)
+            for node in batch:
+                accept(*node)
+
+    while True:
+        drain(False)
+        count = 0
+        while frontier and count < POLL_INTERVAL:
+            code, (blank, g), f = frontier.pop()
+            if f >= shared.incumbent.value:
+                # Mọi node còn lại đều có f >= incumbent
+                frontier = BucketFrontier(tie_break='high_g')
+                break
+            if g > best_g[code]:
+                continue
+            expanded += 1
+            count += 1
+            parent = parents[code]
+            for _, new_blank in transitions[blank]:
+                next_code = slide(code, blank, new_blank)
+                if next_code == parent:
+                    continue
+                generated += 1
+                target = owner(next_code, workers)
+                if target == index:
+                    accept(next_code, new_blank, g + 1, code)
+                else:
+                    outgoing[target].append((next_code, new_blank, g + 1, code))
+                    if len(outgoing[target]) >= BATCH_SIZE:
+                        flush(target)
+
+        # Gửi cả các lô còn dở sau mỗi lượt, để node f thấp không nằm chờ trong
+        # bộ đệm trong khi worker sở hữu nó mở rộng các node tệ hơn
+        for target in range(workers):
+            flush(target)
+        if frontier:
+            continue
+        if shared.go_idle(index):
+            break
+        drain(True)
+
+    # Trả lời truy vấn con trỏ cha để dựng lại đường đi
+    while True:
+        message = inbox.get()
+        if message is None:
+            break
+        _, code = message
+        replies.put(parents.get(code))
+    replies.put(('stats', expanded, generated, len(best_g)))
+
+
+def hda_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, workers=None, stats=None):
+    """Hash-distributed A* (HDA*) over worker processes
+
+    workers defaults to the number of CPUs. heuristic is best given as a
+    registry name, which every worker resolves itself. Heuristic instances
+    only reach workers under the fork start method. The solution is
+    optimal for an admissible heuristic, like a_star_search.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal:
+        return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+
+    # Dựng hoặc nạp bảng của heuristic (pdb, additive_pdb) một lần ở đây: worker
+    # thừa hưởng instance qua fork hoặc nạp lại từ cache trên đĩa, thay vì mỗi
+    # worker cùng lúc dựng một bảng
+    get_heuristic(heuristic, goal.code, board)
+    workers = workers or os.cpu_count() or 1
+    shared = _Shared(workers)
+    inboxes = [Queue() for _ in range(workers)]
+    replies = Queue()
+    processes = [
+        Process(target=_worker, args=(index, workers, board.shape, goal.code, heuristic, inboxes, replies, shared),
+                daemon=True)
+        for index in range(workers)
+    ]
+    # Gửi node gốc trước khi chạy worker để không worker nào thấy "xong" ngay từ đầu
+    shared.sent()
+    inboxes[owner(initial.code, workers)].put(('nodes', [(initial.code, initial.blank, 0, None)]))
+    for process in processes:
+        process.start()
+    try:
+        # Chỉ hỏi con trỏ cha khi mọi worker đã rời vòng tìm kiếm
+        while shared.stopped.value < workers:
+            for index, process in enumerate(processes):
+                process.join(IDLE_WAIT)
+                if process.exitcode not in (None, 0):
+                    raise RuntimeError('HDA* worker %d exited with code %d' % (index, process.exitcode))
+
+        codes = None
+        if shared.incumbent.value != NO_SOLUTION:
+            # Đi ngược con trỏ cha từ đích, hỏi worker sở hữu từng trạng thái
+            codes = [goal.code]
+            while codes[-1] != initial.code:
+                inboxes[owner(codes[-1], workers)].put(('parent', codes[-1]))
+                codes.append(replies.get())
+            codes.reverse()
+
+        for inbox in inboxes:
+            inbox.put(None)
+        for _ in processes:
+            _, expanded, generated, nodes = replies.get()
+            if stats is not None:
+                stats.expanded += expanded
+                stats.generated += generated
+                stats.peak_nodes += nodes
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    if codes is None:
+        return None
+    return [board.decode(code) for code in codes]
@@ -0,0 +1,156 @@
+"""
+Module chứa BFS song song đồng bộ theo lớp trên không gian 8-puzzle đã xếp hạng
+
+Mỗi lớp BFS được chia thành các đoạn hạng liên tiếp cho một process pool. Hạng
+của lớp hiện tại và bitset "đã thăm" nằm trong shared memory nên worker không
+phải nhận lại chúng qua pickle; trong một lớp chỉ tiến trình chính ghi vào
+bitset, các worker chỉ đọc để lọc trước các trạng thái con đã thăm.
+
+Trùng lặp giữa các worker (hai node cha cùng sinh một con) được xử lý ở ranh
+giới lớp: tiến trình chính gộp kết quả, đánh dấu bitset và ghi nước đi tới từng
+hạng mới, rồi mới phát lớp kế tiếp.
+"""
+import os
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from models.bitset import Bitset
+from models.move_table import MoveTable
+from models.puzzle_state import DEFAULT_BOARD, TRANSITIONS, PuzzleState, common_board, decode_state, find_blank, slide
+from models.ranking import STATE_COUNT, parity, rank, unrank
+from algorithms.compact_bfs import trace_back
+
+# Số hạng tối thiểu trong một tác vụ gửi cho worker
+CHUNK_SIZE = 2048
+
+# Lớp nhỏ hơn ngưỡng này được mở rộng ngay trong tiến trình chính
+SERIAL_LAYER = 4096
+
+# Trạng thái phía worker, gắn vào shared memory một lần trong initializer
+_worker = {}
+
+
+def _expand(ranks, bits, tile_parity):
+    """Unvisited children of some ranks as (ranks, moves), without duplicates"""
+    children = array('I')
+    moves = array('B')
+    seen = set()
+    for index in ranks:
+        code = unrank(index, tile_parity)
+        blank = find_blank(code)
+        for move, new_blank in TRANSITIONS[blank]:
+            child = rank(slide(code, blank, new_blank))
+            if (bits[child >> 3] >> (child & 7)) & 1 or child in seen:
+                continue
+            seen.add(child)
+            children.append(child)
+            moves.append(move)
+    return children, moves
+
+
+def _attach(frontier_name, visited_name, tile_parity):
+    """Pool initializer: map the shared frontier and visited bitset"""
+    frontier = SharedMemory(name=frontier_name)
+    visited = SharedMemory(name=visited_name)
+    _worker.update(frontier=frontier, visited=visited, parity=tile_parity)
+
+
+def _expand_chunk(bounds):
+    start, end = bounds
+    # View tạm thời: không giữ export nào trên shared memory giữa các tác vụ
+    ranks = _worker['frontier'].buf[start * 4:end * 4].cast('I')
+    children, moves = _expand(ranks, _worker['visited'].buf, _worker['parity'])
+    ranks.release()
+    return children.tobytes(), moves.tobytes()
+
+
+def parallel_bfs_layers(start_code, predecessors, workers=None):
+    """Yield (depth, ranks) for every BFS layer from start_code
+
+    Like compact_bfs.bfs_layers, the move reaching each new rank is stored in
+    predecessors. workers defaults to the number of CPUs; with one worker, or
+    for small layers, expansion runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    tile_parity = parity(start_code)
+    frontier_memory = SharedMemory(create=True, size=STATE_COUNT * 4)
+    visited_memory = SharedMemory(create=True, size=(STATE_COUNT + 7) >> 3)
+    frontier = frontier_memory.buf.cast('I')
+    visited = Bitset(STATE_COUNT, visited_memory.buf)
+    visited.clear()
+    pool = None
+    try:
+        if workers > 1:
+            pool = Pool(workers, _attach, (frontier_memory.name, visited_memory.name, tile_parity))
+
+        start_index = rank(start_code)
+        visited.add(start_index)
+        ranks = array('I', [start_index])
+        depth = 0
+        while ranks:
+            yield depth, ranks
+            if pool is None or len(ranks) < SERIAL_LAYER:
+                results = [_expand(ranks, visited.data, tile_parity)]
+            else:
+                count = len(ranks)
+                frontier[:count] = ranks
+                chunk = max(CHUNK_SIZE, -(-count // (workers * 4)))
+                results = []
+                for children, moves in pool.imap(_expand_chunk, [
+                    (start, min(start + chunk, count)) for start in range(0, count, chunk)
+                ]):
+                    results.append((array('I', children), array('B', moves)))
+
+            # Ranh giới lớp: loại trùng giữa các đoạn và đánh dấu đã thăm
+            next_ranks = array('I')
+            for children, moves in results:
+                for child, move in zip(children, moves):
+                    if not visited.test_and_set(child):
+                        predecessors[child] = move
+                        next_ranks.append(child)
+            ranks = next_ranks
+            depth += 1
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        frontier.release()
+        visited.data = None
+        frontier_memory.close()
+        frontier_memory.unlink()
+        visited_memory.close()
+        visited_memory.unlink()
+
+
+def parallel_bfs_codes(start_code, goal_code, workers=None):
+    """Shortest path as a list of codes, or None if goal_code is unreachable"""
+    if parity(start_code) != parity(goal_code):
+        return None
+
+    predecessors = MoveTable(STATE_COUNT)
+    goal_index = rank(goal_code)
+    layers = parallel_bfs_layers(start_code, predecessors, workers)
+    try:
+        for _, ranks in layers:
+            if goal_index in ranks:
+                return trace_back(goal_code, start_code, predecessors)
+    finally:
+        layers.close()
+    return None
+
+
+def parallel_bfs_solve(initial_state, goal_state, workers=None):
+    """Breadth-First Search with each layer expanded by a process pool
+
+    Searches the ranked 3x3 space like bfs_solve(..., compact=True); worth
+    it for hard instances, whose middle layers hold tens of thousands of states.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    if common_board(initial, goal) is not DEFAULT_BOARD:
+        raise ValueError('Parallel BFS needs the 3x3 board, got %dx%d' % initial.board.shape)
+
+    if initial == goal:
+        return [initial.state]
+    codes = parallel_bfs_codes(initial.code, goal.code, workers)
+    return [decode_state(code) for code in codes] if codes else None
@@ -0,0 +1,337 @@
+"""
+Module chứa cơ sở dữ liệu mẫu cộng được (additive disjoint pattern database)
+
+Các ô số được chia thành các nhóm rời nhau (pattern). Với mỗi pattern, một lượt
+BFS ngược từ đích trong không gian trừu tượng (vị trí các ô của pattern + ô
+trống, các ô khác coi như giống nhau) tính số nước đi tối thiểu của riêng các ô
+trong pattern; nước đi của ô ngoài pattern có chi phí 0. Vì mỗi nước đi chỉ dời
+một ô số nên tổng giá trị của các pattern vẫn là cận dưới chấp nhận được.
+
+Bảng không lưu khoảng cách mà lưu phần dư so với Manhattan của pattern (luôn
+chẵn), chia 2 và chặn ở 15 để mỗi vị trí chỉ tốn 4 bit. Các vị trí được xếp hạng
+như hoán vị k phần tử của n ô, nên pattern 6 ô của 15-puzzle chỉ cần
+16!/10! / 2 byte (khoảng 2.9 MB).
+
+BFS được vector hóa bằng numpy theo từng lớp chi phí: trong một lớp, các nước
+đi chi phí 0 được lan hết trước khi sinh lớp kế tiếp. numpy chỉ được nạp khi
+dựng bảng, nên việc tra bảng đã lưu trên đĩa không cần đến nó.
+"""
+from models.nibble_table import NibbleTable
+from models.puzzle_state import board_of
+from utils.table_store import TableFormatError, load_table, save_table, table_path
+
+TABLE_KIND = 'pattern'
+
+# Ô không thuộc pattern trong trạng thái đích trừu tượng (tên file và header bảng)
+DONT_CARE = 255
+
+# Phần dư lớn nhất lưu được trong 4 bit
+MAX_EXCESS = 15
+
+# PARTITIONS[(rows, cols)][name] -> các nhóm ô của trạng thái đích; ô trống của
+# đích được bỏ khỏi nhóm chứa nó, các ô số trong một nhóm tạo thành một pattern
+PARTITIONS = {
+    (3, 3): {
+        '44': ((0, 1, 2, 3), (4, 5, 6, 7, 8)),
+    },
+    (4, 4): {
+        # Hai khối 3x2 bên trái/phải và hàng cuối
+        '663': ((0, 1, 4, 5, 8, 9), (2, 3, 6, 7, 10, 11), (12, 13, 14, 15)),
+    },
+}
+
+# 24-puzzle không có phân hoạch mặc định: pattern 6 ô của nó vượt MAX_BUILD_BYTES
+DEFAULT_PARTITIONS = {(3, 3): '44', (4, 4): '663'}
+
+# Số ô tối đa của một pattern khi tự chia cho các kích thước bàn khác
+DEFAULT_PATTERN_SIZE = 6
+
+# Số byte cho mỗi trạng thái trừu tượng (vị trí pattern, ô trống) của các mảng
+# lớp BFS và bản sao của np.unique; đo được khoảng 11 byte trên 15-puzzle
+BUILD_BYTES_PER_STATE = 16
+
+# Bộ nhớ ước lượng tối đa (byte) khi dựng một pattern: pattern 6 ô của 15-puzzle
+# (khoảng 1.5 GB) còn dựng được, pattern 7 ô của nó hay 6 ô của 24-puzzle thì không
+MAX_BUILD_BYTES = 2 << 30
+
+
+def partition_cells(board, partition=None):
+    """Cell groups of a named partition, or the board's default one
+
+    Boards without a named default are cut into row-major chunks of at most
+    DEFAULT_PATTERN_SIZE tiles.
+    """
+    named = PARTITIONS.get(board.shape, {})
+    if partition is None:
+        partition = DEFAULT_PARTITIONS.get(board.shape)
+        if partition is None:
+            cells = tuple(range(board.cells))
+            return tuple(
+                cells[start:start + DEFAULT_PATTERN_SIZE]
+                for start in range(0, board.cells, DEFAULT_PATTERN_SIZE)
+            )
+    if isinstance(partition, str):
+        if partition not in named:
+            raise ValueError('Unknown partition %r for %dx%d, expected one of %s'
+                             % ((partition,) + board.shape + (', '.join(named) or 'none',)))
+        return named[partition]
+    return tuple(tuple(group) for group in partition)
+
+
+def _count_placements(cells, size):
+    """Number of ordered placements of size distinct tiles on cells cells"""
+    count = 1
+    for i in range(size):
+        count *= cells - i
+    return count
+
+
+def _bitset_bytes(cells, size):
+    """Bytes of the visited bitset over (placement, blank) for size placements"""
+    return (size * cells + 7) >> 3
+
+
+def build_bytes(board, tiles):
+    """Estimated peak memory of PatternDatabase.build: bitset plus BFS layer arrays"""
+    states = _count_placements(board.cells, len(tiles)) * board.cells
+    return _bitset_bytes(board.cells, states // board.cells) + states * BUILD_BYTES_PER_STATE
+
+
+def _check_buildable(board, tiles):
+    needed = build_bytes(board, tiles)
+    if needed > MAX_BUILD_BYTES:
+        raise ValueError('Pattern of %d tiles on %dx%d needs about %d MB to build, limit is %d MB'
+                         % ((len(tiles),) + board.shape + (needed >> 20, MAX_BUILD_BYTES >> 20)))
+
+
+def _rank_positions(positions, cells):
+    """Vectorized rank of rows of distinct cells, matching PatternDatabase.rank"""
+    import numpy as np
+    positions = positions.astype(np.int64)
+    ranks = np.zeros(len(positions), dtype=np.int64)
+    for i in range(positions.shape[1]):
+        digit = positions[:, i].copy()
+        for j in range(i):
+            digit -= positions[:, j] < positions[:, i]
+        ranks = ranks * (cells - i) + digit
+    return ranks
+
+
+class PatternDatabase:
+    """Halved excess over Manhattan distance for every placement of one pattern"""
+
+    def __init__(self, board, goal_state, tiles, excess):
+        self.board = board
+        self.goal_state = goal_state
+        # Các ô số của pattern theo thứ tự tăng dần (thứ tự xếp hạng)
+        self.tiles = tiles
+        self.size = _count_placements(board.cells, len(tiles))
+        self.excess = excess
+
+    @staticmethod
+    def abstract_goal(goal_state, tiles):
+        """Goal with the tiles outside the pattern replaced by DONT_CARE"""
+        kept = set(tiles) | {0}
+        return [[tile if tile in kept else DONT_CARE for tile in row] for row in goal_state]
+
+    @classmethod
+    def build(cls, goal_state, tiles):
+        """Backward 0-1 BFS from the goal over (pattern positions, blank)"""
+        import numpy as np
+        board = board_of(goal_state)
+        cells, cols = board.cells, board.cols
+        tiles = tuple(sorted(tiles))
+        goal_positions = {tile: i * cols + j for i, row in enumerate(goal_state) for j, tile in enumerate(row)}
+        size = _count_placements(cells, len(tiles))
+        _check_buildable(board, tiles)
+
+        # neighbours[blank, k] -> ô trống mới sau nước đi thứ k, -1 nếu không có
+        neighbours = np.full((cells, 4), -1, dtype=np.int64)
+        for blank, moves in enumerate(board.transitions):
+            for k, (_, new_blank) in enumerate(moves):
+                neighbours[blank, k] = new_blank
+        # manhattan[i, pos] -> khoảng cách Manhattan của ô thứ i trong pattern đặt tại pos
+        manhattan = np.array([
+            [abs(pos // cols - goal_positions[tile] // cols) + abs(pos % cols - goal_positions[tile] % cols)
+             for pos in range(cells)]
+            for tile in tiles
+        ], dtype=np.int64)
+        columns = np.arange(len(tiles))
+
+        visited = np.zeros(_bitset_bytes(cells, size), dtype=np.uint8)
+        excess = np.full(size, DONT_CARE, dtype=np.uint8)
+
+        def keep_unvisited(positions, blanks):
+            """Drop duplicates and visited states, mark the rest visited"""
+            index = _rank_positions(positions, cells) * cells + blanks
+            index, first = np.unique(index, return_index=True)
+            fresh = (visited[index >> 3] >> (index & 7).astype(np.uint8)) & 1 == 0
+            index, first = index[fresh], first[fresh]
+            np.bitwise_or.at(visited, index >> 3, (1 << (index & 7)).astype(np.uint8))
+            return positions[first], blanks[first]
+
+        def successors(positions, blanks, pushes):
+            """States one blank move away: pushes=False keeps the pattern, True moves one of its tiles"""
+            next_positions, next_blanks = [], []
+            for k in range(4):
+                new_blank = neighbours[blanks, k]
+                hits = positions == new_blank[:, None]
+                selected = (new_blank >= 0) & (hits.any(axis=1) == pushes)
+                moved = positions[selected].copy()
+                if pushes:
+                    # Ô của pattern bị đẩy vào vị trí ô trống cũ
+                    moved[hits[selected]] = blanks[selected]
+                next_positions.append(moved)
+                next_blanks.append(new_blank[selected].astype(np.uint8))
+            return np.concatenate(next_positions), np.concatenate(next_blanks)
+
+        positions, blanks = keep_unvisited(
+            np.array([[goal_positions[tile] for tile in tiles]], dtype=np.uint8),
+            np.array([goal_positions[0]], dtype=np.uint8)
+        )
+        cost = 0
+        while len(blanks):
+            # Lan các nước đi chi phí 0 (ô trống đi qua ô ngoài pattern)
+            layer_positions, layer_blanks = [positions], [blanks]
+            while len(blanks):
+                positions, blanks = keep_unvisited(*successors(positions, blanks, False))
+                layer_positions.append(positions)
+                layer_blanks.append(blanks)
+            positions = np.concatenate(layer_positions)
+            blanks = np.concatenate(layer_blanks)
+
+            # Lần đầu một vị trí pattern xuất hiện là với chi phí nhỏ nhất
+            ranks = _rank_positions(positions, cells)
+            ranks, first = np.unique(ranks, return_index=True)
+            new = excess[ranks] == DONT_CARE
+            ranks = ranks[new]
+            distance = manhattan[columns, positions[first[new]]].sum(axis=1)
+            excess[ranks] = np.minimum((cost - distance) >> 1, MAX_EXCESS)
+
+            positions, blanks = keep_unvisited(*successors(positions, blanks, True))
+            cost += 1
+
+        # Vị trí không tới được (pattern gồm mọi ô số) không bao giờ được tra
+        excess[excess == DONT_CARE] = 0
+        if size & 1:
+            excess = np.append(excess, np.uint8(0))
+        packed = bytearray((excess[0::2] | (excess[1::2] << 4)).tobytes())
+        return cls(board, goal_state, tiles, NibbleTable(size, packed))
+
+    @classmethod
+    def load(cls, goal_state, tiles, directory=None):
+        """Memory-map the cached table for this pattern, or return None if absent"""
+        tiles = tuple(sorted(tiles))
+        table = load_table(TABLE_KIND, cls.abstract_goal(goal_state, tiles), directory)
+        if table is None:
+            return None
+        board = board_of(goal_state)
+        size = _count_placements(board.cells, len(tiles))
+        if table.entry_count('excess') != size or table.entry_bits('excess') != 4:
+            raise TableFormatError('%s: wrong number of entries' % table.path)
+        return cls(board, goal_state, tiles, NibbleTable(size, table.sections['excess']))
+
+    def save(self, directory=None):
+        """Write the table to the cache directory"""
+        goal = self.abstract_goal(self.goal_state, self.tiles)
+        save_table(table_path(TABLE_KIND, goal, directory), TABLE_KIND, goal, {
+            'excess': (4, self.size, self.excess.data),
+        })
+
+    def rank(self, positions):
+        """Rank of the pattern's placement; positions[tile] is the cell of tile"""
+        cells = self.board.cells
+        used = 0
+        index = 0
+        for i, tile in enumerate(self.tiles):
+            pos = positions[tile]
+            index = index * (cells - i) + pos - (used & ((1 << pos) - 1)).bit_count()
+            used |= 1 << pos
+        return index
+
+    def __getitem__(self, positions):
+        """Stored halved excess for the placement given by positions[tile]"""
+        index = self.rank(positions)
+        return (self.excess.data[index >> 1] >> ((index & 1) << 2)) & 15
+
+
+def _load_cached(goal_state, tiles):
+    try:
+        return PatternDatabase.load(goal_state, tiles)
+    except (OSError, TableFormatError):
+        return None
+
+
+def _build_and_save(goal_state, tiles, use_cache):
+    database = PatternDatabase.build(goal_state, tiles)
+    if use_cache:
+        try:
+            database.save()
+        except OSError:
+            pass
+    return database
+
+
+class AdditivePatternDatabase:
+    """Disjoint patterns covering every tile; their values add up to a lower bound"""
+
+    def __init__(self, goal_state, patterns):
+        self.board = board_of(goal_state)
+        self.goal_state = goal_state
+        self.patterns = patterns
+        cols = self.board.cols
+        goal_positions = {tile: i * cols + j for i, row in enumerate(goal_state) for j, tile in enumerate(row)}
+        # manhattan[tile][pos] -> khoảng cách Manhattan của tile đặt tại pos
+        self.manhattan = tuple(
+            tuple(abs(pos // cols - goal_positions[tile] // cols) + abs(pos % cols - goal_positions[tile] % cols)
+                  for pos in range(self.board.cells)) if tile else (0,) * self.board.cells
+            for tile in range(self.board.cells)
+        )
+
+    def distance(self, positions):
+        """Admissible estimate for the state whose tile t lies at positions[t]"""
+        manhattan = self.manhattan
+        total = 0
+        for tile in range(1, len(positions)):
+            total += manhattan[tile][positions[tile]]
+        for pattern in self.patterns:
+            total += 2 * pattern[positions]
+        return total
+
+
+_DATABASES = {}
+
+
+def get_pattern_database(goal_state, partition=None, use_cache=True):
+    """Additive pattern database for goal_state
+
+    Each pattern is loaded from the on-disk cache when present, otherwise built
+    and saved there; patterns are keyed by their abstract goal, so partitions
+    sharing a pattern share its file. ValueError is raised before anything is
+    built if a missing pattern is estimated to need more than MAX_BUILD_BYTES.
+    """
+    board = board_of(goal_state)
+    groups = partition_cells(board, partition)
+    goal = tuple(tile for row in goal_state for tile in row)
+    key = (goal, board, groups)
+    database = _DATABASES.get(key)
+    if database is not None:
+        return database
+
+    pattern_tiles = [tuple(sorted(goal[pos] for pos in group if goal[pos])) for group in groups]
+    pattern_tiles = [tiles for tiles in pattern_tiles if tiles]
+    patterns = [_load_cached(goal_state, tiles) if use_cache else None for tiles in pattern_tiles]
+    # Từ chối trước khi dựng bất kỳ pattern nào, để không tốn công cho một phân hoạch hỏng
+    for tiles, database in zip(pattern_tiles, patterns):
+        if database is None:
+            _check_buildable(board, tiles)
+    patterns = [
+        database if database is not None else _build_and_save(goal_state, tiles, use_cache)
+        for tiles, database in zip(pattern_tiles, patterns)
+    ]
+    covered = sorted(tile for pattern in patterns for tile in pattern.tiles)
+    if covered != list(range(1, board.cells)):
+        raise ValueError('Partition must cover every tile exactly once, got tiles %s' % covered)
+    database = AdditivePatternDatabase(goal_state, patterns)
+    _DATABASES[key] = database
+    return database
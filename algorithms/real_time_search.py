@@ -0,0 +1,182 @@
+"""
+Module chứa thuật toán tìm kiếm thời gian thực LRTA* (Learning Real-Time A*)
+
+Mỗi bước chỉ nhìn trước một độ sâu giới hạn trong ngân sách thời gian cố định,
+chọn nước đi tốt nhất rồi cam kết đi luôn; giá trị h của trạng thái vừa rời đi
+được nâng lên theo kết quả nhìn trước. Các giá trị h đã học được lưu theo trạng
+thái đích (trong tiến trình và trong thư mục cache bảng), nên những lần chạy sau
+với cùng đích đi thẳng hơn.
+"""
+import sys
+import time
+from array import array
+from models.puzzle_state import DEFAULT_BOARD, OPPOSITE, PuzzleState, common_board
+from algorithms.heuristics import DEFAULT_HEURISTIC, get_heuristic
+from utils.table_store import TableFormatError, load_table, save_table, table_path
+
+TABLE_KIND = 'lrta'
+
+INFINITY = float('inf')
+
+
+class _OutOfTime(Exception):
+    """Raised inside a lookahead once the step budget is spent"""
+
+
+class LearnedHeuristic:
+    """h-values learned by LRTA* for one goal
+
+    Values start from an admissible heuristic and are only ever raised to a
+    lookahead lower bound, so they stay admissible whatever base heuristic
+    they are later combined with.
+    """
+
+    def __init__(self, goal_code, values=None, board=DEFAULT_BOARD):
+        self.goal_code = goal_code
+        self.board = board
+        self.values = values if values is not None else {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, code, base):
+        """Learned value of code, or base if nothing better was learned"""
+        learned = self.values.get(code)
+        return base if learned is None or learned < base else learned
+
+    def update(self, code, value):
+        if value > self.values.get(code, 0):
+            self.values[code] = value
+
+    @classmethod
+    def load(cls, goal_code, directory=None, board=DEFAULT_BOARD):
+        """Load the cached table for goal_code, or return None if absent"""
+        table = load_table(TABLE_KIND, board.decode(goal_code), directory)
+        if table is None:
+            return None
+        codes = array('Q', bytes(table.sections['codes']))
+        values = array('H', bytes(table.sections['values']))
+        if len(codes) != table.entry_count('codes') or len(codes) != len(values):
+            raise TableFormatError('%s: wrong number of entries' % table.path)
+        if sys.byteorder == 'big':
+            codes.byteswap()
+            values.byteswap()
+        return cls(goal_code, dict(zip(codes, values)), board)
+
+    def save(self, directory=None):
+        """Write the learned values to the cache directory"""
+        codes = array('Q', self.values.keys())
+        values = array('H', self.values.values())
+        if sys.byteorder == 'big':
+            codes.byteswap()
+            values.byteswap()
+        goal_state = self.board.decode(self.goal_code)
+        save_table(table_path(TABLE_KIND, goal_state, directory), TABLE_KIND, goal_state, {
+            'codes': (64, len(codes), codes),
+            'values': (16, len(values), values),
+        })
+
+
+_LEARNED = {}
+
+
+def get_learned(goal_code, use_cache=True, board=DEFAULT_BOARD):
+    """Learned h-values for goal_code, shared by every run in the process"""
+    learned = _LEARNED.get((goal_code, board))
+    if learned is not None:
+        return learned
+    if use_cache:
+        try:
+            learned = LearnedHeuristic.load(goal_code, board=board)
+        except (OSError, TableFormatError):
+            learned = None
+    if learned is None:
+        learned = LearnedHeuristic(goal_code, board=board)
+    _LEARNED[(goal_code, board)] = learned
+    return learned
+
+
+def lrta_star_search(initial_state, goal_state, heuristic=DEFAULT_HEURISTIC, lookahead=4,
+                     step_budget=0.001, max_moves=5000, use_cache=True):
+    """Learning Real-Time A* (LRTA*)
+
+    Generator yielding the board after every committed move. Each move is
+    chosen by a depth-limited lookahead, deepened one level at a time while
+    the step_budget (seconds) lasts, up to lookahead levels; a depth cut
+    short by the budget is discarded for the last completed one. The learned
+    h-values persist across runs on the same goal.
+    """
+    initial = PuzzleState(initial_state)
+    goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+
+    if initial == goal or board.parity(initial.code) != board.parity(goal.code):
+        return
+
+    # Bảng lưu mã 64 bit nên bàn lớn hơn (24-puzzle) chỉ học trong tiến trình
+    if board.code_bits > 64:
+        use_cache = False
+    h = get_heuristic(heuristic, goal.code, board)
+    learned = get_learned(goal.code, use_cache, board)
+    transitions, slide = board.transitions, board.slide
+
+    def estimate(code):
+        return learned.get(code, h(code))
+
+    # Hạn chót của bước hiện tại; None khi độ sâu đang xét phải chạy trọn
+    deadline = None
+
+    def minimin(code, blank, g, depth, last_move):
+        """Lowest g + h over the frontier of a depth-limited search
+
+        Interior nodes bound the result from below by their own g + h, so
+        values learned on states inside the lookahead are not ignored.
+        """
+        if code == goal.code:
+            return g
+        own = g + estimate(code)
+        if not depth:
+            return own
+        if deadline is not None and time.monotonic() >= deadline:
+            raise _OutOfTime
+        best = INFINITY
+        for move, new_blank in transitions[blank]:
+            if move == OPPOSITE[last_move]:
+                continue
+            value = minimin(slide(code, blank, new_blank), new_blank, g + 1, depth - 1, move)
+            if value < best:
+                best = value
+        return best if best > own else own
+
+    code, blank = initial.code, initial.blank
+    try:
+        for _ in range(max_moves):
+            step_deadline = time.monotonic() + step_budget
+            choice = None
+            for depth in range(1, lookahead + 1):
+                # Độ sâu 1 luôn chạy trọn để bước nào cũng có nước đi
+                deadline = step_deadline if choice is not None else None
+                values = []
+                try:
+                    for move, new_blank in transitions[blank]:
+                        next_code = slide(code, blank, new_blank)
+                        values.append((minimin(next_code, new_blank, 1, depth - 1, move), next_code, new_blank))
+                except _OutOfTime:
+                    break
+                choice = min(values)
+                if time.monotonic() >= step_deadline:
+                    break
+
+            value, next_code, new_blank = choice
+            # Học: h của trạng thái vừa rời đi không thể nhỏ hơn kết quả nhìn trước
+            learned.update(code, value)
+            code, blank = next_code, new_blank
+            yield board.decode(code)
+            if code == goal.code:
+                return
+    finally:
+        if use_cache:
+            try:
+                learned.save()
+            except OSError:
+                pass
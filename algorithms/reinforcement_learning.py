@@ -58,15 +58,16 @@ def q_learning(initial_state, goal_state, alpha=0.1, gamma=0.9, epsilon_start=0.
 
     def apply_action(state, action):
         state_copy = [row[:] for row in state]
-        for i in range(3):
-            for j in range(3):
+        rows, cols = len(state), len(state[0])
+        for i in range(rows):
+            for j in range(cols):
                 if state_copy[i][j] == 0:
                     x, y = i, j
         dx = {'up': -1, 'down': 1, 'left': 0, 'right': 0}
         dy = {'up': 0, 'down': 0, 'left': -1, 'right': 1}
         nx, ny = x + dx[action], y + dy[action]
 
-        if 0 <= nx < 3 and 0 <= ny < 3:
+        if 0 <= nx < rows and 0 <= ny < cols:
             state_copy[x][y], state_copy[nx][ny] = state_copy[nx][ny], state_copy[x][y]
             return state_copy
         return state
@@ -0,0 +1,43 @@
+"""
+Module chứa bộ đếm thống kê dùng chung cho các thuật toán tìm kiếm
+
+Solver nào nhận tham số stats= sẽ ghi số liệu vào đối tượng SearchStats được
+truyền vào, để giao diện và các script benchmark so sánh các thuật toán.
+"""
+
+
+class SearchStats:
+    """Counters filled in by solvers that accept stats="""
+
+    FIELDS = ('expanded', 'generated', 'reexpanded', 'evictions', 'pruned', 'peak_nodes', 'iterations')
+
+    def __init__(self):
+        self.expanded = 0
+        self.generated = 0
+        # Số node được mở rộng lại (IDA*/RBFS lặp lại, SMA* sinh lại node đã quên)
+        self.reexpanded = 0
+        self.evictions = 0
+        # Số cây con bị bỏ qua nhờ bảng chuyển vị (transposition table)
+        self.pruned = 0
+        self.peak_nodes = 0
+        self.iterations = 0
+        # Kết luận của solver: 'solved', 'unsolvable' hoặc 'depth_limit' (None nếu không ghi)
+        self.verdict = None
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def summary(self):
+        """Verdict and non-zero counters as 'name: value' pairs joined by commas"""
+        parts = ['verdict: %s' % self.verdict.replace('_', ' ')] if self.verdict else []
+        parts.extend(
+            '%s: %d' % (field.replace('_', ' '), value)
+            for field, value in self.as_dict().items() if value
+        )
+        return ', '.join(parts)
+
+    def __repr__(self):
+        fields = ', '.join('%s=%d' % item for item in self.as_dict().items())
+        if self.verdict:
+            fields += ', verdict=%r' % self.verdict
+        return 'SearchStats(%s)' % fields
@@ -1,32 +1,76 @@
 """
 Module chứa các thuật toán tìm kiếm không có thông tin (Uninformed Search)
 """
-from models.puzzle_state import PuzzleState
-from collections import deque
+from models.puzzle_state import DEFAULT_BOARD, PuzzleState, common_board, decode_state
+from models.node_pool import NodePool
+from models.ranking import state_set
+from algorithms.compact_bfs import compact_bfs
+from algorithms.frontier_search import frontier_bfs_solve
+from algorithms.parallel_bfs import parallel_bfs_solve
+from algorithms.frontier import BucketFrontier
+from algorithms.cost_models import DEFAULT_COST_MODEL, get_cost_model
+from algorithms.search_stats import SearchStats
 
-def bfs_solve(initial_state, goal_state):
-    """Breadth-First Search"""
+# Số trạng thái tối đa trong bảng chuyển vị của IDDFS (đủ cho toàn bộ bàn 3x3)
+TRANSPOSITION_LIMIT = 1 << 20
+
+def _compact_codes(initial, goal, board):
+    """compact_bfs for the 3x3 board, whose states can be ranked"""
+    if board is not DEFAULT_BOARD:
+        raise ValueError('compact=True needs the 3x3 board, got %dx%d' % board.shape)
+    return compact_bfs(initial.code, goal.code)
+
+def bfs_solve(initial_state, goal_state, compact=False, frontier=False, workers=None):
+    """Breadth-First Search
+
+    With compact=True only a visited bit and a 2-bit predecessor move are kept
+    per ranked state, and the path is rebuilt backward from the goal.
+    With frontier=True no visited set is kept at all (see frontier_bfs_solve).
+    workers > 1 runs the compact search with each layer split across a
+    process pool (see parallel_bfs_solve). compact=True and workers only
+    cover the 3x3 board.
+    """
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
-    queue = deque([initial])
-    visited = {initial}
+    if workers is not None and workers > 1:
+        return parallel_bfs_solve(initial_state, goal_state, workers)
+        
+    if compact:
+        codes = _compact_codes(initial, goal, board)
+        return [decode_state(code) for code in codes] if codes else None
+        
+    if frontier:
+        return frontier_bfs_solve(initial_state, goal_state)
+        
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+        
+    # Node pool được cấp phát đúng theo thứ tự FIFO nên nó chính là hàng đợi
+    pool = NodePool(board)
+    pool.add(initial.code, initial.blank)
+    visited = state_set(board, [initial.code])
+    codes, blanks, depths = pool.codes, pool.blanks, pool.g
+    transitions, slide = board.transitions, board.slide
+    head = 0
     
-    while queue:
-        current = queue.popleft()
+    while head < len(pool):
+        code, blank, g = codes[head], blanks[head], depths[head]
         
-        for move in current.get_valid_moves():
-            next_state = current.make_move(move)
+        for move, new_blank in transitions[blank]:
+            next_code = slide(code, blank, new_blank)
             
-            if next_state.state == goal.state:
-                return next_state.get_states()
+            if next_code == goal.code:
+                return pool.get_states(pool.add(next_code, new_blank, head, move, g + 1))
+                
+            if visited.add_new(next_code):
+                pool.add(next_code, new_blank, head, move, g + 1)
                 
-            if next_state not in visited:
-                visited.add(next_state)
-                queue.append(next_state)
+        head += 1
                 
     return None
 
@@ -34,12 +78,16 @@ def dfs_solve(initial_state, goal_state):
     """Depth-First Search"""
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+        
     stack = [initial]
-    visited = {initial}
+    visited = state_set(board, [initial.code])
     
     while stack:
         current = stack.pop()
@@ -47,68 +95,148 @@ def dfs_solve(initial_state, goal_state):
         for move in current.get_valid_moves():
             next_state = current.make_move(move)
             
-            if next_state.state == goal.state:
+            if next_state == goal:
                 return next_state.get_states()
                 
-            if next_state not in visited:
-                visited.add(next_state)
+            if next_state.code not in visited:
+                visited.add(next_state.code)
                 stack.append(next_state)
                 
     return None
 
-def ucs_solve(initial_state, goal_state):
-    """Uniform Cost Search"""
+def ucs_solve(initial_state, goal_state, compact=False, cost_model=DEFAULT_COST_MODEL, stats=None):
+    """Uniform Cost Search
+
+    cost_model names a registered CostModel (see algorithms.cost_models) or is
+    an instance. Costs are small positive integers, so the frontier is a Dial
+    bucket queue with O(1) push and pop. With unit costs, compact=True runs
+    the same ranked-space BFS as bfs_solve(..., compact=True).
+    """
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
+    board = common_board(initial, goal)
+    costs = get_cost_model(cost_model, board)
     
-    if initial.state == goal.state:
+    if initial == goal:
         return [initial.state]
         
-    queue = [(0, initial)]
-    visited = {initial}
+    if compact:
+        if not costs.unit:
+            raise ValueError('compact=True needs unit move costs, got %r' % costs.name)
+        codes = _compact_codes(initial, goal, board)
+        return [decode_state(code) for code in codes] if codes else None
+        
+    if board.parity(initial.code) != board.parity(goal.code):
+        return None
+        
+    transitions, slide = board.transitions, board.slide
+    bits, mask = board.tile_bits, board.tile_mask
+    move_costs = costs.costs
+    pool = NodePool(board)
+    frontier = BucketFrontier(tie_break='fifo')
+    frontier.push(initial.code, pool.add(initial.code, initial.blank), 0)
+    explored = state_set(board)
+    blanks = pool.blanks
     
-    while queue:
-        cost, current = queue.pop(0)
+    while frontier:
+        code, index, cost = frontier.pop()
         
-        if current.state == goal.state:
-            return current.get_states()
+        if code == goal.code:
+            if stats is not None:
+                stats.peak_nodes = len(pool)
+            return pool.get_states(index)
             
-        for move in current.get_valid_moves():
-            next_state = current.make_move(move)
+        explored.add(code)
+        if stats is not None:
+            stats.expanded += 1
+        blank = blanks[index]
+        
+        for move, new_blank in transitions[blank]:
+            next_code = slide(code, blank, new_blank)
             
-            if next_state not in visited:
-                visited.add(next_state)
-                queue.append((next_state.cost, next_state))
-                queue.sort(key=lambda x: x[0])
+            if next_code in explored:
+                continue
+            tile = (code >> (new_blank * bits)) & mask
+            new_cost = cost + move_costs[move][tile]
+            if next_code in frontier and frontier.priority(next_code) <= new_cost:
+                continue
+            frontier.push(next_code, pool.add(next_code, new_blank, index, move, new_cost), new_cost)
+            if stats is not None:
+                stats.generated += 1
                 
     return None
 
-def iddfs_solve(initial_state, goal_state):
-    """Iterative Deepening Depth-First Search"""
+def iddfs_solve(initial_state, goal_state, max_depth=None, stats=None, table_size=TRANSPOSITION_LIMIT):
+    """Iterative Deepening Depth-First Search
+
+    The depth limit grows up to max_depth, by default the board's known
+    bound (31 moves on 3x3, see Board.depth_bound). States already on the
+    current path are skipped. A transposition table keeps, for up to
+    table_size states, the most remaining depth they failed with, and cuts
+    later visits that have no more depth left. A table entry is never
+    wrong: a path it misses would loop back through an ancestor, and a
+    shorter solution would then have ended an earlier iteration.
+    Returns None if there is no solution. stats.verdict is then
+    'unsolvable' (checked by parity) or 'depth_limit'.
+    """
     initial = PuzzleState(initial_state)
     goal = PuzzleState(goal_state)
     
-    if initial.state == goal.state:
+    board = common_board(initial, goal)
+    
+    if stats is None:
+        stats = SearchStats()
+    if initial == goal:
+        stats.verdict = 'solved'
         return [initial.state]
+    if board.parity(initial.code) != board.parity(goal.code):
+        stats.verdict = 'unsolvable'
+        return None
+    if max_depth is None:
+        max_depth = board.depth_bound(goal.blank)
         
-    def dls(node, depth):
-        if depth == 0:
-            return None if node.state != goal.state else [node.state]
+    transitions, slide = board.transitions, board.slide
+    goal_code = goal.code
+    # failed[code] -> số bước còn lại lớn nhất đã tìm từ code mà không tới đích
+    failed = {}
+    path = [initial.code]
+    on_path = {initial.code}
+    
+    def dls(code, blank, remaining):
+        if code == goal_code:
+            return True
+        if remaining == 0:
+            return False
+        if failed.get(code, -1) >= remaining:
+            stats.pruned += 1
+            return False
             
-        if node.state == goal.state:
-            return [node.state]
+        stats.expanded += 1
+        for _, new_blank in transitions[blank]:
+            next_code = slide(code, blank, new_blank)
+            stats.generated += 1
+            if next_code in on_path:
+                continue
+            path.append(next_code)
+            on_path.add(next_code)
+            if dls(next_code, new_blank, remaining - 1):
+                return True
+            path.pop()
+            on_path.discard(next_code)
             
-        for move in node.get_valid_moves():
-            next_state = node.make_move(move)
-            result = dls(next_state, depth - 1)
-            if result:
-                return [node.state] + result
-                
-        return None
+        if code in failed or len(failed) < table_size:
+            failed[code] = remaining
+        return False
         
-    depth = 0
-    while True:
-        result = dls(initial, depth)
-        if result:
-            return result
+    depth = 1
+    while max_depth is None or depth <= max_depth:
+        stats.iterations += 1
+        if dls(initial.code, initial.blank, depth):
+            stats.verdict = 'solved'
+            stats.peak_nodes = len(failed)
+            return [board.decode(code) for code in path]
         depth += 1
+        
+    stats.verdict = 'depth_limit'
+    stats.peak_nodes = len(failed)
+    return None
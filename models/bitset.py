@@ -0,0 +1,29 @@
+"""
+Bitset cố định kích thước dựa trên bytearray
+"""
+
+
+class Bitset:
+    """Fixed-size bitset, one bit per index"""
+
+    def __init__(self, size, data=None):
+        """data may be any writable buffer of (size + 7) // 8 bytes, e.g. shared memory"""
+        self.size = size
+        self.data = bytearray((size + 7) >> 3) if data is None else data
+
+    def __contains__(self, index):
+        return (self.data[index >> 3] >> (index & 7)) & 1 == 1
+
+    def add(self, index):
+        self.data[index >> 3] |= 1 << (index & 7)
+
+    def test_and_set(self, index):
+        """Set the bit and return whether it was already set"""
+        byte = index >> 3
+        mask = 1 << (index & 7)
+        old = self.data[byte]
+        self.data[byte] = old | mask
+        return old & mask != 0
+
+    def clear(self):
+        self.data[:] = bytes(len(self.data))
@@ -0,0 +1,121 @@
+"""
+Chuẩn hóa trạng thái đích: đổi nhãn ô số và đối xứng bàn cờ
+
+Mọi trạng thái đích được đưa về một đích chuẩn bằng một phép đối xứng của bàn
+cờ (giữ nguyên ngữ nghĩa nước đi, chỉ đổi tên hướng) và một hoán vị nhãn ô số.
+Đích chuẩn là các ô 1..cells-1 theo thứ tự đọc, ô trống nằm ở vị trí đại diện
+cho quỹ đạo đối xứng của nó, nên các đích cùng quỹ đạo ô trống dùng chung một
+bảng tính sẵn: trên bàn 3x3 chỉ cần tối đa ba bảng (góc, cạnh, tâm), và đích có
+ô trống ở góc dùng chung bảng của đích chuẩn với ô trống ở ô cuối.
+
+Bàn vuông có 8 phép đối xứng, bàn chữ nhật chỉ có 4 (không có phép chuyển vị).
+"""
+from models.puzzle_state import DEFAULT_BOARD
+
+
+class Symmetry:
+    """A board symmetry: where each cell goes"""
+
+    def __init__(self, name, transform, board=DEFAULT_BOARD):
+        self.name = name
+        self.board = board
+        cells = []
+        for pos in range(board.cells):
+            i, j = transform(*divmod(pos, board.cols))
+            cells.append(i * board.cols + j)
+        self.cell_map = tuple(cells)
+        inverse = [0] * board.cells
+        for pos, new_pos in enumerate(self.cell_map):
+            inverse[new_pos] = pos
+        self.inverse_cell_map = tuple(inverse)
+
+    def apply(self, code, labels=None):
+        """Move every cell to its image, optionally relabelling tiles"""
+        bits, mask = self.board.tile_bits, self.board.tile_mask
+        result = 0
+        for pos, new_pos in enumerate(self.cell_map):
+            tile = (code >> (pos * bits)) & mask
+            if labels is not None:
+                tile = labels[tile]
+            result |= tile << (new_pos * bits)
+        return result
+
+
+def _build_symmetries(board):
+    rows, cols = board.rows, board.cols
+    transforms = [
+        ('identity', lambda i, j: (i, j)),
+        ('flip_horizontal', lambda i, j: (i, cols - 1 - j)),
+        ('flip_vertical', lambda i, j: (rows - 1 - i, j)),
+        ('rotate_180', lambda i, j: (rows - 1 - i, cols - 1 - j)),
+    ]
+    if rows == cols:
+        transforms += [
+            ('transpose', lambda i, j: (j, i)),
+            ('anti_transpose', lambda i, j: (cols - 1 - j, rows - 1 - i)),
+            ('rotate_90', lambda i, j: (j, rows - 1 - i)),
+            ('rotate_270', lambda i, j: (cols - 1 - j, i)),
+        ]
+    return tuple(Symmetry(name, transform, board) for name, transform in transforms)
+
+
+# _SYMMETRIES[board] -> (các phép đối xứng, REPRESENTATIVE của bàn đó)
+_SYMMETRIES = {}
+
+
+def symmetries(board=DEFAULT_BOARD):
+    """(symmetries, representative) of a board, built once per process
+
+    representative[blank] is the largest cell in the blank's symmetry orbit.
+    """
+    entry = _SYMMETRIES.get(board)
+    if entry is None:
+        board_symmetries = _build_symmetries(board)
+        representative = tuple(
+            max(symmetry.cell_map[blank] for symmetry in board_symmetries) for blank in range(board.cells)
+        )
+        entry = _SYMMETRIES[board] = (board_symmetries, representative)
+    return entry
+
+
+SYMMETRIES, REPRESENTATIVE = symmetries(DEFAULT_BOARD)
+
+
+def canonical_goal(blank, board=DEFAULT_BOARD):
+    """Tiles 1..cells-1 in reading order with the blank at the given cell"""
+    return board.goal_code(blank)
+
+
+class GoalCanonicalizer:
+    """Maps states between an arbitrary goal and its canonical goal"""
+
+    def __init__(self, goal_code, board=DEFAULT_BOARD):
+        self.board = board
+        board_symmetries, representative = symmetries(board)
+        blank = board.find_blank(goal_code)
+        target = representative[blank]
+        self.symmetry = next(s for s in board_symmetries if s.cell_map[blank] == target)
+        self.goal_code = canonical_goal(target, board)
+
+        mirrored = self.symmetry.apply(goal_code)
+        labels = [0] * board.cells
+        for shift in board.shifts:
+            labels[(mirrored >> shift) & board.tile_mask] = (self.goal_code >> shift) & board.tile_mask
+        self.labels = tuple(labels)
+        inverse = [0] * board.cells
+        for tile, label in enumerate(labels):
+            inverse[label] = tile
+        self.inverse_labels = tuple(inverse)
+
+    def to_canonical(self, code):
+        """State relative to the original goal -> state relative to the canonical goal"""
+        return self.symmetry.apply(code, self.labels)
+
+    def from_canonical(self, code):
+        """Inverse of to_canonical"""
+        bits, mask = self.board.tile_bits, self.board.tile_mask
+        result = 0
+        for pos, old_pos in enumerate(self.symmetry.inverse_cell_map):
+            tile = self.inverse_labels[(code >> (pos * bits)) & mask]
+            result |= tile << (old_pos * bits)
+        return result
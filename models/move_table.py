@@ -0,0 +1,20 @@
+"""
+Bảng nước đi 2 bit cho mỗi trạng thái đã xếp hạng
+"""
+
+
+class MoveTable:
+    """Fixed-size table of 2-bit move indices, packed four to a byte"""
+
+    def __init__(self, size, data=None):
+        """data may be any buffer of (size + 3) // 4 bytes, e.g. an mmap slice"""
+        self.size = size
+        self.data = bytearray((size + 3) >> 2) if data is None else data
+
+    def __getitem__(self, index):
+        return (self.data[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def __setitem__(self, index, move):
+        shift = (index & 3) << 1
+        byte = index >> 2
+        self.data[byte] = (self.data[byte] & ~(3 << shift) & 0xFF) | (move << shift)
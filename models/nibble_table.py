@@ -0,0 +1,20 @@
+"""
+Bảng giá trị 4 bit (0..15) cho mỗi chỉ số, hai giá trị trong một byte
+"""
+
+
+class NibbleTable:
+    """Fixed-size table of 4-bit values, packed two to a byte (low nibble first)"""
+
+    def __init__(self, size, data=None):
+        """data may be any buffer of (size + 1) // 2 bytes, e.g. an mmap slice"""
+        self.size = size
+        self.data = bytearray((size + 1) >> 1) if data is None else data
+
+    def __getitem__(self, index):
+        return (self.data[index >> 1] >> ((index & 1) << 2)) & 15
+
+    def __setitem__(self, index, value):
+        shift = (index & 1) << 2
+        byte = index >> 1
+        self.data[byte] = (self.data[byte] & ~(15 << shift) & 0xFF) | (value << shift)
@@ -0,0 +1,46 @@
+"""
+Vùng nhớ node tìm kiếm dạng mảng (node arena)
+
+Mỗi node là một chỉ số vào các cột song song thay vì một đối tượng PuzzleState,
+nên một node chỉ tốn khoảng 20 byte và không tạo áp lực cho bộ thu gom rác.
+"""
+from array import array
+from models.puzzle_state import DEFAULT_BOARD
+
+NO_PARENT = -1
+NO_MOVE = -1
+
+
+class NodePool:
+    """Parallel columns of search nodes: code, blank, parent index, move, g and h"""
+
+    def __init__(self, board=DEFAULT_BOARD):
+        self.board = board
+        # Mã của bàn lớn hơn 64 bit (24-puzzle) không vừa array('Q')
+        self.codes = array('Q') if board.code_bits <= 64 else []
+        self.blanks = array('B')
+        self.parents = array('i')
+        self.moves = array('b')
+        self.g = array('H')
+        self.h = array('H')
+
+    def __len__(self):
+        return len(self.codes)
+
+    def add(self, code, blank, parent=NO_PARENT, move=NO_MOVE, g=0, h=0):
+        """Append a node and return its index"""
+        self.codes.append(code)
+        self.blanks.append(blank)
+        self.parents.append(parent)
+        self.moves.append(move)
+        self.g.append(g)
+        self.h.append(h)
+        return len(self.codes) - 1
+
+    def get_states(self, index):
+        """Boards (list of lists) from the root to the node at index"""
+        states = []
+        while index != NO_PARENT:
+            states.append(self.board.decode(self.codes[index]))
+            index = self.parents[index]
+        return states[::-1]
@@ -0,0 +1,132 @@
+"""
+Máy trạng thái hữu hạn loại bỏ chuỗi nước đi trùng lặp (kiểu Taylor–Korf)
+
+Một BFS ngắn trên các chuỗi nước đi (xuất phát từ từng vị trí ô trống) tìm mọi
+chuỗi dẫn tới cùng một cấu hình như một chuỗi ngắn hơn, hoặc cùng độ dài nhưng
+nhỏ hơn theo thứ tự từ điển. Các chuỗi trùng lặp đó được nạp vào một automaton
+Aho–Corasick; tìm kiếm theo chiều sâu chỉ cần mang theo một trạng thái FSM và
+bỏ mọi nước đi dẫn tới REJECT. Đường đi ngắn nhất nhỏ nhất theo thứ tự từ điển
+tới mỗi trạng thái không bao giờ bị loại, nên IDA*/IDDFS vẫn tối ưu.
+
+Chỉ dùng cho tìm kiếm dạng cây (không có tập visited toàn cục): khi kết hợp với
+tập visited, một trạng thái có thể bị đánh dấu qua một đường đi khác rồi mọi
+đường còn lại tới đích đều bị FSM loại, làm mất tính đầy đủ.
+
+Hiệu ứng của một chuỗi nước đi chỉ phụ thuộc vào vị trí ô trống ban đầu (là một
+hoán vị các ô), nên mỗi trạng thái FSM gắn với đúng một vị trí ô trống và bảng
+chuyển chỉ cần 4 cột: transitions[state * 4 + move].
+"""
+from array import array
+from models.puzzle_state import DEFAULT_BOARD, DIRECTIONS
+
+DEFAULT_DEPTH = 12
+# Bàn lớn hơn có nhiều chuỗi nước đi hơn ở cùng độ sâu; độ sâu nhỏ hơn giữ thời gian dựng ngắn
+LARGE_BOARD_DEPTH = 8
+
+REJECT = 0xFFFFFFFF
+
+_MOVES = len(DIRECTIONS)
+
+
+class PruningFSM:
+    """Compact transition table over (FSM state, move index)"""
+
+    def __init__(self, starts, transitions, depth):
+        # starts[blank] là trạng thái ban đầu khi ô trống nằm ở blank
+        self.starts = tuple(starts)
+        self.transitions = transitions
+        self.depth = depth
+
+    def __len__(self):
+        return len(self.transitions) // _MOVES
+
+    def start(self, blank):
+        return self.starts[blank]
+
+    def next(self, state, move):
+        """State after move, or REJECT if the move sequence is a known duplicate"""
+        return self.transitions[state * _MOVES + move]
+
+    @classmethod
+    def build(cls, depth=DEFAULT_DEPTH, board=DEFAULT_BOARD):
+        """BFS over move strings up to depth, then Aho–Corasick over the duplicates"""
+        cells, moves, slide = board.cells, board.transitions, board.slide
+        blanks = []
+        goto = []
+        duplicate = []
+
+        def new_node(blank, is_duplicate=False):
+            blanks.append(blank)
+            goto.extend([None] * _MOVES)
+            duplicate.append(is_duplicate)
+            return len(blanks) - 1
+
+        roots = [new_node(blank) for blank in range(cells)]
+        for blank in range(cells):
+            # Các ô mang nhãn khác nhau nên mã nén xác định đúng hiệu ứng của chuỗi
+            start_code = board.goal_code(blank)
+            seen = {start_code}
+            layer = [(roots[blank], start_code, blank)]
+            for _ in range(depth):
+                next_layer = []
+                for node, code, node_blank in layer:
+                    for move, new_blank in moves[node_blank]:
+                        next_code = slide(code, node_blank, new_blank)
+                        is_duplicate = next_code in seen
+                        child = new_node(new_blank, is_duplicate)
+                        goto[node * _MOVES + move] = child
+                        if not is_duplicate:
+                            seen.add(next_code)
+                            next_layer.append((child, next_code, new_blank))
+                layer = next_layer
+
+        # Liên kết thất bại: hậu tố dài nhất có trong trie; hậu tố rỗng là gốc của
+        # vị trí ô trống hiện tại (các gốc là các node 0..cells-1)
+        fail = list(range(len(blanks)))
+        delta = [None] * len(goto)
+        queue = list(roots)
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for move, new_blank in moves[blanks[node]]:
+                child = goto[node * _MOVES + move]
+                if node < cells:
+                    # Chuỗi độ dài 1 không bao giờ trùng lặp
+                    delta[node * _MOVES + move] = child
+                    fail[child] = roots[new_blank]
+                    queue.append(child)
+                    continue
+                target = delta[fail[node] * _MOVES + move]
+                if child is None:
+                    delta[node * _MOVES + move] = target
+                    continue
+                delta[node * _MOVES + move] = child
+                fail[child] = target
+                if duplicate[target]:
+                    duplicate[child] = True
+                if not duplicate[child]:
+                    queue.append(child)
+
+        # Đánh số lại, chỉ giữ các trạng thái không trùng lặp
+        number = {node: index for index, node in enumerate(queue)}
+        transitions = array('I', [REJECT]) * (len(queue) * _MOVES)
+        for node in queue:
+            for move, _ in moves[blanks[node]]:
+                target = delta[node * _MOVES + move]
+                if not duplicate[target]:
+                    transitions[number[node] * _MOVES + move] = number[target]
+        return cls([number[root] for root in roots], transitions, depth)
+
+
+_FSMS = {}
+
+
+def get_fsm(depth=None, board=DEFAULT_BOARD):
+    """Pruning FSM for a board, built once per process"""
+    if depth is None:
+        depth = DEFAULT_DEPTH if board is DEFAULT_BOARD else LARGE_BOARD_DEPTH
+    fsm = _FSMS.get((depth, board))
+    if fsm is None:
+        fsm = _FSMS[(depth, board)] = PruningFSM.build(depth, board)
+    return fsm
@@ -1,53 +1,289 @@
+"""
+Module chứa trạng thái puzzle và mã nén của bàn cờ trượt kích thước bất kỳ
+
+Mỗi kích thước rows x cols có một đối tượng Board dùng chung (get_board) chứa
+bảng nước đi và cách nén: ô k chiếm tile_bits bit bắt đầu từ bit tile_bits * k
+(4 bit tới 15-puzzle, 5 bit cho 24-puzzle). Các hằng số ROWS, COLS, CELLS,
+TRANSITIONS... và các hàm cấp module là của bàn 3x3 mặc định, dùng cho các
+bảng tính sẵn chỉ dành cho 8-puzzle.
+"""
+ROWS = 3
+COLS = 3
+
+DIRECTIONS = ('up', 'down', 'left', 'right')
+OFFSETS = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+
+# OPPOSITE[m] là nước đi hoàn tác m
+OPPOSITE = (1, 0, 3, 2)
+
+# Số nước đi tối đa tới một đích có ô trống ở góc (số của Chúa), theo (cạnh ngắn, cạnh dài)
+KNOWN_DIAMETERS = {
+    (2, 2): 6, (2, 3): 21, (2, 4): 36, (2, 5): 55,
+    (3, 3): 31, (3, 4): 53, (4, 4): 80,
+}
+
+
+class Board:
+    """Geometry, move tables and packed encoding of one rows x cols board"""
+
+    def __init__(self, rows, cols):
+        if rows < 2 or cols < 2:
+            raise ValueError('Board must be at least 2x2, got %dx%d' % (rows, cols))
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.tile_bits = max(4, (self.cells - 1).bit_length())
+        self.tile_mask = (1 << self.tile_bits) - 1
+        self.code_bits = self.cells * self.tile_bits
+        self.shifts = tuple(pos * self.tile_bits for pos in range(self.cells))
+
+        # blank_step[m] là độ dời chỉ số ô trống khi đi m
+        self.blank_step = tuple(OFFSETS[d][0] * cols + OFFSETS[d][1] for d in DIRECTIONS)
+
+        # move_table[blank] -> các nước đi hợp lệ (direction, new_i, new_j), thứ tự up, down, left, right
+        table = []
+        for blank in range(self.cells):
+            i, j = divmod(blank, cols)
+            moves = []
+            for direction in DIRECTIONS:
+                di, dj = OFFSETS[direction]
+                new_i, new_j = i + di, j + dj
+                if 0 <= new_i < rows and 0 <= new_j < cols:
+                    moves.append((direction, new_i, new_j))
+            table.append(tuple(moves))
+        self.move_table = tuple(table)
+
+        # transitions[blank] -> (move_index, new_blank) dùng để cập nhật trực tiếp trên mã nén
+        self.transitions = tuple(
+            tuple((DIRECTIONS.index(direction), new_i * cols + new_j) for direction, new_i, new_j in moves)
+            for moves in self.move_table
+        )
+
+    def __repr__(self):
+        return 'Board(%d, %d)' % (self.rows, self.cols)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def encode(self, state):
+        """Pack a board into (code, blank_index)"""
+        code = 0
+        blank = None
+        pos = 0
+        for row in state:
+            for tile in row:
+                if tile == 0:
+                    blank = pos
+                code |= tile << (pos * self.tile_bits)
+                pos += 1
+        return code, blank
+
+    def decode(self, code):
+        """Unpack a code into a fresh list-of-lists board"""
+        bits, mask, cols = self.tile_bits, self.tile_mask, self.cols
+        return [
+            [(code >> ((i * cols + j) * bits)) & mask for j in range(cols)]
+            for i in range(self.rows)
+        ]
+
+    def find_blank(self, code):
+        """Index of the blank cell in a packed code"""
+        mask = self.tile_mask
+        for pos, shift in enumerate(self.shifts):
+            if not (code >> shift) & mask:
+                return pos
+        return None
+
+    def slide(self, code, blank, new_blank):
+        """Move the tile at new_blank into the blank cell and return the new code"""
+        shift = new_blank * self.tile_bits
+        tile = (code >> shift) & self.tile_mask
+        # Ô trống luôn là 0 nên XOR vừa xóa ô cũ vừa ghi ô mới
+        return code ^ (tile << shift) ^ (tile << (blank * self.tile_bits))
+
+    def goal_code(self, blank=None):
+        """Tiles 1..cells-1 in reading order with the blank at the given cell (last by default)"""
+        if blank is None:
+            blank = self.cells - 1
+        code = 0
+        tile = 1
+        for pos in range(self.cells):
+            if pos != blank:
+                code |= tile << (pos * self.tile_bits)
+                tile += 1
+        return code
+
+    @property
+    def diameter(self):
+        """Most moves any state needs to reach a goal with the blank in a corner, or None if unknown"""
+        return KNOWN_DIAMETERS.get((min(self.rows, self.cols), max(self.rows, self.cols)))
+
+    def depth_bound(self, goal_blank):
+        """Upper bound on the optimal solution length to a goal with its blank at goal_blank
+
+        Any state reaches the corner-blank goal that leads to this goal by
+        walking the blank to goal_blank, so the diameter plus that walk bounds
+        it. None when the diameter of the board is unknown.
+        """
+        if self.diameter is None:
+            return None
+        i, j = divmod(goal_blank, self.cols)
+        return self.diameter + min(i, self.rows - 1 - i) + min(j, self.cols - 1 - j)
+
+    def parity(self, code):
+        """Invariant (0 or 1) of a code under sliding moves
+
+        Tile inversion parity, plus the blank's row when the width is even: a
+        vertical move then jumps a tile over an odd number of cells. Two codes
+        are reachable from each other exactly when their parities match.
+        """
+        mask = self.tile_mask
+        tiles = []
+        blank_row = 0
+        for pos, shift in enumerate(self.shifts):
+            tile = (code >> shift) & mask
+            if tile:
+                tiles.append(tile)
+            else:
+                blank_row = pos // self.cols
+        inversions = count_inversions(tiles)
+        if self.cols % 2 == 0:
+            inversions += blank_row
+        return inversions & 1
+
+
+def count_inversions(sequence):
+    """Number of pairs i < j with sequence[i] > sequence[j], by merge sort in O(n log n)"""
+    items = list(sequence)
+    buffer = [0] * len(items)
+    inversions = 0
+    width = 1
+    # Trộn từ dưới lên: mỗi lượt gộp các đoạn đã sắp xếp độ dài width
+    while width < len(items):
+        for low in range(0, len(items), 2 * width):
+            middle = min(low + width, len(items))
+            high = min(low + 2 * width, len(items))
+            i, j, k = low, middle, low
+            while i < middle and j < high:
+                if items[j] < items[i]:
+                    # items[j] đứng trước mọi phần tử còn lại của nửa trái
+                    inversions += middle - i
+                    buffer[k] = items[j]
+                    j += 1
+                else:
+                    buffer[k] = items[i]
+                    i += 1
+                k += 1
+            buffer[k:high] = items[i:middle] if i < middle else items[j:high]
+        items, buffer = buffer, items
+        width *= 2
+    return inversions
+
+
+_BOARDS = {}
+
+
+def get_board(rows, cols):
+    """Shared Board for a size, built once per process"""
+    board = _BOARDS.get((rows, cols))
+    if board is None:
+        board = _BOARDS[(rows, cols)] = Board(rows, cols)
+    return board
+
+
+def board_of(state):
+    """Board matching the shape of a list-of-lists board"""
+    return get_board(len(state), len(state[0]))
+
+
+def common_board(*puzzle_states):
+    """Board shared by some PuzzleStates; ValueError if their sizes differ"""
+    board = puzzle_states[0].board
+    for other in puzzle_states[1:]:
+        if other.board is not board:
+            raise ValueError('Boards differ in size: %dx%d and %dx%d' % (board.shape + other.board.shape))
+    return board
+
+
+DEFAULT_BOARD = get_board(ROWS, COLS)
+
+CELLS = DEFAULT_BOARD.cells
+TILE_BITS = DEFAULT_BOARD.tile_bits
+TILE_MASK = DEFAULT_BOARD.tile_mask
+BLANK_STEP = DEFAULT_BOARD.blank_step
+MOVE_TABLE = DEFAULT_BOARD.move_table
+TRANSITIONS = DEFAULT_BOARD.transitions
+
+
+def encode_state(state):
+    """Pack a board of any size into (code, blank_index)"""
+    return board_of(state).encode(state)
+
+
+def decode_state(code, board=DEFAULT_BOARD):
+    """Unpack a code into a fresh list-of-lists board"""
+    return board.decode(code)
+
+
+def find_blank(code, board=DEFAULT_BOARD):
+    """Index of the blank cell in a packed code"""
+    return board.find_blank(code)
+
+
+def slide(code, blank, new_blank):
+    """Move the tile at new_blank into the blank cell of a 4-bit code and return the new code"""
+    shift = new_blank * TILE_BITS
+    tile = (code >> shift) & TILE_MASK
+    return code ^ (tile << shift) ^ (tile << (blank * TILE_BITS))
+
+
 class PuzzleState:
-    def __init__(self, state, parent=None, move=None, cost=0):
-        self.state = state
+    __slots__ = ('code', 'blank', 'parent', 'move', 'cost', 'depth', 'h', 'board')
+
+    def __init__(self, state, parent=None, move=None, cost=0, blank=None, h=None, board=None):
+        if isinstance(state, int):
+            # Mã nén không mang kích thước: lấy từ node cha, mặc định là 3x3
+            if board is None:
+                board = parent.board if parent else DEFAULT_BOARD
+            self.code = state
+            self.blank = board.find_blank(state) if blank is None else blank
+        else:
+            board = board_of(state)
+            self.code, self.blank = board.encode(state)
+        self.board = board
         self.parent = parent
         self.move = move
         self.cost = cost
         self.depth = parent.depth + 1 if parent else 0
+        # Giá trị heuristic của node (nếu solver có dùng), cập nhật tăng dần theo nước đi
+        self.h = h
+
+    @property
+    def state(self):
+        """Board as list of lists, decoded on demand for the UI and callers"""
+        return self.board.decode(self.code)
 
     def __eq__(self, other):
-        return self.state == other.state
+        return self.code == other.code and self.board is other.board
 
     def __hash__(self):
-        return hash(str(self.state))
+        return hash(self.code)
 
     def get_blank_position(self):
-        for i in range(3):
-            for j in range(3):
-                if self.state[i][j] == 0:
-                    return (i, j)
-        return None
+        return divmod(self.blank, self.board.cols)
 
     def get_valid_moves(self):
-        moves = []
-        i, j = self.get_blank_position()
-        
-        # Up
-        if i > 0:
-            moves.append(('up', i-1, j))
-        # Down
-        if i < 2:
-            moves.append(('down', i+1, j))
-        # Left
-        if j > 0:
-            moves.append(('left', i, j-1))
-        # Right
-        if j < 2:
-            moves.append(('right', i, j+1))
-            
-        return moves
-
-    def make_move(self, move):
+        return self.board.move_table[self.blank]
+
+    def make_move(self, move, heuristic=None):
         direction, new_i, new_j = move
-        i, j = self.get_blank_position()
-        
-        # Create new state
-        new_state = [row[:] for row in self.state]
-        new_state[i][j] = new_state[new_i][new_j]
-        new_state[new_i][new_j] = 0
-        
-        return PuzzleState(new_state, self, direction, self.cost + 1)
+        new_blank = new_i * self.board.cols + new_j
+        new_code = self.board.slide(self.code, self.blank, new_blank)
+        h = None
+        if heuristic is not None:
+            h = heuristic.after_slide(self.h, self.code, self.blank, new_blank, new_code)
+        return PuzzleState(new_code, self, direction, self.cost + 1, new_blank, h, self.board)
 
     def get_path(self):
         path = []
@@ -64,4 +300,4 @@ class PuzzleState:
         while current:
             states.append(current.state)
             current = current.parent
-        return states[::-1] 
\ No newline at end of file
+        return states[::-1]
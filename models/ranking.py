@@ -0,0 +1,133 @@
+"""
+Xếp hạng hoán vị (perfect hash) cho trạng thái 8-puzzle
+
+Một trạng thái được xếp hạng bằng vị trí ô trống và hạng Lehmer (thứ tự từ điển)
+của dãy 8 ô số theo thứ tự đọc. Với bảng có số cột lẻ, tính chẵn lẻ của số nghịch
+thế của dãy ô số không đổi qua mọi nước đi, và hai hoán vị có hạng 2k, 2k + 1 chỉ
+khác nhau ở hai phần tử cuối nên có tính chẵn lẻ ngược nhau. Vì vậy
+
+    rank = blank * 8!/2 + lehmer(tiles) // 2
+
+ánh xạ 9!/2 = 181,440 trạng thái đạt được của một lớp chẵn lẻ vào [0, 181440)
+mà không có xung đột.
+"""
+from math import factorial
+from models.bitset import Bitset
+from models.puzzle_state import CELLS, DEFAULT_BOARD, TILE_BITS, TILE_MASK
+
+TILES = CELLS - 1
+HALF_TILE_PERMUTATIONS = factorial(TILES) // 2
+STATE_COUNT = CELLS * HALF_TILE_PERMUTATIONS
+
+_FACTORIALS = tuple(factorial(TILES - 1 - i) for i in range(TILES))
+
+
+# _SMALLER_UNUSED[used << 4 | tile] -> số ô nhỏ hơn tile chưa xuất hiện (chữ số Lehmer)
+_SMALLER_UNUSED = tuple(
+    tile - 1 - (used & ((1 << tile) - 1)).bit_count() if tile else 0
+    for used in range(1 << CELLS)
+    for tile in range(1 << TILE_BITS)
+)
+_SHIFTS = tuple(pos * TILE_BITS for pos in range(CELLS))
+
+
+def rank(code):
+    """Rank a packed code into [0, STATE_COUNT) within its parity class"""
+    used = 0
+    lehmer = 0
+    blank = 0
+    k = 0
+    for pos, shift in enumerate(_SHIFTS):
+        tile = (code >> shift) & TILE_MASK
+        if tile:
+            lehmer += _SMALLER_UNUSED[(used << TILE_BITS) | tile] * _FACTORIALS[k]
+            used |= 1 << tile
+            k += 1
+        else:
+            blank = pos
+    return blank * HALF_TILE_PERMUTATIONS + (lehmer >> 1)
+
+
+def parity(code):
+    """Inversion parity (0 or 1) of the tiles of a packed code, blank ignored"""
+    used = 0
+    inversions = 0
+    for shift in _SHIFTS:
+        tile = (code >> shift) & TILE_MASK
+        if tile:
+            inversions += _SMALLER_UNUSED[(used << TILE_BITS) | tile]
+            used |= 1 << tile
+    return inversions & 1
+
+
+def unrank(index, tile_parity):
+    """Inverse of rank for the parity class tile_parity; returns a packed code"""
+    blank, half = divmod(index, HALF_TILE_PERMUTATIONS)
+    lehmer = half << 1
+    digits = []
+    inversions = 0
+    for k in range(TILES):
+        digit, lehmer = divmod(lehmer, _FACTORIALS[k])
+        digits.append(digit)
+        inversions += digit
+    if (inversions & 1) != tile_parity:
+        # Hạng lẻ kế bên: đổi chỗ hai ô cuối
+        digits[TILES - 2] ^= 1
+
+    remaining = list(range(1, CELLS))
+    code = 0
+    pos = 0
+    for digit in digits:
+        if pos == blank:
+            pos += 1
+        code |= remaining.pop(digit) << (pos * TILE_BITS)
+        pos += 1
+    return code
+
+
+class StateSet:
+    """Visited/closed set of packed codes backed by a dense bitset over ranks
+
+    All codes added to one set must belong to the same parity class, which is
+    always the case for states reached from a single start by sliding moves.
+    """
+
+    def __init__(self, codes=()):
+        self.bits = Bitset(STATE_COUNT)
+        self.count = 0
+        for code in codes:
+            self.add(code)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, code):
+        return rank(code) in self.bits
+
+    def add(self, code):
+        self.add_new(code)
+
+    def add_new(self, code):
+        """Add code and return True if it was not in the set yet"""
+        if self.bits.test_and_set(rank(code)):
+            return False
+        self.count += 1
+        return True
+
+
+class CodeSet(set):
+    """Hashed set of packed codes with the StateSet interface, for boards too large to rank"""
+
+    def add_new(self, code):
+        """Add code and return True if it was not in the set yet"""
+        if code in self:
+            return False
+        self.add(code)
+        return True
+
+
+def state_set(board, codes=()):
+    """Visited set for a board: a ranked bitset for 3x3, a hashed set otherwise"""
+    if board is DEFAULT_BOARD:
+        return StateSet(codes)
+    return CodeSet(codes)
@@ -0,0 +1,46 @@
+import random
+import pytest
+from models.puzzle_state import get_board
+from algorithms.bidirectional_search import bidirectional_a_star_search, bidirectional_bfs_solve
+from algorithms.uninformed_search import bfs_solve
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def random_walks(count, steps, seed=0):
+    board = get_board(3, 3)
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        code, blank = board.encode(GOAL)
+        for _ in range(steps):
+            _, new_blank = rng.choice(board.transitions[blank])
+            code, blank = board.slide(code, blank, new_blank), new_blank
+        states.append(board.decode(code))
+    return states
+
+
+def assert_valid_path(path, start, goal):
+    board = get_board(3, 3)
+    assert path[0] == start and path[-1] == goal
+    for state, next_state in zip(path, path[1:]):
+        code, blank = board.encode(state)
+        assert any(board.slide(code, blank, nb) == board.encode(next_state)[0] for _, nb in board.transitions[blank])
+
+
+@pytest.mark.parametrize('balance', ['alternate', 'smaller'])
+@pytest.mark.parametrize('state', random_walks(4, 60) + [[[8, 6, 7], [2, 5, 4], [3, 0, 1]]])
+def test_bidirectional_searches_are_optimal(state, balance):
+    length = len(bfs_solve(state, GOAL))
+    for solve in (bidirectional_bfs_solve, bidirectional_a_star_search):
+        path = solve(state, GOAL, balance=balance)
+        assert_valid_path(path, state, GOAL)
+        assert len(path) == length
+
+
+def test_bidirectional_unsolvable_and_bad_balance():
+    unsolvable = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+    assert bidirectional_bfs_solve(unsolvable, GOAL) is None
+    assert bidirectional_a_star_search(unsolvable, GOAL) is None
+    with pytest.raises(ValueError):
+        bidirectional_bfs_solve(GOAL, [[1, 2, 3], [4, 5, 6], [7, 0, 8]], balance='random')
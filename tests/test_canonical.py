@@ -0,0 +1,48 @@
+import random
+import pytest
+from models.canonical import GoalCanonicalizer, symmetries
+from models.puzzle_state import get_board
+
+
+def random_code(board, rng):
+    tiles = list(range(board.cells))
+    rng.shuffle(tiles)
+    return board.encode([tiles[i * board.cols:(i + 1) * board.cols] for i in range(board.rows)])[0]
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (3, 4), (4, 4)])
+def test_canonicalizer_maps_goal_and_inverts(shape):
+    board = get_board(*shape)
+    rng = random.Random(0)
+    for _ in range(20):
+        goal = random_code(board, rng)
+        canonicalizer = GoalCanonicalizer(goal, board)
+        assert canonicalizer.to_canonical(goal) == canonicalizer.goal_code
+        for _ in range(5):
+            code = random_code(board, rng)
+            assert canonicalizer.from_canonical(canonicalizer.to_canonical(code)) == code
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (4, 4)])
+def test_canonicalizer_keeps_moves(shape):
+    # Trạng thái kề nhau trước khi đổi vẫn kề nhau sau khi đổi
+    board = get_board(*shape)
+    rng = random.Random(1)
+    canonicalizer = GoalCanonicalizer(random_code(board, rng), board)
+    code = random_code(board, rng)
+    blank = board.find_blank(code)
+    canonical = canonicalizer.to_canonical(code)
+    canonical_blank = board.find_blank(canonical)
+    for _, new_blank in board.transitions[blank]:
+        neighbour = canonicalizer.to_canonical(board.slide(code, blank, new_blank))
+        assert any(board.slide(canonical, canonical_blank, nb) == neighbour
+                   for _, nb in board.transitions[canonical_blank])
+
+
+def test_corner_goals_share_one_canonical_goal():
+    board = get_board(4, 4)
+    corners = (0, 3, 12, 15)
+    goals = {GoalCanonicalizer(board.goal_code(blank), board).goal_code for blank in corners}
+    assert goals == {board.goal_code()}
+    assert len(symmetries(board)[0]) == 8
+    assert len(symmetries(get_board(3, 4))[0]) == 4
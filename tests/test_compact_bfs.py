@@ -0,0 +1,42 @@
+import pytest
+from models.bitset import Bitset
+from models.move_table import MoveTable
+from models.ranking import STATE_COUNT
+from models.puzzle_state import DEFAULT_BOARD
+from algorithms.compact_bfs import bfs_layers
+from algorithms.uninformed_search import bfs_solve
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def test_move_table_packs_two_bits_per_entry():
+    table = MoveTable(10)
+    assert len(table.data) == 3
+    for index in range(10):
+        table[index] = (index * 3) & 3
+    table[4] = 1
+    assert [table[index] for index in range(10)] == [0, 3, 2, 1, 1, 3, 2, 1, 0, 3]
+
+
+@pytest.mark.parametrize('state', [
+    [[8, 6, 7], [2, 5, 4], [3, 0, 1]],
+    [[4, 1, 3], [7, 2, 6], [0, 5, 8]],
+    [[1, 2, 3], [4, 5, 6], [0, 7, 8]],
+])
+def test_compact_bfs_path_is_optimal_and_valid(state):
+    path = bfs_solve(state, GOAL, compact=True)
+    assert path[0] == state and path[-1] == GOAL
+    assert len(path) == len(bfs_solve(state, GOAL))
+    for before, after in zip(path, path[1:]):
+        code, blank = DEFAULT_BOARD.encode(before)
+        assert any(DEFAULT_BOARD.slide(code, blank, nb) == DEFAULT_BOARD.encode(after)[0]
+                   for _, nb in DEFAULT_BOARD.transitions[blank])
+
+
+def test_bfs_layers_cover_the_parity_class():
+    goal_code = DEFAULT_BOARD.encode(GOAL)[0]
+    layers = [len(ranks) for _, _, _, ranks in bfs_layers(goal_code, Bitset(STATE_COUNT), MoveTable(STATE_COUNT))]
+    assert sum(layers) == STATE_COUNT
+    # 31 nước là đường kính của 8-puzzle với ô trống ở góc
+    assert len(layers) == 32
+    assert layers[-1] == 2
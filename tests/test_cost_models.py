@@ -0,0 +1,73 @@
+import heapq
+import random
+import pytest
+from models.puzzle_state import get_board
+from algorithms.cost_models import DirectionCost, TileCost, get_cost_model, solution_cost
+from algorithms.uninformed_search import ucs_solve
+
+
+def dijkstra_cost(board, start, goal, costs):
+    """Cheapest cost from start to goal, by a plain heapq Dijkstra over codes"""
+    code, blank = board.encode(start)
+    goal_code = board.encode(goal)[0]
+    best = {code: 0}
+    heap = [(0, code, blank)]
+    while heap:
+        cost, code, blank = heapq.heappop(heap)
+        if code == goal_code:
+            return cost
+        if cost > best[code]:
+            continue
+        for move, new_blank in board.transitions[blank]:
+            tile = (code >> (new_blank * board.tile_bits)) & board.tile_mask
+            next_code = board.slide(code, blank, new_blank)
+            next_cost = cost + costs(tile, move)
+            if next_cost < best.get(next_code, next_cost + 1):
+                best[next_code] = next_cost
+                heapq.heappush(heap, (next_cost, next_code, new_blank))
+    return None
+
+
+def random_walk(board, goal, steps, rng):
+    code, blank = board.encode(goal)
+    for _ in range(steps):
+        _, new_blank = rng.choice(board.transitions[blank])
+        code, blank = board.slide(code, blank, new_blank), new_blank
+    return board.decode(code)
+
+
+def assert_ucs_matches_dijkstra(board, cost_model, steps):
+    goal = board.decode(board.goal_code())
+    costs = get_cost_model(cost_model, board)
+    rng = random.Random(0)
+    for _ in range(5):
+        state = random_walk(board, goal, steps, rng)
+        path = ucs_solve(state, goal, cost_model=cost_model)
+        assert path[0] == state and path[-1] == goal
+        assert costs.path_cost(path) == dijkstra_cost(board, state, goal, costs)
+
+
+@pytest.mark.parametrize('shape, steps', [((2, 3), 40), ((3, 3), 14)])
+@pytest.mark.parametrize('cost_model', ['unit', 'tile', 'direction'])
+def test_ucs_cost_matches_dijkstra(shape, steps, cost_model):
+    assert_ucs_matches_dijkstra(get_board(*shape), cost_model, steps)
+
+
+@pytest.mark.parametrize('cost_model', [
+    TileCost(weights=[0, 5, 1, 1, 1, 1, 1, 1, 1]),
+    DirectionCost(weights={'up': 3, 'down': 1, 'left': 1, 'right': 2}),
+])
+def test_ucs_with_custom_weights_matches_dijkstra(cost_model):
+    assert_ucs_matches_dijkstra(get_board(3, 3), cost_model, 14)
+
+
+def test_solution_cost_by_name():
+    path = [[[1, 2, 3], [4, 5, 6], [7, 0, 8]], [[1, 2, 3], [4, 5, 6], [7, 8, 0]]]
+    assert solution_cost(path, 'unit') == 1
+    assert solution_cost(path, 'tile') == 8
+    assert solution_cost(path, 'direction') == 2
+
+
+def test_unknown_cost_model_is_rejected():
+    with pytest.raises(ValueError):
+        get_cost_model('free')
@@ -0,0 +1,44 @@
+import pytest
+from models.puzzle_state import DEFAULT_BOARD
+from algorithms.distance_database import DistanceDatabase, database_solve, get_database
+from algorithms.uninformed_search import bfs_solve
+from utils.table_store import CACHE_ENV
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.fixture(autouse=True)
+def table_dir(tmp_path_factory, monkeypatch):
+    """Keep tables built by the tests out of the user's cache"""
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path_factory.getbasetemp() / 'tables'))
+
+
+def test_database_distances_and_diameter():
+    database = get_database(GOAL)
+    assert database.diameter == 31
+    state = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    assert database.distance(DEFAULT_BOARD.encode(state)[0]) == len(bfs_solve(state, GOAL)) - 1
+    assert database.distance(DEFAULT_BOARD.encode([[2, 1, 3], [4, 5, 6], [7, 8, 0]])[0]) is None
+
+
+@pytest.mark.parametrize('state, goal', [
+    ([[8, 6, 7], [2, 5, 4], [3, 0, 1]], GOAL),
+    ([[1, 2, 3], [4, 0, 5], [6, 7, 8]], [[0, 1, 2], [3, 4, 5], [6, 7, 8]]),
+    ([[2, 8, 3], [1, 6, 4], [7, 0, 5]], [[1, 2, 3], [8, 0, 4], [7, 6, 5]]),
+])
+def test_database_solve_is_optimal_for_any_goal(state, goal):
+    path = database_solve(state, goal)
+    assert path[0] == state and path[-1] == goal
+    assert len(path) == len(bfs_solve(state, goal))
+
+
+def test_database_solve_unsolvable():
+    assert database_solve([[2, 1, 3], [4, 5, 6], [7, 8, 0]], GOAL) is None
+
+
+def test_database_save_and_load(tmp_path):
+    database = get_database(GOAL)
+    database.save(str(tmp_path))
+    loaded = DistanceDatabase.load(database.goal_code, str(tmp_path))
+    assert bytes(loaded.distances) == bytes(database.distances)
+    assert bytes(loaded.predecessors.data) == bytes(database.predecessors.data)
@@ -0,0 +1,58 @@
+import random
+import pytest
+from algorithms.frontier import BucketFrontier, HeapFrontier
+
+
+def drain(frontier):
+    popped = []
+    while frontier:
+        popped.append(frontier.pop())
+    return popped
+
+
+@pytest.mark.parametrize('frontier_class', [HeapFrontier, BucketFrontier])
+def test_frontier_pops_in_priority_order_with_decrease_key(frontier_class):
+    rng = random.Random(0)
+    frontier = frontier_class(tie_break='fifo')
+    best = {}
+    for _ in range(500):
+        key, priority = rng.randrange(100), rng.randrange(40)
+        frontier.push(key, 'item%d' % key, priority)
+        best[key] = min(best.get(key, priority), priority)
+    popped = drain(frontier)
+    assert [priority for _, _, priority in popped] == sorted(best.values())
+    assert {key: priority for key, _, priority in popped} == best
+
+
+@pytest.mark.parametrize('frontier_class', [HeapFrontier, BucketFrontier])
+def test_frontier_rejects_worse_entries_and_removes(frontier_class):
+    frontier = frontier_class(tie_break='fifo')
+    assert frontier.push('a', 1, 5)
+    assert not frontier.push('a', 2, 5)
+    assert frontier.push('a', 3, 4)
+    assert frontier.priority('a') == 4 and frontier.item('a') == 3
+    frontier.push('b', 4, 1)
+    frontier.remove('b')
+    assert 'b' not in frontier and len(frontier) == 1
+    assert frontier.pop() == ('a', 3, 4)
+    with pytest.raises(IndexError):
+        frontier.pop()
+
+
+@pytest.mark.parametrize('frontier_class', [HeapFrontier, BucketFrontier])
+@pytest.mark.parametrize('tie_break, expected', [
+    ('fifo', ['a', 'b', 'c']),
+    ('lifo', ['c', 'b', 'a']),
+    ('high_g', ['b', 'c', 'a']),
+    ('low_g', ['a', 'c', 'b']),
+])
+def test_frontier_tie_breaks(frontier_class, tie_break, expected):
+    frontier = frontier_class(tie_break=tie_break)
+    for key, g in (('a', 1), ('b', 3), ('c', 2)):
+        frontier.push(key, None, 7, g)
+    assert [key for key, _, _ in drain(frontier)] == expected
+
+
+def test_unknown_tie_break_is_rejected():
+    with pytest.raises(ValueError):
+        HeapFrontier(tie_break='random')
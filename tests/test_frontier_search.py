@@ -0,0 +1,64 @@
+import random
+import pytest
+from models.puzzle_state import get_board
+from algorithms.frontier_search import frontier_a_star_search, frontier_bfs_solve
+from algorithms.informed_search import a_star_search
+from algorithms.uninformed_search import bfs_solve
+from algorithms.search_stats import SearchStats
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def random_walks(count, steps, seed=0):
+    board = get_board(3, 3)
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        code, blank = board.encode(GOAL)
+        for _ in range(steps):
+            _, new_blank = rng.choice(board.transitions[blank])
+            code, blank = board.slide(code, blank, new_blank), new_blank
+        states.append(board.decode(code))
+    return states
+
+
+def assert_valid_path(path, start, goal):
+    board = get_board(3, 3)
+    assert path[0] == start and path[-1] == goal
+    for state, next_state in zip(path, path[1:]):
+        code, blank = board.encode(state)
+        assert any(board.slide(code, blank, nb) == board.encode(next_state)[0] for _, nb in board.transitions[blank])
+
+
+@pytest.mark.parametrize('state', random_walks(5, 60) + [[[8, 6, 7], [2, 5, 4], [3, 0, 1]]])
+def test_frontier_searches_are_optimal(state):
+    length = len(bfs_solve(state, GOAL))
+    for path in (frontier_bfs_solve(state, GOAL), bfs_solve(state, GOAL, frontier=True),
+                 frontier_a_star_search(state, GOAL), a_star_search(state, GOAL, frontier=True)):
+        assert_valid_path(path, state, GOAL)
+        assert len(path) == length
+
+
+@pytest.mark.parametrize('state', [[[1, 2, 3], [4, 5, 6], [7, 0, 8]], [[1, 2, 3], [4, 5, 6], [0, 7, 8]]])
+def test_frontier_searches_solve_short_paths(state):
+    for solve in (frontier_bfs_solve, frontier_a_star_search):
+        path = solve(state, GOAL)
+        assert_valid_path(path, state, GOAL)
+        assert len(path) == len(bfs_solve(state, GOAL))
+    assert frontier_bfs_solve(GOAL, GOAL) == [GOAL]
+    assert frontier_a_star_search(GOAL, GOAL) == [GOAL]
+
+
+def test_frontier_searches_report_unsolvable():
+    state = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+    assert frontier_bfs_solve(state, GOAL) is None
+    assert frontier_a_star_search(state, GOAL) is None
+
+
+def test_frontier_bfs_keeps_only_the_layers():
+    # Đường kính 31 nước: BFS thường giữ toàn bộ 181440 trạng thái của lớp chẵn lẻ
+    state = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    stats = SearchStats()
+    frontier_bfs_solve(state, GOAL, stats=stats)
+    assert 0 < stats.peak_nodes < 181440 // 4
+    assert stats.iterations > 1
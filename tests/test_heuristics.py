@@ -0,0 +1,73 @@
+import random
+import pytest
+from models.puzzle_state import DEFAULT_BOARD, get_board
+from algorithms.distance_database import get_database
+from algorithms.heuristics import HEURISTICS, get_heuristic
+from utils.table_store import CACHE_ENV
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+GOAL_CODE = DEFAULT_BOARD.encode(GOAL)[0]
+
+
+@pytest.fixture(autouse=True)
+def table_dir(tmp_path_factory, monkeypatch):
+    """Keep tables built by the tests out of the user's cache"""
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path_factory.getbasetemp() / 'tables'))
+
+
+def random_codes(count, seed=0):
+    rng = random.Random(seed)
+    code, blank = GOAL_CODE, DEFAULT_BOARD.encode(GOAL)[1]
+    codes = []
+    for _ in range(count):
+        for _ in range(rng.randrange(1, 20)):
+            _, new_blank = rng.choice(DEFAULT_BOARD.transitions[blank])
+            code, blank = DEFAULT_BOARD.slide(code, blank, new_blank), new_blank
+        codes.append((code, blank))
+    return codes
+
+
+def test_reference_values():
+    state = [[8, 1, 3], [4, 0, 2], [7, 6, 5]]
+    code = DEFAULT_BOARD.encode(state)[0]
+    assert get_heuristic('misplaced', GOAL_CODE)(code) == 5
+    assert get_heuristic('manhattan', GOAL_CODE)(code) == 10
+    assert get_heuristic('linear_conflict', GOAL_CODE)(code) == 10
+    # 2 và 1 cùng ở hàng đích nhưng ngược thứ tự: một ô phải rời hàng
+    swapped = DEFAULT_BOARD.encode([[2, 1, 3], [4, 5, 6], [7, 8, 0]])[0]
+    assert get_heuristic('manhattan', GOAL_CODE)(swapped) == 2
+    assert get_heuristic('linear_conflict', GOAL_CODE)(swapped) == 4
+
+
+@pytest.mark.parametrize('name', sorted(HEURISTICS))
+def test_heuristic_is_admissible_and_zero_at_goal(name):
+    h = get_heuristic(name, GOAL_CODE)
+    database = get_database(GOAL)
+    assert h(GOAL_CODE) == 0
+    for code, blank in random_codes(200):
+        assert h(code) <= database.distance(code)
+        if h.consistent:
+            for _, new_blank in DEFAULT_BOARD.transitions[blank]:
+                assert abs(h(code) - h(DEFAULT_BOARD.slide(code, blank, new_blank))) <= 1
+
+
+def test_registry_caches_instances_and_rejects_unknown_names():
+    assert get_heuristic('manhattan', GOAL_CODE) is get_heuristic('manhattan', GOAL_CODE)
+    with pytest.raises(ValueError):
+        get_heuristic('euclidean', GOAL_CODE)
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (3, 4)])
+@pytest.mark.parametrize('name', ['misplaced', 'manhattan', 'linear_conflict', 'walking_distance'])
+def test_after_slide_matches_full_evaluation(shape, name):
+    board = get_board(*shape)
+    h = get_heuristic(name, board.goal_code(), board)
+    rng = random.Random(3)
+    code, blank = board.goal_code(), board.cells - 1
+    value = h(code)
+    for _ in range(300):
+        _, new_blank = rng.choice(board.transitions[blank])
+        next_code = board.slide(code, blank, new_blank)
+        value = h.after_slide(value, code, blank, new_blank, next_code)
+        assert value == h(next_code)
+        code, blank = next_code, new_blank
@@ -0,0 +1,114 @@
+import inspect
+import random
+import sys
+import pytest
+from models.puzzle_state import get_board
+from algorithms.informed_search import a_star_search, ida_star_moves, ida_star_search
+from algorithms.heuristics import get_heuristic
+from algorithms.uninformed_search import bfs_solve
+from algorithms.frontier_search import frontier_a_star_search
+from algorithms.bidirectional_search import bidirectional_a_star_search
+from algorithms.pattern_database import PatternDatabase, get_pattern_database
+from algorithms.search_stats import SearchStats
+from utils.table_store import CACHE_ENV
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.fixture(autouse=True)
+def table_dir(tmp_path_factory, monkeypatch):
+    """Keep pattern databases built by the tests out of the user's cache"""
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path_factory.getbasetemp() / 'tables'))
+
+
+def random_instances(count, seed=0):
+    board = get_board(3, 3)
+    rng = random.Random(seed)
+    instances = []
+    while len(instances) < count:
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        state = [tiles[0:3], tiles[3:6], tiles[6:9]]
+        if board.parity(board.encode(state)[0]) == board.parity(board.encode(GOAL)[0]):
+            instances.append(state)
+    return instances
+
+
+def assert_path(path, start, goal):
+    board = get_board(3, 3)
+    assert path[0] == start and path[-1] == goal
+    for state, next_state in zip(path, path[1:]):
+        code, blank = board.encode(state)
+        next_code, new_blank = board.encode(next_state)
+        assert any(nb == new_blank for _, nb in board.transitions[blank])
+        assert board.slide(code, blank, new_blank) == next_code
+
+
+@pytest.mark.parametrize('state', [
+    [[4, 6, 2], [3, 1, 0], [8, 7, 5]],
+    [[5, 2, 3], [7, 6, 8], [0, 4, 1]],
+    [[0, 5, 3], [7, 2, 8], [4, 6, 1]],
+] + random_instances(20))
+def test_additive_pdb_a_star_is_optimal(state):
+    path = a_star_search(state, GOAL, 'additive_pdb')
+    assert_path(path, state, GOAL)
+    assert len(path) == len(bfs_solve(state, GOAL))
+
+
+def test_closed_list_searches_reject_inconsistent_heuristic():
+    state = [[4, 6, 2], [3, 1, 0], [8, 7, 5]]
+    with pytest.raises(ValueError):
+        frontier_a_star_search(state, GOAL, 'additive_pdb')
+    with pytest.raises(ValueError):
+        bidirectional_a_star_search(state, GOAL, 'additive_pdb')
+
+
+def test_a_star_counts_reopened_nodes():
+    stats = SearchStats()
+    a_star_search([[4, 6, 2], [3, 1, 0], [8, 7, 5]], GOAL, 'additive_pdb', stats=stats)
+    assert stats.reexpanded > 0
+
+
+def test_a_star_accepts_float_unit_weight():
+    state = [[5, 2, 3], [7, 6, 8], [0, 4, 1]]
+    path = a_star_search(state, GOAL, 'manhattan', weight=1.0)
+    assert_path(path, state, GOAL)
+    assert len(path) == len(bfs_solve(state, GOAL))
+
+
+def test_pattern_database_rejects_patterns_too_large_to_build():
+    goal = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]
+    with pytest.raises(ValueError):
+        PatternDatabase.build(goal, range(1, 8))
+
+
+def test_additive_pdb_rejects_24_puzzle_before_building():
+    goal = [[5 * i + j + 1 for j in range(5)] for i in range(5)]
+    goal[4][4] = 0
+    with pytest.raises(ValueError):
+        get_pattern_database(goal)
+
+
+@pytest.mark.parametrize('state', random_instances(5, seed=1))
+def test_ida_star_is_optimal_with_and_without_fsm(state):
+    path = ida_star_search(state, GOAL, 'linear_conflict')
+    assert_path(path, state, GOAL)
+    assert len(path) == len(bfs_solve(state, GOAL))
+    board = get_board(3, 3)
+    code, blank = board.encode(state)
+    h = get_heuristic('linear_conflict', board.encode(GOAL)[0], board)
+    moves = ida_star_moves(code, blank, h.goal_code, h)
+    assert len(moves) == len(path) - 1
+
+
+def test_ida_star_is_not_limited_by_recursion_depth():
+    # Lời giải 31 nước, trong khi chỉ còn 25 khung đệ quy trống
+    state = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    h = get_heuristic('linear_conflict', get_board(3, 3).encode(GOAL)[0])
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 25)
+    try:
+        path = ida_star_search(state, GOAL, h)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert len(path) == 32
@@ -0,0 +1,68 @@
+import tracemalloc
+import pytest
+from algorithms.memory_bounded_search import rbfs_search, sma_star_search
+from algorithms.uninformed_search import bfs_solve
+from algorithms.search_stats import SearchStats
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.mark.parametrize('state', [
+    [[1, 5, 6], [0, 8, 4], [7, 2, 3]],
+    [[4, 0, 7], [3, 8, 5], [1, 2, 6]],
+    [[3, 8, 5], [7, 0, 4], [6, 2, 1]],
+])
+def test_rbfs_is_optimal(state):
+    path = rbfs_search(state, GOAL, 'linear_conflict')
+    assert len(path) == len(bfs_solve(state, GOAL))
+
+
+def test_rbfs_counts_every_reexpanded_node():
+    # misplaced, h(gốc) = 3. Gốc sinh down (f=4), left (f=4), up (f=5):
+    #   down: con duy nhất có f=5 > 4, bỏ với F=5
+    #   left: con tốt nhất f=5, con đó mở rộng thì các con f >= 6, bỏ với F=6
+    #   down lại tốt nhất (F=5): mở rộng lại down, rồi down-left-up-right tới đích
+    # Mở rộng: gốc, down, left, left-down, down (lần 2), 3 node trên đường tới đích
+    stats = SearchStats()
+    path = rbfs_search([[1, 2, 3], [4, 8, 0], [7, 6, 5]], GOAL, 'misplaced', stats=stats)
+    assert len(path) == 6
+    assert stats.expanded == 8
+    assert stats.reexpanded == 1
+
+
+@pytest.mark.parametrize('state', [
+    [[1, 5, 6], [0, 8, 4], [7, 2, 3]],
+    [[4, 0, 7], [3, 8, 5], [1, 2, 6]],
+])
+def test_rbfs_first_expansions_cover_the_solution_path(state):
+    stats = SearchStats()
+    path = rbfs_search(state, GOAL, 'manhattan', stats=stats)
+    assert len(path) == len(bfs_solve(state, GOAL))
+    # Mỗi node (trừ đích) trên đường đi được mở rộng lần đầu ít nhất một lần
+    assert len(path) - 1 <= stats.expanded - stats.reexpanded < stats.expanded
+
+
+def test_rbfs_without_backtracking_has_no_reexpansions():
+    stats = SearchStats()
+    rbfs_search([[1, 2, 3], [4, 5, 6], [0, 7, 8]], GOAL, 'manhattan', stats=stats)
+    assert stats.reexpanded == 0
+
+
+def test_sma_star_is_optimal_with_small_cap():
+    state = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    path = sma_star_search(state, GOAL, 'manhattan', max_nodes=40)
+    assert len(path) == len(bfs_solve(state, GOAL))
+
+
+def test_sma_star_memory_stays_bounded():
+    # Lời giải 25 nước không vừa 25 node: phải trả None thay vì tích phần tử cũ trong heap
+    state = [[1, 0, 8], [5, 4, 7], [3, 6, 2]]
+    tracemalloc.start()
+    try:
+        assert sma_star_search(state, GOAL, 'manhattan', max_nodes=25) is None
+        path = sma_star_search(state, GOAL, 'manhattan', max_nodes=30)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(path) == len(bfs_solve(state, GOAL))
+    assert peak < 256 << 10
@@ -0,0 +1,63 @@
+import random
+from models.node_pool import NodePool
+from models.puzzle_state import DEFAULT_BOARD
+from algorithms.informed_search import a_star_search
+from algorithms.uninformed_search import bfs_solve
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def reference_distance(state, goal):
+    """Plain BFS over tuples, independent of the packed encoding"""
+    start, target = tuple(sum(state, [])), tuple(sum(goal, []))
+    seen = {start}
+    layer = [start]
+    depth = 0
+    while layer:
+        if target in layer:
+            return depth
+        next_layer = []
+        for tiles in layer:
+            blank = tiles.index(0)
+            i, j = divmod(blank, 3)
+            for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                if 0 <= i + di < 3 and 0 <= j + dj < 3:
+                    cells = list(tiles)
+                    other = (i + di) * 3 + j + dj
+                    cells[blank], cells[other] = cells[other], 0
+                    cells = tuple(cells)
+                    if cells not in seen:
+                        seen.add(cells)
+                        next_layer.append(cells)
+        layer = next_layer
+        depth += 1
+    return None
+
+
+def test_pool_rebuilds_states_from_parent_indices():
+    pool = NodePool()
+    code, blank = DEFAULT_BOARD.encode([[1, 2, 3], [4, 5, 6], [0, 7, 8]])
+    root = pool.add(code, blank)
+    code = DEFAULT_BOARD.slide(code, blank, blank + 1)
+    child = pool.add(code, blank + 1, root, 3, 1)
+    pool.add(code, blank + 1, root, 3, 1)
+    grandchild = pool.add(DEFAULT_BOARD.slide(code, blank + 1, blank + 2), blank + 2, child, 3, 2)
+    assert len(pool) == 4
+    assert pool.get_states(grandchild) == [
+        [[1, 2, 3], [4, 5, 6], [0, 7, 8]],
+        [[1, 2, 3], [4, 5, 6], [7, 0, 8]],
+        GOAL,
+    ]
+
+
+def test_bfs_and_a_star_on_the_pool_are_optimal():
+    rng = random.Random(0)
+    code, blank = DEFAULT_BOARD.encode(GOAL)
+    for _ in range(5):
+        for _ in range(30):
+            _, new_blank = rng.choice(DEFAULT_BOARD.transitions[blank])
+            code, blank = DEFAULT_BOARD.slide(code, blank, new_blank), new_blank
+        state = DEFAULT_BOARD.decode(code)
+        distance = reference_distance(state, GOAL)
+        assert len(bfs_solve(state, GOAL)) - 1 == distance
+        assert len(a_star_search(state, GOAL)) - 1 == distance
@@ -0,0 +1,34 @@
+import pytest
+from algorithms.informed_search import a_star_search
+from algorithms.parallel_a_star import hda_star_search
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.mark.parametrize('state', [
+    [[8, 6, 7], [2, 5, 4], [3, 0, 1]],
+    [[4, 6, 2], [3, 1, 0], [8, 7, 5]],
+    [[1, 2, 3], [4, 5, 6], [0, 7, 8]],
+])
+def test_hda_star_matches_serial_a_star(state):
+    path = hda_star_search(state, GOAL, 'manhattan', workers=2)
+    assert path[0] == state and path[-1] == GOAL
+    assert len(path) == len(a_star_search(state, GOAL, 'manhattan'))
+
+
+def test_a_star_with_workers_is_optimal():
+    state = [[5, 2, 3], [7, 6, 8], [0, 4, 1]]
+    path = a_star_search(state, GOAL, 'linear_conflict', workers=2)
+    assert len(path) == len(a_star_search(state, GOAL, 'linear_conflict'))
+
+
+def test_hda_star_unsolvable():
+    assert hda_star_search([[2, 1, 3], [4, 5, 6], [7, 8, 0]], GOAL, workers=2) is None
+
+
+def test_parallel_a_star_rejects_weight_and_frontier():
+    state = [[5, 2, 3], [7, 6, 8], [0, 4, 1]]
+    with pytest.raises(ValueError):
+        a_star_search(state, GOAL, 'manhattan', weight=2, workers=2)
+    with pytest.raises(ValueError):
+        a_star_search(state, GOAL, 'manhattan', frontier=True, workers=2)
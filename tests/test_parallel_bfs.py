@@ -0,0 +1,41 @@
+import pytest
+from models.move_table import MoveTable
+from models.puzzle_state import DEFAULT_BOARD
+from models.ranking import STATE_COUNT
+from algorithms import parallel_bfs
+from algorithms.parallel_bfs import parallel_bfs_codes, parallel_bfs_layers
+from algorithms.uninformed_search import bfs_solve
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+HARD = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parallel_bfs_layers_cover_the_parity_class(workers):
+    goal_code = DEFAULT_BOARD.encode(GOAL)[0]
+    sizes = [len(ranks) for _, ranks in parallel_bfs_layers(goal_code, MoveTable(STATE_COUNT), workers)]
+    assert sum(sizes) == STATE_COUNT
+    # Cùng số lớp và kích thước lớp cuối như compact_bfs.bfs_layers
+    assert len(sizes) == 32
+    assert sizes[-1] == 2
+
+
+def test_parallel_bfs_matches_serial_bfs(monkeypatch):
+    # Lớp nhỏ cũng được chia cho pool
+    monkeypatch.setattr(parallel_bfs, 'SERIAL_LAYER', 1)
+    monkeypatch.setattr(parallel_bfs, 'CHUNK_SIZE', 1024)
+    start, goal = DEFAULT_BOARD.encode(HARD)[0], DEFAULT_BOARD.encode(GOAL)[0]
+    codes = parallel_bfs_codes(start, goal, workers=2)
+    assert codes[0] == start and codes[-1] == goal
+    assert len(codes) == 32
+
+    path = bfs_solve(HARD, GOAL, workers=2)
+    assert path[0] == HARD and path[-1] == GOAL
+    assert len(path) == len(bfs_solve(HARD, GOAL))
+
+
+def test_parallel_bfs_rejects_unsolvable_and_other_boards():
+    assert bfs_solve([[2, 1, 3], [4, 5, 6], [7, 8, 0]], GOAL, workers=2) is None
+    assert bfs_solve(GOAL, GOAL, workers=2) == [GOAL]
+    with pytest.raises(ValueError):
+        bfs_solve([[1, 2, 3], [4, 5, 0]], [[1, 2, 3], [0, 4, 5]], workers=2)
@@ -0,0 +1,51 @@
+import pytest
+from models.puzzle_state import get_board
+from models.pruning_fsm import REJECT, PruningFSM
+
+DEPTH = 6
+
+
+def accepted_codes(board, fsm, blank):
+    """Codes reached by every move sequence the FSM accepts, up to DEPTH moves"""
+    start = board.goal_code(blank)
+    reached = [start]
+    layer = [(start, blank, fsm.start(blank))]
+    for _ in range(DEPTH):
+        next_layer = []
+        for code, node_blank, state in layer:
+            for move, new_blank in board.transitions[node_blank]:
+                next_state = fsm.next(state, move)
+                if next_state == REJECT:
+                    continue
+                next_code = board.slide(code, node_blank, new_blank)
+                reached.append(next_code)
+                next_layer.append((next_code, new_blank, next_state))
+        layer = next_layer
+    return reached
+
+
+def reachable_codes(board, blank):
+    start = board.goal_code(blank)
+    seen = {start}
+    layer = [(start, blank)]
+    for _ in range(DEPTH):
+        next_layer = []
+        for code, node_blank in layer:
+            for _, new_blank in board.transitions[node_blank]:
+                next_code = board.slide(code, node_blank, new_blank)
+                if next_code not in seen:
+                    seen.add(next_code)
+                    next_layer.append((next_code, new_blank))
+        layer = next_layer
+    return seen
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (2, 4)])
+def test_fsm_accepts_exactly_one_sequence_per_state(shape):
+    board = get_board(*shape)
+    fsm = PruningFSM.build(DEPTH, board)
+    for blank in range(board.cells):
+        reached = accepted_codes(board, fsm, blank)
+        # Không chuỗi được chấp nhận nào tới lại một trạng thái đã tới, và không mất trạng thái nào
+        assert len(reached) == len(set(reached))
+        assert set(reached) == reachable_codes(board, blank)
@@ -0,0 +1,129 @@
+import random
+import pytest
+from models.puzzle_state import (DEFAULT_BOARD, PuzzleState, count_inversions, decode_state, encode_state,
+                                 get_board, slide)
+from algorithms.informed_search import a_star_search
+from algorithms.uninformed_search import bfs_solve
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def moved(state, direction):
+    """List-based reference: slide the blank one cell in direction"""
+    board = [row[:] for row in state]
+    i, j = next((i, j) for i, row in enumerate(board) for j, tile in enumerate(row) if tile == 0)
+    di, dj = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}[direction]
+    board[i][j], board[i + di][j + dj] = board[i + di][j + dj], board[i][j]
+    return board
+
+
+def test_encode_decode_round_trip():
+    rng = random.Random(0)
+    for _ in range(200):
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        state = [tiles[0:3], tiles[3:6], tiles[6:9]]
+        code, blank = encode_state(state)
+        assert decode_state(code) == state
+        assert tiles[blank] == 0
+
+
+def test_slide_matches_list_moves():
+    rng = random.Random(1)
+    state = GOAL
+    for _ in range(200):
+        code, blank = encode_state(state)
+        move, new_blank = rng.choice(DEFAULT_BOARD.transitions[blank])
+        direction = ('up', 'down', 'left', 'right')[move]
+        expected = moved(state, direction)
+        assert decode_state(slide(code, blank, new_blank)) == expected
+        assert decode_state(DEFAULT_BOARD.slide(code, blank, new_blank)) == expected
+        state = expected
+
+
+def test_puzzle_state_moves_and_path():
+    start = PuzzleState([[1, 2, 3], [4, 5, 6], [0, 7, 8]])
+    assert start.get_blank_position() == (2, 0)
+    right = next(move for move in start.get_valid_moves() if move[0] == 'right')
+    step = start.make_move(right)
+    step = step.make_move(next(move for move in step.get_valid_moves() if move[0] == 'right'))
+    assert step == PuzzleState(GOAL)
+    assert step.state == GOAL
+    assert step.get_path() == ['right', 'right']
+    assert step.depth == 2
+
+
+@pytest.mark.parametrize('shape', [(2, 3), (3, 4), (4, 4), (5, 5)])
+def test_board_encode_decode_round_trip(shape):
+    board = get_board(*shape)
+    rng = random.Random(2)
+    for _ in range(50):
+        tiles = list(range(board.cells))
+        rng.shuffle(tiles)
+        state = [tiles[i * board.cols:(i + 1) * board.cols] for i in range(board.rows)]
+        code, blank = board.encode(state)
+        assert board.decode(code) == state
+        assert board.find_blank(code) == blank and tiles[blank] == 0
+    assert board.decode(board.goal_code())[-1][-1] == 0
+
+
+def test_count_inversions_matches_brute_force():
+    rng = random.Random(3)
+    for size in (0, 1, 2, 7, 15, 24):
+        items = rng.sample(range(100), size)
+        expected = sum(1 for i in range(size) for j in range(i + 1, size) if items[i] > items[j])
+        assert count_inversions(items) == expected
+
+
+def test_2x3_parity_classes_and_diameter():
+    # BFS trên toàn bộ 6!/2 trạng thái cùng lớp chẵn lẻ với đích
+    board = get_board(2, 3)
+    goal = board.goal_code()
+    depths = {goal: 0}
+    layer = [(goal, board.find_blank(goal))]
+    while layer:
+        next_layer = []
+        for code, blank in layer:
+            for _, new_blank in board.transitions[blank]:
+                next_code = board.slide(code, blank, new_blank)
+                if next_code not in depths:
+                    depths[next_code] = depths[code] + 1
+                    next_layer.append((next_code, new_blank))
+        layer = next_layer
+    assert len(depths) == 360
+    assert all(board.parity(code) == board.parity(goal) for code in depths)
+    assert max(depths.values()) == board.diameter == 21
+    swapped = board.encode([[2, 1, 3], [4, 5, 0]])[0]
+    assert swapped not in depths and board.parity(swapped) != board.parity(goal)
+
+
+def test_depth_bound_adds_the_walk_to_a_corner():
+    board = get_board(3, 3)
+    assert board.depth_bound(8) == board.depth_bound(0) == 31
+    assert board.depth_bound(1) == 32
+    assert board.depth_bound(4) == 33
+    assert get_board(4, 3).depth_bound(11) == 53
+    assert get_board(5, 5).depth_bound(24) is None
+
+
+@pytest.mark.parametrize('shape', [(2, 3), (2, 4), (3, 4)])
+def test_solvers_handle_rectangular_boards(shape):
+    board = get_board(*shape)
+    goal = board.decode(board.goal_code())
+    rng = random.Random(4)
+    code, blank = board.goal_code(), board.cells - 1
+    for _ in range(40):
+        _, new_blank = rng.choice(board.transitions[blank])
+        code, blank = board.slide(code, blank, new_blank), new_blank
+    state = board.decode(code)
+    path = bfs_solve(state, goal)
+    assert path[0] == state and path[-1] == goal
+    assert len(a_star_search(state, goal)) == len(path)
+    assert len(a_star_search(state, goal, 'linear_conflict')) == len(path)
+
+
+def test_solvers_reject_boards_of_different_sizes():
+    with pytest.raises(ValueError):
+        bfs_solve(GOAL, [[1, 2, 3], [4, 5, 0]])
+    with pytest.raises(ValueError):
+        get_board(1, 4)
@@ -0,0 +1,35 @@
+import random
+from models.bitset import Bitset
+from models.puzzle_state import DEFAULT_BOARD
+from models.ranking import STATE_COUNT, StateSet, parity, rank, unrank
+
+
+def test_rank_unrank_round_trip():
+    rng = random.Random(0)
+    for _ in range(2000):
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        code, _ = DEFAULT_BOARD.encode([tiles[0:3], tiles[3:6], tiles[6:9]])
+        index = rank(code)
+        assert 0 <= index < STATE_COUNT
+        assert unrank(index, parity(code)) == code
+
+
+def test_unrank_stays_in_its_parity_class():
+    for tile_parity in (0, 1):
+        seen = Bitset(STATE_COUNT)
+        for index in range(0, STATE_COUNT, 7):
+            code = unrank(index, tile_parity)
+            assert parity(code) == tile_parity
+            assert rank(code) == index
+            assert not seen.test_and_set(index)
+
+
+def test_state_set_counts_new_codes_once():
+    codes = [unrank(index, 0) for index in (0, 1, 5000, STATE_COUNT - 1)]
+    visited = StateSet(codes[:2])
+    assert len(visited) == 2
+    assert codes[0] in visited and codes[2] not in visited
+    assert visited.add_new(codes[2])
+    assert not visited.add_new(codes[2])
+    assert len(visited) == 3
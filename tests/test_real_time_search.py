@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+from models.puzzle_state import get_board
+from algorithms import real_time_search
+from algorithms.real_time_search import lrta_star_search
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def test_lrta_star_reaches_goal():
+    moves = list(lrta_star_search([[1, 2, 3], [4, 0, 6], [7, 5, 8]], GOAL, use_cache=False))
+    assert moves[-1] == GOAL
+
+
+def test_lrta_star_step_stops_at_budget(monkeypatch):
+    # Đồng hồ giả: mỗi nước trượt khi nhìn trước tốn đúng một đơn vị thời gian
+    board = get_board(3, 3)
+    slide = board.slide
+    work = [0]
+
+    def counting_slide(code, blank, new_blank):
+        work[0] += 1
+        return slide(code, blank, new_blank)
+
+    monkeypatch.setattr(board, 'slide', counting_slide)
+    monkeypatch.setattr(real_time_search, 'time', SimpleNamespace(monotonic=lambda: work[0]))
+    budget = 200
+    steps = lrta_star_search([[8, 6, 7], [2, 5, 4], [3, 0, 1]], GOAL, lookahead=30,
+                             step_budget=budget, max_moves=5, use_cache=False)
+    start = work[0]
+    for _ in steps:
+        # Độ sâu đang chạy bị cắt ngay khi hết ngân sách, không chạy nốt cả lớp
+        assert budget <= work[0] - start <= budget + 8
+        start = work[0]
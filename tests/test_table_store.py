@@ -0,0 +1,35 @@
+import pytest
+from utils.table_store import TableFile, TableFormatError, load_table, save_table, table_path
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def write_table(directory):
+    path = table_path('test', GOAL, str(directory))
+    save_table(path, 'test', GOAL, {'values': (8, 5000, bytes(range(250)) * 20)})
+    return path
+
+
+def test_load_table_round_trip(tmp_path):
+    write_table(tmp_path)
+    table = load_table('test', GOAL, str(tmp_path))
+    assert bytes(table.sections['values']) == bytes(range(250)) * 20
+
+
+def test_load_table_rejects_corrupted_payload(tmp_path):
+    path = write_table(tmp_path)
+    with open(path, 'r+b') as f:
+        f.seek(-1, 2)
+        f.write(b'\xff')
+    with pytest.raises(TableFormatError):
+        load_table('test', GOAL, str(tmp_path))
+
+
+def test_load_table_skips_checksum_of_verified_file(tmp_path, monkeypatch):
+    write_table(tmp_path)
+
+    def fail(self):
+        raise AssertionError('checksum recomputed for a verified file')
+
+    monkeypatch.setattr(TableFile, 'verify', fail)
+    assert load_table('test', GOAL, str(tmp_path)) is not None
@@ -0,0 +1,39 @@
+import pytest
+from algorithms.uninformed_search import bfs_solve, iddfs_solve
+from algorithms.search_stats import SearchStats
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.mark.parametrize('state', [
+    [[1, 2, 3], [4, 0, 6], [7, 5, 8]],
+    [[4, 1, 3], [7, 2, 6], [0, 5, 8]],
+    [[1, 3, 6], [5, 0, 2], [4, 7, 8]],
+])
+def test_iddfs_is_optimal(state):
+    stats = SearchStats()
+    path = iddfs_solve(state, GOAL, stats=stats)
+    assert len(path) == len(bfs_solve(state, GOAL))
+    assert stats.verdict == 'solved'
+    assert stats.iterations == len(path) - 1
+
+
+def test_iddfs_reports_unsolvable_without_searching():
+    stats = SearchStats()
+    assert iddfs_solve([[2, 1, 3], [4, 5, 6], [7, 8, 0]], GOAL, stats=stats) is None
+    assert stats.verdict == 'unsolvable'
+    assert stats.expanded == 0
+
+
+def test_iddfs_stops_at_depth_cap():
+    state = [[4, 1, 3], [7, 2, 6], [0, 5, 8]]
+    stats = SearchStats()
+    assert iddfs_solve(state, GOAL, max_depth=len(bfs_solve(state, GOAL)) - 2, stats=stats) is None
+    assert stats.verdict == 'depth_limit'
+    assert stats.iterations == len(bfs_solve(state, GOAL)) - 2
+
+
+def test_iddfs_with_small_transposition_table_stays_optimal():
+    state = [[1, 3, 6], [5, 0, 2], [4, 7, 8]]
+    path = iddfs_solve(state, GOAL, table_size=4)
+    assert len(path) == len(bfs_solve(state, GOAL))
@@ -0,0 +1,71 @@
+import random
+import pytest
+from models.puzzle_state import count_inversions, get_board
+from utils.validators import is_solvable, is_valid_puzzle, solvable_batch
+
+
+def reachable_from(board, goal_state):
+    """Every code reachable from goal_state by sliding moves"""
+    start = board.encode(goal_state)
+    seen = {start[0]}
+    layer = [start]
+    while layer:
+        next_layer = []
+        for code, blank in layer:
+            for _, new_blank in board.transitions[blank]:
+                next_code = board.slide(code, blank, new_blank)
+                if next_code not in seen:
+                    seen.add(next_code)
+                    next_layer.append((next_code, new_blank))
+        layer = next_layer
+    return seen
+
+
+def random_board(board, rng):
+    tiles = list(range(board.cells))
+    rng.shuffle(tiles)
+    return [tiles[i * board.cols:(i + 1) * board.cols] for i in range(board.rows)]
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (2, 3), (3, 2), (2, 4)])
+def test_is_solvable_matches_reachability_for_custom_goals(shape):
+    board = get_board(*shape)
+    rng = random.Random(0)
+    for _ in range(3):
+        goal = random_board(board, rng)
+        reachable = reachable_from(board, goal)
+        states = [random_board(board, rng) for _ in range(40)]
+        expected = [board.encode(state)[0] in reachable for state in states]
+        assert [is_solvable(state, goal) for state in states] == expected
+        assert list(solvable_batch(states, goal)) == expected
+
+
+@pytest.mark.parametrize('shape', [(4, 4), (3, 4)])
+def test_is_solvable_on_larger_boards(shape):
+    board = get_board(*shape)
+    rng = random.Random(1)
+    goal = random_board(board, rng)
+    code, blank = board.encode(goal)
+    for _ in range(200):
+        _, new_blank = rng.choice(board.transitions[blank])
+        code, blank = board.slide(code, blank, new_blank), new_blank
+    state = board.decode(code)
+    assert is_solvable(state, goal)
+    # Đổi chỗ hai ô số đảo tính chẵn lẻ
+    (a, b) = [(i, j) for i in range(board.rows) for j in range(board.cols) if state[i][j]][:2]
+    state[a[0]][a[1]], state[b[0]][b[1]] = state[b[0]][b[1]], state[a[0]][a[1]]
+    assert not is_solvable(state, goal)
+
+
+def test_is_solvable_rejects_mismatched_goal():
+    assert not is_solvable([[1, 2], [3, 0]], [[1, 2, 3], [4, 5, 0]])
+    assert not is_valid_puzzle([[1, 2], [2, 0]])
+
+
+def test_count_inversions_matches_brute_force():
+    rng = random.Random(2)
+    for size in range(12):
+        values = list(range(size))
+        rng.shuffle(values)
+        brute = sum(values[i] > values[j] for i in range(size) for j in range(i + 1, size))
+        assert count_inversions(values) == brute
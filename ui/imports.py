@@ -9,7 +9,7 @@ from algorithms.uninformed_search import (
     bfs_solve, dfs_solve, ucs_solve, iddfs_solve
 )
 from algorithms.informed_search import (
-    greedy_best_first_search, a_star_search, ida_star_search
+    greedy_best_first_search, a_star_search, ida_star_search, anytime_a_star_search
 )
 from algorithms.local_search import (
     hill_climbing_simple, hill_climbing_steepest, stochastic_hill_climbing,
@@ -25,3 +25,12 @@ from algorithms.constraint_search import (
 from algorithms.reinforcement_learning import (
     q_learning
 )
+from algorithms.distance_database import database_solve
+from algorithms.memory_bounded_search import rbfs_search, sma_star_search
+from algorithms.real_time_search import lrta_star_search
+from algorithms.frontier_search import frontier_a_star_search, frontier_bfs_solve
+from algorithms.parallel_bfs import parallel_bfs_solve
+from algorithms.parallel_a_star import hda_star_search
+from algorithms.bidirectional_search import (
+    bidirectional_bfs_solve, bidirectional_a_star_search
+)
@@ -1,12 +1,14 @@
 import tkinter as tk
 from .imports import *
 import time
+import inspect
+import random
 from ui.partial_obs_visualizer import PartialObsVisualizerWindow
 from algorithms.uninformed_search import (
     bfs_solve, dfs_solve, ucs_solve, iddfs_solve
 )
 from algorithms.informed_search import (
-    greedy_best_first_search, a_star_search, ida_star_search
+    greedy_best_first_search, a_star_search, ida_star_search, anytime_a_star_search
 )
 from algorithms.local_search import (
     hill_climbing_simple, hill_climbing_steepest, stochastic_hill_climbing,
@@ -22,6 +24,24 @@ from algorithms.constraint_search import (
 from algorithms.reinforcement_learning import (
     q_learning
 )
+from algorithms.distance_database import database_solve
+from algorithms.bidirectional_search import (
+    bidirectional_bfs_solve, bidirectional_a_star_search
+)
+from algorithms.heuristics import DEFAULT_HEURISTIC, HEURISTICS
+from algorithms.cost_models import COST_MODELS, DEFAULT_COST_MODEL, solution_cost
+from algorithms.memory_bounded_search import rbfs_search, sma_star_search
+from algorithms.real_time_search import lrta_star_search
+from algorithms.frontier_search import frontier_a_star_search, frontier_bfs_solve
+from algorithms.parallel_bfs import parallel_bfs_solve
+from algorithms.parallel_a_star import hda_star_search
+from algorithms.search_stats import SearchStats
+from models.puzzle_state import get_board
+from utils.validators import is_solvable, is_valid_puzzle
+
+# Các kích thước bàn cờ (rows, cols) chọn được trên giao diện
+BOARD_SIZES = ((2, 3), (3, 3), (3, 4), (4, 4), (5, 5))
+
 
 class PuzzleSolverApp:
     def __init__(self, root):
@@ -41,6 +61,8 @@ class PuzzleSolverApp:
             [7, 8, 0]
         ]
         self.current_state = [row[:] for row in self.initial_state]
+        # Trạng thái mặc định của bàn 3x3, dùng lại khi chọn lại kích thước này
+        self.default_states = ([row[:] for row in self.initial_state], [row[:] for row in self.goal_state])
         
         # Trạng thái thuật toán
         self.solution = None
@@ -61,6 +83,11 @@ class PuzzleSolverApp:
         
         # Lịch sử thuật toán
         self.algorithm_history = []
+        self.search_stats = None
+        # Generator nước đi của các thuật toán thời gian thực (LRTA*)
+        self.solution_stream = None
+        # Tổng chi phí lời giải theo mô hình chi phí đã chọn (UCS)
+        self.solution_cost = None
         
         self.setup_ui()
 
@@ -194,6 +221,54 @@ class PuzzleSolverApp:
         )
         history_button.grid(row=0, column=3, padx=12, pady=0, sticky='w')
         add_tooltip(history_button, "Xem lịch sử chạy thuật toán")
+        
+        # Chọn heuristic cho các thuật toán có thông tin và tìm kiếm cục bộ
+        heuristic_label = tk.Label(
+            functions_frame, text="Heuristic", font=('Segoe UI', 11, 'bold'),
+            bg='#e3f2fd', fg='#1565c0'
+        )
+        heuristic_label.grid(row=0, column=4, padx=(24, 6), pady=0, sticky='e')
+        self.heuristic_names = {cls.label: name for name, cls in HEURISTICS.items()}
+        self.heuristic_var = tk.StringVar(value=HEURISTICS[DEFAULT_HEURISTIC].label)
+        heuristic_box = ttk.Combobox(
+            functions_frame, textvariable=self.heuristic_var,
+            values=list(self.heuristic_names), state='readonly', width=18,
+            font=('Segoe UI', 10)
+        )
+        heuristic_box.grid(row=0, column=5, padx=6, pady=0, sticky='w')
+        add_tooltip(heuristic_box, "Heuristic dùng cho Greedy, A*, IDA* và Local Search")
+        
+        # Chọn mô hình chi phí nước đi cho UCS
+        cost_label = tk.Label(
+            functions_frame, text="Move cost", font=('Segoe UI', 11, 'bold'),
+            bg='#e3f2fd', fg='#1565c0'
+        )
+        cost_label.grid(row=1, column=4, padx=(24, 6), pady=(8, 0), sticky='e')
+        self.cost_model_names = {cls.label: name for name, cls in COST_MODELS.items()}
+        self.cost_model_var = tk.StringVar(value=COST_MODELS[DEFAULT_COST_MODEL].label)
+        cost_box = ttk.Combobox(
+            functions_frame, textvariable=self.cost_model_var,
+            values=list(self.cost_model_names), state='readonly', width=18,
+            font=('Segoe UI', 10)
+        )
+        cost_box.grid(row=1, column=5, padx=6, pady=(8, 0), sticky='w')
+        add_tooltip(cost_box, "Chi phí mỗi nước đi cho UCS: đều nhau, theo giá trị ô hoặc theo hướng")
+        
+        # Chọn kích thước bàn cờ (rows x cols)
+        size_label = tk.Label(
+            functions_frame, text="Size", font=('Segoe UI', 11, 'bold'),
+            bg='#e3f2fd', fg='#1565c0'
+        )
+        size_label.grid(row=0, column=6, padx=(24, 6), pady=0, sticky='e')
+        self.size_var = tk.StringVar(value="3x3")
+        size_box = ttk.Combobox(
+            functions_frame, textvariable=self.size_var,
+            values=["%dx%d" % size for size in BOARD_SIZES], state='readonly', width=6,
+            font=('Segoe UI', 10)
+        )
+        size_box.grid(row=0, column=7, padx=6, pady=0, sticky='w')
+        size_box.bind('<<ComboboxSelected>>', self.change_board_size)
+        add_tooltip(size_box, "Kích thước bàn cờ; bàn khác 3x3 được xáo trộn ngẫu nhiên từ đích")
 
         # Khởi tạo nhóm thuật toán
         self.algorithm_groups = {
@@ -201,12 +276,23 @@ class PuzzleSolverApp:
                 'BFS': bfs_solve,
                 'DFS': dfs_solve,
                 'UCS': ucs_solve,
-                'IDDFS': iddfs_solve
+                'IDDFS': iddfs_solve,
+                'Bi-BFS': bidirectional_bfs_solve,
+                'Frontier BFS': frontier_bfs_solve,
+                'Parallel BFS': parallel_bfs_solve
             },
             "Informed Search": {
                 'Greedy': greedy_best_first_search,
                 'A*': a_star_search,
-                'IDA*': ida_star_search
+                'IDA*': ida_star_search,
+                'Bi-A*': bidirectional_a_star_search,
+                'Frontier A*': frontier_a_star_search,
+                'HDA*': hda_star_search,
+                'ARA*': anytime_a_star_search,
+                'SMA*': sma_star_search,
+                'RBFS': rbfs_search,
+                'LRTA*': lrta_star_search,
+                'Database': database_solve
             },
             "Local Search": {
                 'Hill Simple': hill_climbing_simple,
@@ -308,16 +394,34 @@ class PuzzleSolverApp:
         self.board_frame.grid_propagate(False)
 
         self.tiles = []
-        for i in range(3):
+        self.build_tiles()
+        # Thêm nhãn hiển thị hướng di chuyển bên dưới bảng
+        self.move_label = tk.Label(self.board_frame, text="", font=("Segoe UI", 14, "bold"), fg="#1976d2", bg="#e3f2fd")
+        self.move_label.grid(row=len(self.tiles), column=0, columnspan=len(self.tiles[0]), pady=(10, 0))
+
+    def build_tiles(self):
+        """Tạo lại các ô theo kích thước của trạng thái hiện tại"""
+        # Xóa các ô cũ và trọng số co giãn của chúng
+        for i, row in enumerate(self.tiles):
+            self.board_frame.rowconfigure(i, weight=0)
+            for j, label in enumerate(row):
+                self.board_frame.columnconfigure(j, weight=0)
+                label.destroy()
+
+        rows, cols = len(self.current_state), len(self.current_state[0])
+        # Thu nhỏ chữ để bảng lớn vẫn vừa khung 320x320
+        size = max(rows, cols)
+        self.tiles = []
+        for i in range(rows):
             row = []
-            for j in range(3):
-                val = self.initial_state[i][j]
+            for j in range(cols):
+                val = self.current_state[i][j]
                 label = tk.Label(
                     self.board_frame,
                     text=str(val) if val != 0 else "",
-                    font=("Helvetica", 32, "bold"),
-                    width=4,
-                    height=2,
+                    font=("Helvetica", 32 * 3 // size, "bold"),
+                    width=4 if size <= 3 else 3,
+                    height=2 if size <= 3 else 1,
                     bg="#ffffff" if val != 0 else "#f5f5f5",
                     fg="#37474f",
                     relief="raised",
@@ -328,12 +432,46 @@ class PuzzleSolverApp:
             self.tiles.append(row)
 
         # Cho phép co giãn
-        for i in range(3):
+        for i in range(rows):
             self.board_frame.rowconfigure(i, weight=1)
-            self.board_frame.columnconfigure(i, weight=1)
-        # Thêm nhãn hiển thị hướng di chuyển bên dưới bảng
-        self.move_label = tk.Label(self.board_frame, text="", font=("Segoe UI", 14, "bold"), fg="#1976d2", bg="#e3f2fd")
-        self.move_label.grid(row=3, column=0, columnspan=3, pady=(10, 0))
+        for j in range(cols):
+            self.board_frame.columnconfigure(j, weight=1)
+        if hasattr(self, 'move_label'):
+            self.move_label.grid(row=rows, column=0, columnspan=cols, pady=(10, 0))
+
+    def change_board_size(self, event=None):
+        """Đổi kích thước bàn cờ theo lựa chọn trong combobox Size"""
+        rows, cols = map(int, self.size_var.get().split('x'))
+        if (len(self.current_state), len(self.current_state[0])) == (rows, cols):
+            return
+        if self.is_animating:
+            self.size_var.set("%dx%d" % (len(self.current_state), len(self.current_state[0])))
+            messagebox.showwarning("Warning", "Hãy dừng animation trước khi đổi kích thước bàn cờ")
+            return
+
+        board = get_board(rows, cols)
+        if (rows, cols) == (3, 3):
+            initial_state, goal_state = self.default_states
+        else:
+            goal_state = board.decode(board.goal_code())
+            initial_state = self.scrambled_state(board, goal_state, 2 * board.cells)
+        self.initial_state = [row[:] for row in initial_state]
+        self.goal_state = [row[:] for row in goal_state]
+        self.current_state = [row[:] for row in self.initial_state]
+        self.root.title("%d-Puzzle Solver" % (board.cells - 1))
+        self.build_tiles()
+        self.reset_puzzle()
+
+    def scrambled_state(self, board, state, moves):
+        """Trạng thái giải được sau moves nước đi ngẫu nhiên (không quay lui) từ state"""
+        code, blank = board.encode(state)
+        previous = None
+        for _ in range(moves):
+            options = [new_blank for _, new_blank in board.transitions[blank] if new_blank != previous]
+            new_blank = random.choice(options)
+            code = board.slide(code, blank, new_blank)
+            previous, blank = blank, new_blank
+        return board.decode(code)
 
     def update_move_history_display(self, current_step=None):
         for lbl in getattr(self, 'move_history_labels', []):
@@ -400,8 +538,8 @@ class PuzzleSolverApp:
             direction, highlight_from, highlight_to = move
         elif isinstance(move, str):
             direction = move
-        for i in range(3):
-            for j in range(3):
+        for i in range(len(state)):
+            for j in range(len(state[0])):
                 val = state[i][j]
                 label = self.tiles[i][j]
                 bg = "#ffffff" if val != 0 else "#f5f5f5"
@@ -446,6 +584,8 @@ class PuzzleSolverApp:
 
     def animate_solution(self):
         """Animation lời giải"""
+        if self.step >= self.total_steps:
+            self.pull_stream_move()
         if self.step < self.total_steps and not self.stop_flag:
             # Cập nhật trạng thái
             self.current_state = self.solution[self.step+1]  # +1 vì bước 0 là initial
@@ -486,6 +626,9 @@ class PuzzleSolverApp:
         """Hoàn thành animation"""
         self.is_animating = False
         self.stop_flag = True
+        # Với lời giải dạng stream, số bước chỉ biết khi animation kết thúc
+        if self.algorithm_history and self.algorithm_history[-1]['algorithm'] == self.current_algorithm:
+            self.algorithm_history[-1]['steps'] = self.total_steps
         self.info_label.configure(
             text=f"{self.current_algorithm} completed\n"
                  f"Execution time: {self.execution_time:.5f}s\n"
@@ -622,9 +765,11 @@ class PuzzleSolverApp:
     def input_action(self):
         """Xử lý khi nhấn nút Input"""
         # Tạo cửa sổ mới
+        rows, cols = len(self.current_state), len(self.current_state[0])
+        cells = rows * cols
         input_window = tk.Toplevel(self.root)
         input_window.title("Nhập trạng thái Puzzle")
-        input_window.geometry("400x500")
+        input_window.geometry("%dx%d" % (400 + 60 * max(0, cols - 3), 500 + 50 * max(0, rows - 3)))
         input_window.resizable(False, False)
         
         # Tạo frame chính với padding
@@ -634,7 +779,7 @@ class PuzzleSolverApp:
         # Tiêu đề
         title_label = ttk.Label(
             main_frame,
-            text="Nhập trạng thái Puzzle 3x3",
+            text=f"Nhập trạng thái Puzzle {rows}x{cols}",
             font=('Arial', 14, 'bold')
         )
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
@@ -642,7 +787,7 @@ class PuzzleSolverApp:
         # Hướng dẫn
         instruction_text = (
             "Hướng dẫn:\n"
-            "• Nhập các số từ 0-8 vào ma trận\n"
+            f"• Nhập các số từ 0-{cells - 1} vào ma trận\n"
             "• Số 0 đại diện cho ô trống\n"
             "• Mỗi số chỉ được xuất hiện một lần"
         )
@@ -661,9 +806,9 @@ class PuzzleSolverApp:
         
         # Tạo các ô nhập liệu với style đẹp hơn
         entries = []
-        for i in range(3):
+        for i in range(rows):
             row_entries = []
-            for j in range(3):
+            for j in range(cols):
                 # Frame chứa ô nhập liệu
                 cell_frame = ttk.Frame(matrix_frame, padding="2")
                 cell_frame.grid(row=i, column=j, padx=2, pady=2)
@@ -684,7 +829,7 @@ class PuzzleSolverApp:
                     if P == "": return True
                     try:
                         num = int(P)
-                        return 0 <= num <= 8
+                        return 0 <= num < cells
                     except ValueError:
                         return False
                 
@@ -713,8 +858,8 @@ class PuzzleSolverApp:
                 
                 # Kiểm tra tính hợp lệ của ma trận
                 numbers = [x for row in matrix for x in row]
-                if sorted(numbers) != list(range(9)):
-                    raise ValueError("Ma trận phải chứa các số từ 0-8, mỗi số xuất hiện đúng một lần")
+                if sorted(numbers) != list(range(cells)):
+                    raise ValueError(f"Ma trận phải chứa các số từ 0-{cells - 1}, mỗi số xuất hiện đúng một lần")
                 
                 # Cập nhật trạng thái puzzle
                 self.current_state = matrix
@@ -829,17 +974,30 @@ class PuzzleSolverApp:
             'initial_state': [row[:] for row in self.current_state]
         }
         self.algorithm_history.append(history_entry)
+        # Thống kê tìm kiếm (nếu thuật toán có ghi)
+        stats_line = ""
+        if self.search_stats is not None and self.search_stats.summary():
+            stats_line = f"{self.search_stats.summary()}\n"
+        # Tổng chi phí theo mô hình chi phí (UCS)
+        if self.solution_cost is not None:
+            stats_line = f"Path cost: {self.solution_cost}\n{stats_line}"
+        # Lời giải dạng stream chưa biết trước tổng số bước
+        steps_text = "streaming" if self.solution_stream is not None else self.total_steps
         # Cập nhật thông tin
         self.info_label.configure(
             text=f"Algorithm: {algo_name}\n"
-                 f"Total steps: {self.total_steps}\n"
+                 f"Total steps: {steps_text}\n"
                  f"Time to find solution: {self.execution_time:.5f}s\n"
+                 f"{stats_line}"
                  f"Press Start to begin animation"
         )
 
     def handle_failed_solution(self, algo_name):
         """Xử lý khi không tìm thấy lời giải"""
-        self.info_label.configure(text=f"{algo_name}: No solution found!")
+        stats_line = ""
+        if self.search_stats is not None and self.search_stats.summary():
+            stats_line = f"\n{self.search_stats.summary()}"
+        self.info_label.configure(text=f"{algo_name}: No solution found!{stats_line}")
 
     def handle_algorithm_error(self, algo_name, error_msg):
         """Xử lý lỗi thuật toán"""
@@ -969,7 +1127,13 @@ class PuzzleSolverApp:
         elif algo_name == 'Non Observed':
             self.open_no_observation_window()
             return
-        elif algo_name == 'Backtracking':
+        elif algo_name == 'And-Or':
+            self.open_andor_tree_window()
+            return
+        # Kiểm tra trước khi chạy: loại ngay trạng thái không tới được đích
+        if not self.check_solvable(algo_name):
+            return
+        if algo_name == 'Backtracking':
             self.reset_algorithm_state()
             self.update_algorithm_buttons(algo_name)
             self.info_label.configure(text=f"Đang chạy {algo_name}...")
@@ -1003,9 +1167,6 @@ class PuzzleSolverApp:
             except Exception as e:
                 self.handle_algorithm_error(algo_name, str(e))
             return
-        elif algo_name == 'And-Or':
-            self.open_andor_tree_window()
-            return
         # Reset các trạng thái
         self.reset_algorithm_state()
         # Cập nhật UI
@@ -1016,7 +1177,20 @@ class PuzzleSolverApp:
         start_time = time.time()
         try:
             # Chạy thuật toán
-            result = algo_func(self.current_state, self.goal_state)
+            options = self.algorithm_options(algo_func)
+            self.search_stats = options.get('stats')
+            if inspect.isgeneratorfunction(algo_func):
+                # Thuật toán thời gian thực: animation lấy từng nước đi khi cần
+                self.solution_stream = algo_func(self.current_state, self.goal_state, **options)
+                self.solution = [[row[:] for row in self.current_state]]
+                self.pull_stream_move()
+                self.execution_time = time.time() - start_time
+                if len(self.solution) > 1:
+                    self.handle_successful_solution(algo_name)
+                else:
+                    self.handle_failed_solution(algo_name)
+                return
+            result = algo_func(self.current_state, self.goal_state, **options)
             # Kiểm tra nếu kết quả là tuple (như Q-Learning)
             if isinstance(result, tuple) and len(result) == 2:
                 self.solution = result[0] # Gán solution path cho self.solution
@@ -1026,6 +1200,8 @@ class PuzzleSolverApp:
                 self.episodes_run = None # Đảm bảo episodes_run là None cho các thuật toán khác
             # Tính thời gian thực thi
             self.execution_time = time.time() - start_time
+            if self.solution and 'cost_model' in options:
+                self.solution_cost = solution_cost(self.solution, options['cost_model'])
             if self.solution:
                 self.handle_successful_solution(algo_name)
             else:
@@ -1033,6 +1209,42 @@ class PuzzleSolverApp:
         except Exception as e:
             self.handle_algorithm_error(algo_name, str(e))
 
+    def check_solvable(self, algo_name):
+        """Kiểm tra tính chẵn lẻ so với đích; trả về False (và báo lỗi) nếu không giải được"""
+        if not is_valid_puzzle(self.current_state) or not is_valid_puzzle(self.goal_state):
+            self.handle_algorithm_error(algo_name, "Trạng thái puzzle không hợp lệ")
+            return False
+        if is_solvable(self.current_state, self.goal_state):
+            return True
+        self.reset_algorithm_state()
+        self.update_algorithm_buttons(algo_name)
+        self.search_stats = SearchStats()
+        self.search_stats.verdict = 'unsolvable'
+        self.handle_failed_solution(algo_name)
+        return False
+
+    def pull_stream_move(self):
+        """Lấy thêm một nước đi từ generator lời giải (nếu có)"""
+        if self.solution_stream is None:
+            return
+        try:
+            self.solution.append(next(self.solution_stream))
+        except StopIteration:
+            self.solution_stream = None
+        self.total_steps = len(self.solution) - 1
+
+    def algorithm_options(self, algo_func):
+        """Tham số tùy chọn (như heuristic) mà thuật toán nhận được"""
+        options = {}
+        parameters = inspect.signature(algo_func).parameters
+        if 'heuristic' in parameters:
+            options['heuristic'] = self.heuristic_names[self.heuristic_var.get()]
+        if 'cost_model' in parameters:
+            options['cost_model'] = self.cost_model_names[self.cost_model_var.get()]
+        if 'stats' in parameters:
+            options['stats'] = SearchStats()
+        return options
+
     def reset_algorithm_state(self):
         """Reset tất cả trạng thái liên quan đến thuật toán"""
         self.solution = None
@@ -1043,6 +1255,9 @@ class PuzzleSolverApp:
         self.animation_start_time = None
         self.animation_elapsed_time = 0
         self.episodes_run = None # Khởi tạo episodes_run
+        self.search_stats = None
+        self.solution_stream = None
+        self.solution_cost = None
 
     def update_algorithm_buttons(self, selected_algo):
         """Cập nhật trạng thái các nút thuật toán"""
@@ -1060,8 +1275,8 @@ class PuzzleSolverApp:
     def get_move_direction(self, prev, curr):
         """Trả về (L/R/U/D, from_pos, to_pos) cho bước di chuyển từ prev -> curr"""
         # Tìm vị trí 0 trong prev và curr
-        for i in range(3):
-            for j in range(3):
+        for i in range(len(prev)):
+            for j in range(len(prev[0])):
                 if prev[i][j] == 0:
                     prev_zero = (i, j)
                 if curr[i][j] == 0:
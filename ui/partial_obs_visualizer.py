@@ -189,7 +189,7 @@ class PartialObsVisualizerWindow:
         initial_obs = self.get_observation(initial_state)
         self.update_board(self.observation_board, initial_obs, True)
         from utils.validators import is_solvable
-        if not is_solvable(initial_state):
+        if not is_solvable(initial_state, goal_state):
             self.handle_search_error("Initial state is not solvable!")
             self.run_button.configure(state="normal")
             return
@@ -0,0 +1,198 @@
+"""
+Định dạng file nhị phân có phiên bản cho các bảng tính sẵn (distance database,
+pattern database, policy table) và thư mục cache theo trạng thái đích.
+
+Bố cục file (little-endian):
+
+    header    magic b'PZTB', version, rows, cols, kind (8 byte), số section
+    goal      rows * cols byte, giá trị từng ô của trạng thái đích
+    sections  mỗi section: name (8 byte), entry_bits, count, offset, size, crc32
+    payload   dữ liệu thô của các section, mỗi section căn lề 4096 byte
+
+File được mở bằng mmap chỉ đọc nên tiến trình chỉ chạm vào các trang thực sự
+được tra cứu, và nhiều tiến trình dùng chung page cache của hệ điều hành.
+
+crc32 được kiểm tra một lần cho mỗi phiên bản file (lúc lưu, hoặc lần nạp đầu
+tiên nếu file đến từ nơi khác) và kết quả được ghi vào file đánh dấu
+<tên file>.verified cùng kích thước và thời điểm sửa của file, nên các lần nạp
+sau, ở bất kỳ tiến trình nào, chỉ kiểm tra header.
+"""
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+MAGIC = b'PZTB'
+VERSION = 1
+PAGE_SIZE = 4096
+
+_HEADER = struct.Struct('<4sHBB8sH')
+_SECTION = struct.Struct('<8sB3xQQQI')
+
+CACHE_ENV = 'PUZZLE_TABLE_DIR'
+
+VERIFIED_SUFFIX = '.verified'
+
+
+class TableFormatError(ValueError):
+    """Raised when a table file is corrupt or does not match what was asked for"""
+
+
+def cache_dir():
+    """Directory holding cached tables ($PUZZLE_TABLE_DIR or ~/.cache/puzzle-tables)"""
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return path
+    return os.path.join(os.path.expanduser('~'), '.cache', 'puzzle-tables')
+
+
+def _goal_bytes(goal_state):
+    return bytes(tile for row in goal_state for tile in row)
+
+
+def table_path(kind, goal_state, directory=None):
+    """Cache path of a table, keyed by kind, board size and goal state"""
+    rows, cols = len(goal_state), len(goal_state[0])
+    name = '%s-%dx%d-%s.tbl' % (kind, rows, cols, _goal_bytes(goal_state).hex())
+    return os.path.join(directory or cache_dir(), name)
+
+
+def _write_atomic(path, data):
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _file_stamp(path):
+    info = os.stat(path)
+    return ('%d %d' % (info.st_size, info.st_mtime_ns)).encode('ascii')
+
+
+def _is_verified(path):
+    """True if the marker file records a passed check of path as it is now"""
+    try:
+        with open(path + VERIFIED_SUFFIX, 'rb') as f:
+            return f.read() == _file_stamp(path)
+    except OSError:
+        return False
+
+
+def _mark_verified(path):
+    try:
+        _write_atomic(path + VERIFIED_SUFFIX, _file_stamp(path))
+    except OSError:
+        pass
+
+
+def save_table(path, kind, goal_state, sections):
+    """Write sections {name: (entry_bits, count, buffer)} to path atomically
+
+    The written file is read back and checked once, and marked verified.
+    """
+    rows, cols = len(goal_state), len(goal_state[0])
+    goal = _goal_bytes(goal_state)
+
+    table_size = _HEADER.size + len(goal) + _SECTION.size * len(sections)
+    offset = -(-table_size // PAGE_SIZE) * PAGE_SIZE
+    entries = []
+    payloads = []
+    for name, (entry_bits, count, buffer) in sections.items():
+        data = memoryview(buffer).cast('B')
+        entries.append(_SECTION.pack(
+            name.encode('ascii'), entry_bits, count, offset, len(data), zlib.crc32(data)
+        ))
+        payloads.append((offset, data))
+        offset += -(-len(data) // PAGE_SIZE) * PAGE_SIZE
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, rows, cols, kind.encode('ascii'), len(sections)))
+            f.write(goal)
+            f.write(b''.join(entries))
+            for data_offset, data in payloads:
+                f.seek(data_offset)
+                f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    TableFile(path).verify()
+    _mark_verified(path)
+
+
+class TableFile:
+    """Read-only memory-mapped table file"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise TableFormatError('%s: file too short' % path)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        magic, version, rows, cols, kind, count = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise TableFormatError('%s: not a version %d table file' % (path, VERSION))
+        self.path = path
+        self.rows = rows
+        self.cols = cols
+        self.kind = kind.rstrip(b'\0').decode('ascii')
+
+        position = _HEADER.size
+        flat = list(view[position:position + rows * cols])
+        self.goal_state = [flat[i * cols:(i + 1) * cols] for i in range(rows)]
+        position += rows * cols
+
+        self.sections = {}
+        self._checksums = {}
+        for _ in range(count):
+            name, entry_bits, entries, offset, size, checksum = _SECTION.unpack_from(view, position)
+            position += _SECTION.size
+            if offset + size > len(view):
+                raise TableFormatError('%s: truncated section' % path)
+            name = name.rstrip(b'\0').decode('ascii')
+            self.sections[name] = view[offset:offset + size]
+            self._checksums[name] = (entry_bits, entries, checksum)
+
+    def entry_bits(self, name):
+        return self._checksums[name][0]
+
+    def entry_count(self, name):
+        return self._checksums[name][1]
+
+    def verify(self):
+        """Check every section against its crc32; reads the whole file"""
+        for name, data in self.sections.items():
+            if zlib.crc32(data) != self._checksums[name][2]:
+                raise TableFormatError('%s: checksum mismatch in section %r' % (self.path, name))
+
+
+def load_table(kind, goal_state, directory=None, verify=None):
+    """Open the cached table for kind and goal_state, or return None if absent
+
+    By default the checksums are verified only if no earlier check of this
+    version of the file was recorded (see save_table); verify=True checks on
+    every load and verify=False never does.
+    """
+    path = table_path(kind, goal_state, directory)
+    if not os.path.exists(path):
+        return None
+    table = TableFile(path)
+    if table.kind != kind or table.goal_state != [list(row) for row in goal_state]:
+        raise TableFormatError('%s: header does not match %s table for this goal' % (path, kind))
+    if verify or (verify is None and not _is_verified(path)):
+        table.verify()
+        _mark_verified(path)
+    return table
@@ -1,44 +1,82 @@
+from models.puzzle_state import board_of, count_inversions
+
+
 def is_valid_puzzle(state):
-    """Kiểm tra tính hợp lệ của trạng thái puzzle"""
-    if not state or len(state) != 3:
+    """Kiểm tra tính hợp lệ của trạng thái puzzle (bàn rows x cols bất kỳ, tối thiểu 2x2)"""
+    if not state or len(state) < 2 or not state[0] or len(state[0]) < 2:
         return False
-        
+
+    cols = len(state[0])
+    cells = len(state) * cols
     numbers = set()
     for row in state:
-        if len(row) != 3:
+        if len(row) != cols:
             return False
         for num in row:
-            if not isinstance(num, int) or num < 0 or num > 8:
+            if not isinstance(num, int) or num < 0 or num >= cells:
                 return False
             if num in numbers:
                 return False
             numbers.add(num)
-            
-    return len(numbers) == 9
 
-def is_solvable(state):
-    """Kiểm tra xem trạng thái có giải được không"""
+    return len(numbers) == cells
+
+def is_solvable(state, goal_state=None):
+    """Kiểm tra xem trạng thái có tới được goal_state không (mặc định đích 1..n-1, ô trống cuối)
+
+    Mỗi nước đi đổi chỗ ô trống với một ô kề: tính chẵn lẻ của hoán vị (so với
+    đích, tính cả ô trống) và của khoảng cách Manhattan từ ô trống tới ô đích
+    của nó cùng đổi. Ở đích cả hai bằng 0, nên trạng thái giải được khi và chỉ
+    khi tổng của chúng chẵn, với mọi đích và mọi độ rộng bàn cờ.
+    """
     if not is_valid_puzzle(state):
         return False
-        
-    # Chuyển ma trận thành mảng 1 chiều
-    flat_state = [num for row in state for num in row]
-    
-    # Đếm số nghịch thế
-    inversions = 0
-    for i in range(len(flat_state)):
-        for j in range(i + 1, len(flat_state)):
-            if flat_state[i] != 0 and flat_state[j] != 0 and flat_state[i] > flat_state[j]:
-                inversions += 1
-                
-    # Tìm vị trí của số 0
-    blank_row = 0
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                blank_row = i
-                break
-                
-    # Nếu kích thước lẻ, số nghịch thế phải chẵn
-    # Nếu kích thước chẵn, số nghịch thế + vị trí hàng của ô trống phải lẻ
-    return (inversions % 2 == 0) if (blank_row % 2 == 0) else (inversions % 2 == 1) 
\ No newline at end of file
+
+    board = board_of(state)
+    if goal_state is None:
+        goal_state = board.decode(board.goal_code())
+    elif not is_valid_puzzle(goal_state) or board_of(goal_state) is not board:
+        return False
+
+    cols = board.cols
+    # goal_positions[tile] -> ô của tile trong trạng thái đích
+    goal_positions = [0] * board.cells
+    for i, row in enumerate(goal_state):
+        for j, tile in enumerate(row):
+            goal_positions[tile] = i * cols + j
+
+    permutation = []
+    for i, row in enumerate(state):
+        for j, tile in enumerate(row):
+            permutation.append(goal_positions[tile])
+            if tile == 0:
+                blank_i, blank_j = i, j
+    goal_i, goal_j = divmod(goal_positions[0], cols)
+    displacement = abs(blank_i - goal_i) + abs(blank_j - goal_j)
+    return (count_inversions(permutation) + displacement) % 2 == 0
+
+def solvable_batch(states, goal_state):
+    """Vectorized is_solvable for many valid boards of the goal's size
+
+    states is any array-like of shape (count, rows, cols) or (count, cells);
+    returns a boolean numpy array. Inversions are counted by comparing all
+    cell pairs at once, which for boards up to 5x5 beats a per-board merge sort.
+    """
+    import numpy as np
+    goal = np.asarray(goal_state).reshape(-1)
+    cells = goal.size
+    cols = len(goal_state[0])
+    states = np.asarray(states).reshape(-1, cells)
+
+    goal_positions = np.empty(cells, dtype=np.int64)
+    goal_positions[goal] = np.arange(cells)
+    permutation = goal_positions[states]
+    first, second = np.triu_indices(cells, 1)
+    inversions = (permutation[:, first] > permutation[:, second]).sum(axis=1)
+
+    # Ô trống là giá trị nhỏ nhất của mỗi bàn
+    blanks = np.argmin(states, axis=1)
+    goal_blank = goal_positions[0]
+    displacement = (np.abs(blanks // cols - goal_blank // cols)
+                    + np.abs(blanks % cols - goal_blank % cols))
+    return (inversions + displacement) % 2 == 0